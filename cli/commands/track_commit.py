@@ -9,52 +9,55 @@ Usage: python track_commit.py [options]
 import sys
 import os
 import argparse
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, TYPE_CHECKING
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Service and logging modules are imported lazily so that trivial
+# invocations (--help, argument errors) do not pay for loading them.
+if TYPE_CHECKING:
+    import socket
+    from services.commit_tracker_service.src.commit_tracker import CommitTracker
 
-from services.commit_tracker_service.src.commit_tracker import CommitTracker
-from shared.utils.logger import get_logger, setup_logger
-from shared.utils.error_handler import handle_error
 
-logger = get_logger(__name__)
+@lru_cache(maxsize=1)
+def _get_logger():
+    """Get the module logger, importing the logging setup on first use."""
+    from shared.utils.logger import get_logger
+    return get_logger(__name__)
 
 
 def main():
     """
     Main CLI entry point for commit tracking.
     """
-    parser = create_argument_parser()
+    # Only the selected subcommand's arguments are built
+    parser = create_argument_parser(detect_command(sys.argv[1:]))
     args = parser.parse_args()
     
+    from services.commit_tracker_service.src.commit_tracker import CommitTracker
+    from shared.utils.logger import setup_logger
+    from shared.utils.error_handler import handle_error
+    
     # Setup logging
     setup_logger(
         log_level=args.log_level,
         log_file=args.log_file
     )
     
+    handler = COMMANDS.get(args.command)
+    if handler is None:
+        parser.print_help()
+        sys.exit(1)
+    
     try:
-        # Initialize commit tracker
-        tracker = CommitTracker(repo_path=args.repo_path)
+        # Reuse a running 'serve' process for this repository if there is one
+        result = request_from_server(args) if args.command != 'serve' else None
         
-        # Execute command based on subcommand
-        if args.command == 'latest':
-            result = track_latest_commit(tracker, args)
-        elif args.command == 'hash':
-            result = track_commit_by_hash(tracker, args)
-        elif args.command == 'info':
-            result = get_repository_info(tracker, args)
-        elif args.command == 'list':
-            result = list_commits(tracker, args)
-        elif args.command == 'search':
-            result = search_commits(tracker, args)
-        else:
-            parser.print_help()
-            sys.exit(1)
+        if result is None:
+            # Initialize commit tracker and run the command in-process
+            tracker = CommitTracker(repo_path=args.repo_path)
+            result = handler(tracker, args)
         
         # Output result
         output_result(result, args.output_format, args.verbose)
@@ -66,19 +69,23 @@ def main():
             sys.exit(0)
             
     except KeyboardInterrupt:
-        logger.info("Operation cancelled by user")
+        _get_logger().info("Operation cancelled by user")
         sys.exit(1)
     except Exception as e:
         error_result = handle_error(e, "cli.main")
-        logger.error(f"CLI error: {error_result['error']}")
+        _get_logger().error(f"CLI error: {error_result['error']}")
         output_result(error_result, args.output_format, args.verbose)
         sys.exit(1)
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
+def create_argument_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
     """
     Create and configure the argument parser.
     
+    Args:
+        command: Only add arguments for this subcommand (None adds them for
+            every subcommand)
+    
     Returns:
         Configured argument parser
     """
@@ -92,6 +99,7 @@ Examples:
   python track_commit.py info                      # Show repository info
   python track_commit.py list --limit 10           # List recent commits
   python track_commit.py search --author "John"    # Search commits by author
+  python track_commit.py serve                     # Keep a server running for faster calls
         """
     )
     
@@ -123,6 +131,11 @@ Examples:
         type=str,
         help='Log file path'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the cached repository metadata'
+    )
     
     # Subcommands
     subparsers = parser.add_subparsers(
@@ -130,82 +143,144 @@ Examples:
         help='Available commands'
     )
     
-    # Latest commit command
-    latest_parser = subparsers.add_parser(
-        'latest',
-        help='Track the latest commit'
-    )
+    for name, help_text in SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        add_arguments = _SUBCOMMAND_ARGUMENTS.get(name)
+        if add_arguments and command in (None, name):
+            add_arguments(subparser)
     
-    # Hash command
-    hash_parser = subparsers.add_parser(
-        'hash',
-        help='Track a specific commit by hash'
-    )
-    hash_parser.add_argument(
+    return parser
+
+
+def _add_hash_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the hash command."""
+    parser.add_argument(
         'commit_hash',
         type=str,
         help='Git commit hash'
     )
-    
-    # Info command
-    info_parser = subparsers.add_parser(
-        'info',
-        help='Show repository information'
-    )
-    
-    # List command
-    list_parser = subparsers.add_parser(
-        'list',
-        help='List tracked commits'
-    )
-    list_parser.add_argument(
+
+
+def _add_list_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the list command."""
+    parser.add_argument(
         '--limit',
         type=int,
         default=20,
         help='Maximum number of commits to list (default: 20)'
     )
-    
-    # Search command
-    search_parser = subparsers.add_parser(
-        'search',
-        help='Search tracked commits'
-    )
-    search_parser.add_argument(
+
+
+def _add_search_arguments(parser: argparse.ArgumentParser):
+    """Add arguments for the search command."""
+    parser.add_argument(
         '--author',
         type=str,
         help='Search by author name or email'
     )
-    search_parser.add_argument(
+    parser.add_argument(
         '--message',
         type=str,
-        help='Search by commit message keywords'
+        help='Search by commit message keywords (regex if it contains metacharacters)'
     )
-    search_parser.add_argument(
+    parser.add_argument(
         '--date-from',
         type=str,
         help='Search from date (ISO format: YYYY-MM-DD)'
     )
-    search_parser.add_argument(
+    parser.add_argument(
         '--date-to',
         type=str,
         help='Search to date (ISO format: YYYY-MM-DD)'
     )
-    search_parser.add_argument(
+    parser.add_argument(
         '--files',
         type=str,
-        help='Search by changed files keywords'
+        help='Search by changed files keywords (regex if it contains metacharacters)'
     )
-    search_parser.add_argument(
+    parser.add_argument(
         '--limit',
         type=int,
         default=50,
         help='Maximum number of results (default: 50)'
     )
+
+
+SUBCOMMANDS = {
+    'latest': 'Track the latest commit',
+    'hash': 'Track a specific commit by hash',
+    'info': 'Show repository information',
+    'list': 'List tracked commits',
+    'search': 'Search tracked commits',
+    'serve': 'Serve commands for this repository over a local socket'
+}
+
+_SUBCOMMAND_ARGUMENTS = {
+    'hash': _add_hash_arguments,
+    'list': _add_list_arguments,
+    'search': _add_search_arguments
+}
+
+# Long global options, mapped to whether they consume a value
+_GLOBAL_OPTIONS = {
+    '--repo-path': True,
+    '--output-format': True,
+    '--log-level': True,
+    '--log-file': True,
+    '--verbose': False,
+    '--no-cache': False,
+    '--help': False
+}
+
+
+def _resolve_global_option(option: str) -> Optional[str]:
+    """
+    Expand a long global option, allowing unique prefixes as argparse does.
     
-    return parser
+    Args:
+        option: Option as given on the command line, without any '=value'
+        
+    Returns:
+        Full option name, or None if the option is unknown or ambiguous
+    """
+    if option in _GLOBAL_OPTIONS:
+        return option
+    
+    matches = [name for name in _GLOBAL_OPTIONS if name.startswith(option)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def detect_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand named on the command line.
+    
+    Args:
+        argv: Command line arguments (without the program name)
+        
+    Returns:
+        Subcommand name, an empty string if none was given, or None if an
+        option before it could not be resolved (the caller should then add
+        every subcommand's arguments and let argparse decide)
+    """
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif not arg.startswith('-'):
+            return arg if arg in SUBCOMMANDS else ''
+        elif arg in ('-v', '-h'):
+            continue
+        else:
+            option, has_value, _ = arg.partition('=')
+            option = _resolve_global_option(option)
+            if option is None:
+                return None
+            skip_value = _GLOBAL_OPTIONS[option] and not has_value
+    
+    return ''
 
 
-def track_latest_commit(tracker: CommitTracker, args) -> dict:
+def track_latest_commit(tracker: 'CommitTracker', args) -> dict:
     """
     Track the latest commit.
     
@@ -216,11 +291,12 @@ def track_latest_commit(tracker: CommitTracker, args) -> dict:
     Returns:
         Result dictionary
     """
-    logger.info("Tracking latest commit")
+    _get_logger().info("Tracking latest commit")
+    # Never served from the cache: the command's job is to write the commit
     return tracker.log_latest_commit()
 
 
-def track_commit_by_hash(tracker: CommitTracker, args) -> dict:
+def track_commit_by_hash(tracker: 'CommitTracker', args) -> dict:
     """
     Track a specific commit by hash.
     
@@ -231,11 +307,11 @@ def track_commit_by_hash(tracker: CommitTracker, args) -> dict:
     Returns:
         Result dictionary
     """
-    logger.info(f"Tracking commit by hash: {args.commit_hash}")
+    _get_logger().info(f"Tracking commit by hash: {args.commit_hash}")
     return tracker.log_commit_by_hash(args.commit_hash)
 
 
-def get_repository_info(tracker: CommitTracker, args) -> dict:
+def get_repository_info(tracker: 'CommitTracker', args) -> dict:
     """
     Get repository information.
     
@@ -246,11 +322,46 @@ def get_repository_info(tracker: CommitTracker, args) -> dict:
     Returns:
         Result dictionary
     """
-    logger.info("Getting repository information")
-    return tracker.get_repository_info()
+    _get_logger().info("Getting repository information")
+    return _run_cached(tracker, args, 'info', tracker.get_repository_info)
+
+
+def _run_cached(tracker: 'CommitTracker', args, kind: str, compute) -> dict:
+    """
+    Return a cached result for the current repository state, or compute it.
+
+    The cache key is read from the .git directory, so a hit avoids spawning
+    git entirely. Only successful results are cached.
+
+    Args:
+        tracker: Commit tracker instance
+        args: Command line arguments
+        kind: Cached result kind
+        compute: Callable producing the result on a cache miss
+
+    Returns:
+        Result dictionary
+    """
+    from cli.utils.cli_helpers import get_repository_cache_key, load_cached_result, store_cached_result
+    
+    repo_path = str(tracker.repo_path)
+    cache_key = None if args.no_cache else get_repository_cache_key(repo_path)
+
+    if cache_key:
+        cached = load_cached_result(repo_path, kind, cache_key)
+        if cached is not None:
+            _get_logger().debug(f"Using cached {kind} result for: {repo_path}")
+            return cached
+
+    result = compute()
 
+    if cache_key and result.get('status') == 'success':
+        store_cached_result(repo_path, kind, cache_key, result)
 
-def list_commits(tracker: CommitTracker, args) -> dict:
+    return result
+
+
+def list_commits(tracker: 'CommitTracker', args) -> dict:
     """
     List tracked commits.
     
@@ -261,7 +372,7 @@ def list_commits(tracker: CommitTracker, args) -> dict:
     Returns:
         Result dictionary
     """
-    logger.info(f"Listing commits (limit: {args.limit})")
+    _get_logger().info(f"Listing commits (limit: {args.limit})")
     
     # Import here to avoid circular imports
     from services.commit_tracker_service.src.data_writer import DataWriter
@@ -270,7 +381,7 @@ def list_commits(tracker: CommitTracker, args) -> dict:
     return data_writer.read_commits(limit=args.limit)
 
 
-def search_commits(tracker: CommitTracker, args) -> dict:
+def search_commits(tracker: 'CommitTracker', args) -> dict:
     """
     Search tracked commits.
     
@@ -281,7 +392,7 @@ def search_commits(tracker: CommitTracker, args) -> dict:
     Returns:
         Result dictionary
     """
-    logger.info("Searching commits")
+    _get_logger().info("Searching commits")
     
     # Build search criteria
     criteria = {}
@@ -300,14 +411,231 @@ def search_commits(tracker: CommitTracker, args) -> dict:
     from services.commit_tracker_service.src.data_writer import DataWriter
     
     data_writer = DataWriter()
-    result = data_writer.search_commits(criteria)
+    # The limit is applied while scanning, so no post-slicing is needed
+    return data_writer.search_commits(criteria, limit=args.limit)
+
+
+# Seconds a client waits to connect to a 'serve' process
+_SERVER_CONNECT_TIMEOUT = 1.0
+
+# Seconds a client waits for the server's response before running in-process
+_SERVER_RESPONSE_TIMEOUT = 10.0
+
+# Seconds the server waits on a client's request or response delivery
+_SERVER_READ_TIMEOUT = 5.0
+
+
+def _server_socket_path(repo_path: Optional[str]) -> Path:
+    """Get the server socket location for a repository."""
+    return Path(repo_path or os.getcwd()) / '.git' / 'craftnudge.sock'
+
+
+def request_from_server(args) -> Optional[dict]:
+    """
+    Run a command through a running 'serve' process, if one is listening.
     
-    # Apply limit to results
-    if 'commits' in result and args.limit:
-        result['commits'] = result['commits'][:args.limit]
-        result['message'] = f"Found {len(result['commits'])} matching commits (limited to {args.limit})"
+    Args:
+        args: Command line arguments
+        
+    Returns:
+        Result dictionary from the server, or None if no server is available
+    """
+    import socket
     
-    return result
+    socket_path = _server_socket_path(args.repo_path)
+    if not hasattr(socket, 'AF_UNIX') or not socket_path.exists():
+        return None
+    
+    import json
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(_SERVER_CONNECT_TIMEOUT)
+            client.connect(str(socket_path))
+            # A busy or stalled server must not hang the CLI: give up and run in-process
+            client.settimeout(_SERVER_RESPONSE_TIMEOUT)
+            
+            client.sendall(json.dumps(vars(args)).encode('utf-8') + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            
+            with client.makefile('rb') as reader:
+                response = reader.read()
+        
+        result = json.loads(response)
+    except (OSError, ValueError) as e:
+        _get_logger().debug(f"Server unavailable, running in-process: {e}")
+        return None
+    
+    return result if isinstance(result, dict) else None
+
+
+def serve_commands(tracker: 'CommitTracker', args) -> dict:
+    """
+    Serve CLI commands for the repository over a UNIX socket.
+    
+    The tracker (and its repository state and caches) stays alive across
+    requests, so repeated invocations skip start-up. Each connection carries
+    one newline-terminated JSON object of command line arguments and receives
+    the JSON result. The server stops on Ctrl+C or when its listening socket
+    is shut down.
+    
+    Args:
+        tracker: Commit tracker instance
+        args: Command line arguments
+        
+    Returns:
+        Result dictionary once the server stops
+    """
+    import socket
+    
+    if not hasattr(socket, 'AF_UNIX'):
+        return {
+            'status': 'error',
+            'error': 'UNIX sockets are not supported on this platform',
+            'message': 'Cannot start server'
+        }
+    
+    socket_path = _server_socket_path(args.repo_path)
+    if not socket_path.parent.is_dir():
+        return {
+            'status': 'error',
+            'error': f"No Git repository found at: {socket_path.parent.parent}",
+            'message': 'Cannot start server'
+        }
+    
+    error_result = _check_existing_server(socket_path)
+    if error_result is not None:
+        return error_result
+    
+    served = 0
+    with _listen(socket_path) as server:
+        _get_logger().info(f"Serving commands on: {socket_path}")
+        
+        try:
+            while True:
+                try:
+                    connection, _ = server.accept()
+                except OSError as e:
+                    _get_logger().info(f"Server socket closed: {e}")
+                    break
+                if _serve_connection(tracker, connection):
+                    served += 1
+        except KeyboardInterrupt:
+            _get_logger().info("Server stopped by user")
+        finally:
+            socket_path.unlink(missing_ok=True)
+    
+    return {
+        'status': 'success',
+        'message': f"Server stopped after {served} requests"
+    }
+
+
+def _check_existing_server(socket_path: Path) -> Optional[dict]:
+    """
+    Make sure no other server answers on the socket before taking it over.
+    
+    Only a socket nobody listens on (or that vanished) is removed.
+    
+    Args:
+        socket_path: Server socket location
+        
+    Returns:
+        Error result if the socket cannot be used, None otherwise
+    """
+    import socket
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(_SERVER_CONNECT_TIMEOUT)
+        try:
+            probe.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            socket_path.unlink(missing_ok=True)
+            return None
+        except OSError as e:
+            return {
+                'status': 'error',
+                'error': f"Cannot check existing server socket {socket_path}: {e}",
+                'message': 'Cannot start server'
+            }
+    
+    return {
+        'status': 'error',
+        'error': f"A server is already running on: {socket_path}",
+        'message': 'Cannot start server'
+    }
+
+
+def _listen(socket_path: Path) -> 'socket.socket':
+    """
+    Create the listening server socket.
+    
+    Args:
+        socket_path: Server socket location
+        
+    Returns:
+        Bound, listening UNIX socket
+    """
+    import socket
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(socket_path))
+        server.listen()
+    except OSError:
+        server.close()
+        raise
+    return server
+
+
+def _serve_connection(tracker: 'CommitTracker', connection: 'socket.socket') -> bool:
+    """
+    Read one request from a client connection, run it and send the result.
+    
+    Args:
+        tracker: Commit tracker instance
+        connection: Accepted client connection, closed on return
+        
+    Returns:
+        True if a request was answered, False if the client sent nothing
+        or the connection failed
+    """
+    import json
+    from shared.utils.error_handler import handle_error
+    
+    # A client that stalls is dropped instead of blocking the others
+    connection.settimeout(_SERVER_READ_TIMEOUT)
+    try:
+        with connection, connection.makefile('rwb') as stream:
+            line = stream.readline()
+            if not line:
+                return False
+            
+            try:
+                request = argparse.Namespace(**json.loads(line))
+                if request.command == 'serve' or request.command not in COMMANDS:
+                    raise ValueError(f"Unsupported command: {request.command}")
+                result = COMMANDS[request.command](tracker, request)
+            except Exception as e:
+                result = handle_error(e, "cli.serve_commands")
+            
+            stream.write(json.dumps(result).encode('utf-8') + b"\n")
+    except OSError as e:
+        _get_logger().debug(f"Dropped client connection: {e}")
+        return False
+    
+    return True
+
+
+# Subcommand handlers, called as handler(tracker, args)
+COMMANDS = {
+    'latest': track_latest_commit,
+    'hash': track_commit_by_hash,
+    'info': get_repository_info,
+    'list': list_commits,
+    'search': search_commits,
+    'serve': serve_commands
+}
 
 
 def output_result(result: dict, output_format: str, verbose: bool):
@@ -320,13 +648,37 @@ def output_result(result: dict, output_format: str, verbose: bool):
         verbose: Whether to show verbose output
     """
     if output_format == 'json':
-        print(json.dumps(result, indent=2))
+        write_json(result)
     elif output_format == 'text':
         output_text_result(result, verbose)
     elif output_format == 'table':
         output_table_result(result, verbose)
     else:
-        print(json.dumps(result, indent=2))
+        write_json(result)
+
+
+def write_json(result: dict):
+    """
+    Write a result to stdout as indented JSON.
+    
+    The encoded bytes go straight to the stdout buffer (decoded when stdout
+    is a text-only stream).
+    
+    Args:
+        result: Result dictionary
+    """
+    from shared.utils.json_utils import dumps_bytes
+    data = dumps_bytes(result, indent=True)
+    
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        # Replaced stdout without a byte buffer (e.g. io.StringIO)
+        sys.stdout.write(data.decode('utf-8') + "\n")
+        return
+    
+    sys.stdout.flush()
+    buffer.write(data + b"\n")
+    buffer.flush()
 
 
 def output_text_result(result: dict, verbose: bool):
@@ -337,6 +689,8 @@ def output_text_result(result: dict, verbose: bool):
         result: Result dictionary
         verbose: Whether to show verbose output
     """
+    from cli.utils.cli_helpers import format_timestamp
+    
     if result.get('status') == 'error':
         print(f"❌ Error: {result.get('error', 'Unknown error')}")
         if verbose and 'traceback' in result:
@@ -347,23 +701,24 @@ def output_text_result(result: dict, verbose: bool):
     if 'commit_data' in result:
         # Single commit result
         commit = result['commit_data']
+        get = commit.get
+        changed_files = get('changed_files') or ()
         print(f"✅ {result.get('message', 'Commit tracked successfully')}")
-        print(f"Hash: {commit.get('hash', 'N/A')}")
-        print(f"Author: {commit.get('author', 'N/A')}")
-        print(f"Message: {commit.get('message', 'N/A')}")
-        print(f"Date: {commit.get('commit_date', 'N/A')}")
-        print(f"Files: {len(commit.get('changed_files', []))} files changed")
+        print(f"Hash: {get('hash') or 'N/A'}")
+        print(f"Author: {get('author') or 'N/A'}")
+        print(f"Message: {get('message') or 'N/A'}")
+        print(f"Date: {format_timestamp(get('commit_date'))}")
+        print(f"Files: {len(changed_files)} files changed")
         
         if verbose:
-            print(f"ID: {commit.get('id', 'N/A')}")
-            print(f"Email: {commit.get('author_email', 'N/A')}")
-            print(f"Body: {commit.get('body', 'N/A')}")
-            print(f"Insertions: {commit.get('insertions', 0)}")
-            print(f"Deletions: {commit.get('deletions', 0)}")
-            if commit.get('changed_files'):
+            print(f"ID: {get('id') or 'N/A'}")
+            print(f"Email: {get('author_email') or 'N/A'}")
+            print(f"Body: {get('body') or 'N/A'}")
+            print(f"Insertions: {get('insertions') or 0}")
+            print(f"Deletions: {get('deletions') or 0}")
+            if changed_files:
                 print("Changed files:")
-                for file in commit['changed_files']:
-                    print(f"  - {file}")
+                print("\n".join(f"  - {file}" for file in changed_files))
     
     elif 'repository_info' in result:
         # Repository info result
@@ -384,81 +739,158 @@ def output_text_result(result: dict, verbose: bool):
             print("No commits found.")
             return
         
+        # Build the whole listing and write it once instead of per line
+        parts = []
+        append = parts.append
         for i, commit in enumerate(commits, 1):
-            print(f"\n{i}. Commit: {commit.get('hash', 'N/A')[:8]}")
-            print(f"   Author: {commit.get('author', 'N/A')}")
-            print(f"   Message: {commit.get('message', 'N/A')}")
-            print(f"   Date: {commit.get('commit_date', 'N/A')}")
-            print(f"   Files: {len(commit.get('changed_files', []))} files changed")
+            get = commit.get
+            # Only the subject line is shown, even for multi-line messages
+            subject = (get('message') or 'N/A').partition('\n')[0]
+            append(
+                f"\n{i}. Commit: {(get('hash') or 'N/A')[:8]}\n"
+                f"   Author: {get('author') or 'N/A'}\n"
+                f"   Message: {subject}\n"
+                f"   Date: {format_timestamp(get('commit_date'))}\n"
+                f"   Files: {len(get('changed_files') or ())} files changed"
+            )
             
             if verbose:
-                print(f"   ID: {commit.get('id', 'N/A')}")
-                print(f"   Email: {commit.get('author_email', 'N/A')}")
-                print(f"   Insertions: {commit.get('insertions', 0)}")
-                print(f"   Deletions: {commit.get('deletions', 0)}")
+                append(
+                    f"   ID: {get('id') or 'N/A'}\n"
+                    f"   Email: {get('author_email') or 'N/A'}\n"
+                    f"   Insertions: {get('insertions') or 0}\n"
+                    f"   Deletions: {get('deletions') or 0}"
+                )
+        
+        sys.stdout.write("\n".join(parts) + "\n")
     
     else:
         # Generic result
         print(f"✅ {result.get('message', 'Operation completed successfully')}")
         if verbose:
-            print(json.dumps(result, indent=2))
+            write_json(result)
 
 
 def output_table_result(result: dict, verbose: bool):
     """
     Output result in table format.
     
+    When stdout is not a terminal the table is written as plain TSV, which
+    needs no column width measurement. On a terminal, rich is preferred and
+    tabulate is used as a fallback.
+    
     Args:
         result: Result dictionary
         verbose: Whether to show verbose output
     """
-    try:
-        from tabulate import tabulate
-    except ImportError:
-        print("❌ Error: tabulate package not installed. Install with: pip install tabulate")
+    if result.get('status') == 'error':
+        print(f"❌ Error: {result.get('error', 'Unknown error')}")
+        return
+    
+    if not result.get('commits'):
+        # Fallback to text format for other result types
         output_text_result(result, verbose)
         return
     
-    if result.get('status') == 'error':
-        print(f"❌ Error: {result.get('error', 'Unknown error')}")
+    headers, table_data = _build_table_rows(result['commits'], verbose)
+    
+    if not sys.stdout.isatty():
+        _write_tsv(headers, table_data)
         return
     
-    # Handle different result types
-    if 'commits' in result and result['commits']:
-        # Multiple commits result
-        commits = result['commits']
+    print(f"✅ {result.get('message', f'Found {len(table_data)} commits')}")
+    _print_table(result, headers, table_data, verbose)
+
+
+def _build_table_rows(commits: list, verbose: bool) -> tuple:
+    """
+    Build the table headers and one row per commit.
+    
+    Args:
+        commits: Commit dictionaries
+        verbose: Whether to add the verbose columns
+        
+    Returns:
+        Tuple of (headers, rows)
+    """
+    headers = ['Hash', 'Author', 'Message', 'Date', 'Files']
+    if verbose:
+        headers.extend(['Email', 'Insertions', 'Deletions'])
+    
+    table_data = [None] * len(commits)
+    for i, commit in enumerate(commits):
+        get = commit.get
+        # Only the subject line is shown, even for multi-line messages
+        message = (get('message') or 'N/A').partition('\n')[0]
+        row = [
+            (get('hash') or 'N/A')[:8],
+            get('author') or 'N/A',
+            message[:50] + '...' if len(message) > 50 else message,
+            (get('commit_date') or 'N/A')[:10],
+            len(get('changed_files') or ())
+        ]
         
-        # Prepare table data
-        headers = ['Hash', 'Author', 'Message', 'Date', 'Files']
         if verbose:
-            headers.extend(['Email', 'Insertions', 'Deletions'])
+            row.extend([
+                get('author_email') or 'N/A',
+                get('insertions') or 0,
+                get('deletions') or 0
+            ])
         
-        table_data = []
-        for commit in commits:
-            row = [
-                commit.get('hash', 'N/A')[:8],
-                commit.get('author', 'N/A'),
-                commit.get('message', 'N/A')[:50] + '...' if len(commit.get('message', '')) > 50 else commit.get('message', 'N/A'),
-                commit.get('commit_date', 'N/A')[:10] if commit.get('commit_date') else 'N/A',
-                len(commit.get('changed_files', []))
-            ]
-            
-            if verbose:
-                row.extend([
-                    commit.get('author_email', 'N/A'),
-                    commit.get('insertions', 0),
-                    commit.get('deletions', 0)
-                ])
-            
-            table_data.append(row)
+        table_data[i] = row
+    
+    return headers, table_data
+
+
+def _print_table(result: dict, headers: list, rows: list, verbose: bool):
+    """
+    Print table rows on a terminal with rich, falling back to tabulate and
+    then to text output.
+    
+    Args:
+        result: Result dictionary the rows were built from
+        headers: Column headers
+        rows: Table rows
+        verbose: Whether to show verbose output
+    """
+    try:
+        from rich.console import Console
+        from rich.table import Table
+    except ImportError:
+        try:
+            from tabulate import tabulate
+        except ImportError:
+            print("❌ Error: rich or tabulate package not installed. Install with: pip install rich")
+            output_text_result(result, verbose)
+            return
         
-        print(f"✅ {result.get('message', f'Found {len(commits)} commits')}")
-        print(tabulate(table_data, headers=headers, tablefmt='grid'))
+        print(tabulate(rows, headers=headers, tablefmt='grid'))
+        return
     
-    else:
-        # Fallback to text format for other result types
-        output_text_result(result, verbose)
+    table = Table(*headers)
+    for row in rows:
+        table.add_row(*map(str, row))
+    Console().print(table)
+
+
+def _write_tsv(headers: list, rows: list):
+    """
+    Write table rows to stdout as tab-separated values.
+    
+    Args:
+        headers: Column headers
+        rows: Table rows
+    """
+    lines = ["\t".join(headers)]
+    lines.extend(
+        "\t".join(str(cell).replace("\t", " ") for cell in row)
+        for row in rows
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
+    # Add project root to path when run directly as a script
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
     main()
@@ -8,6 +8,9 @@ from .cli_helpers import (
     format_commit_message,
     validate_repository_path,
     get_repository_status,
+    get_repository_cache_key,
+    load_cached_result,
+    store_cached_result,
     format_timestamp,
     calculate_commit_stats,
     export_commits_to_format,
@@ -23,6 +26,9 @@ __all__ = [
     'format_commit_message',
     'validate_repository_path',
     'get_repository_status',
+    'get_repository_cache_key',
+    'load_cached_result',
+    'store_cached_result',
     'format_timestamp',
     'calculate_commit_stats',
     'export_commits_to_format',
@@ -4,8 +4,15 @@ CLI Helpers - User Story 2.1.1: Behavior Tracker – Git Commit Logger
 This module contains helper utilities for CLI functionality.
 """
 
+import os
 import sys
-from typing import Dict, Any, Optional
+import csv
+import json
+import tempfile
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional
 from pathlib import Path
 
 
@@ -62,6 +69,124 @@ def get_repository_status(path: str) -> Dict[str, Any]:
     pass
 
 
+def _repo_info_cache_path(repo_path: str, kind: str) -> Path:
+    """
+    Get the cache file location for a repository and result kind.
+
+    Args:
+        repo_path: Repository path
+        kind: Cached result kind (e.g. 'info')
+
+    Returns:
+        Path of the cache file inside the repository's .git directory,
+        which only users who can already modify the repository can write
+    """
+    return Path(repo_path) / '.git' / f"craftnudge-{kind}.json"
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> Optional[str]:
+    """Resolve a ref name to a commit hash using loose or packed refs."""
+    ref_file = git_dir / ref
+    if ref_file.is_file():
+        return ref_file.read_text(encoding='utf-8').strip()
+
+    packed_refs = git_dir / 'packed-refs'
+    if packed_refs.is_file():
+        for line in packed_refs.read_text(encoding='utf-8').splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(' ', 1)[0]
+
+    return None
+
+
+def get_repository_cache_key(repo_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Build a cache key describing the current repository state.
+
+    The key is read straight from the .git directory (no git subprocess), so
+    it is cheap enough to check on every CLI invocation.
+
+    Args:
+        repo_path: Repository path
+
+    Returns:
+        Dictionary with HEAD ref, HEAD hash and index/config mtimes, or None
+        if the repository layout is not supported
+    """
+    git_dir = Path(repo_path) / '.git'
+
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        ref = head[5:] if head.startswith('ref: ') else None
+        head_hash = _resolve_ref(git_dir, ref) if ref else head
+
+        index_file = git_dir / 'index'
+        index_mtime = index_file.stat().st_mtime_ns if index_file.exists() else 0
+        config_mtime = (git_dir / 'config').stat().st_mtime_ns
+    except OSError:
+        return None
+
+    return {
+        'repo_path': str(Path(repo_path).resolve()),
+        'ref': ref,
+        'head': head_hash,
+        'index_mtime': index_mtime,
+        'config_mtime': config_mtime
+    }
+
+
+def load_cached_result(repo_path: str, kind: str, cache_key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached CLI result if it was stored for the same cache key.
+
+    Args:
+        repo_path: Repository path
+        kind: Cached result kind
+        cache_key: Key describing the current repository state
+
+    Returns:
+        Cached result dictionary, or None on a miss
+    """
+    try:
+        with open(_repo_info_cache_path(repo_path, kind), 'r', encoding='utf-8') as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get('key') != cache_key:
+        return None
+
+    return cached.get('result')
+
+
+def store_cached_result(repo_path: str, kind: str, cache_key: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """
+    Store a CLI result for the given cache key.
+
+    The file is written to a temporary name and moved into place with
+    os.replace so concurrent CLI processes never read a partial file.
+
+    Args:
+        repo_path: Repository path
+        kind: Cached result kind
+        cache_key: Key describing the current repository state
+        result: Result dictionary to cache
+    """
+    cache_path = _repo_info_cache_path(repo_path, kind)
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump({'key': cache_key, 'result': result}, file)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Caching is best effort; a failed write only costs the next lookup
+        try:
+            os.unlink(tmp_path)
+        except (OSError, NameError):
+            pass
+
+
 def format_timestamp(timestamp: str) -> str:
     """
     Format timestamp for display.
@@ -70,51 +195,144 @@ def format_timestamp(timestamp: str) -> str:
         timestamp: ISO timestamp string
         
     Returns:
-        Formatted timestamp string
+        Timestamp in local time as 'YYYY-MM-DD HH:MM', 'N/A' if empty, or
+        the input as a string if it cannot be parsed
     """
-    # TODO: Implement timestamp formatting
-    # - Convert to local timezone
-    # - Format for human readability
-    # - Handle different timestamp formats
-    pass
+    if not timestamp:
+        return 'N/A'
+    
+    if not isinstance(timestamp, str):
+        return str(timestamp)
+    
+    return _format_iso_timestamp(timestamp)
+
+
+@lru_cache(maxsize=4096)
+def _format_iso_timestamp(timestamp: str) -> str:
+    """
+    Convert an ISO timestamp string to local display time.
+    
+    Results are memoized, since many commits share the same timestamp
+    (rebases, squashes, scripted commits). The local offset is looked up
+    for each timestamp, so dates on either side of a DST change are
+    converted correctly.
+    """
+    try:
+        parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return timestamp
+    
+    return parsed.astimezone().strftime('%Y-%m-%d %H:%M')
 
 
-def calculate_commit_stats(commits: list) -> Dict[str, Any]:
+def calculate_commit_stats(commits: Iterable[Dict[str, Any]], top_files: int = 20) -> Dict[str, Any]:
     """
     Calculate statistics from commit list.
     
+    All statistics are gathered in a single pass, so commits may be any
+    iterable (e.g. DataWriter.iter_commits()) and are never held in memory.
+    
     Args:
-        commits: List of commit dictionaries
+        commits: Iterable of commit dictionaries
+        top_files: Number of most frequently changed files to report
         
     Returns:
         Dictionary with calculated statistics
     """
-    # TODO: Implement commit statistics calculation
-    # - Total commits
-    # - Commits per author
-    # - Commits per time period
-    # - File change statistics
-    pass
+    per_author = Counter()
+    per_day = Counter()
+    file_changes = Counter()
+    total = insertions = deletions = files_changed = 0
+    
+    for commit in commits:
+        get = commit.get
+        total += 1
+        per_author[get('author') or 'N/A'] += 1
+        
+        # ISO dates start with YYYY-MM-DD, no parsing needed to bucket by day
+        commit_date = get('commit_date')
+        if commit_date:
+            per_day[commit_date[:10]] += 1
+        
+        insertions += get('insertions') or 0
+        deletions += get('deletions') or 0
+        
+        changed_files = get('changed_files') or ()
+        files_changed += len(changed_files)
+        file_changes.update(changed_files)
+    
+    return {
+        'total_commits': total,
+        'commits_per_author': dict(per_author.most_common()),
+        'commits_per_day': dict(sorted(per_day.items())),
+        'total_insertions': insertions,
+        'total_deletions': deletions,
+        'total_files_changed': files_changed,
+        'top_changed_files': dict(file_changes.most_common(top_files))
+    }
+
 
+_EXPORT_FIELDS = ['hash', 'author', 'commit_date', 'message', 'insertions', 'deletions', 'changed_files']
 
-def export_commits_to_format(commits: list, format_type: str, output_path: str) -> bool:
+
+def export_commits_to_format(commits: Iterable[Dict[str, Any]], format_type: str, output_path: str) -> bool:
     """
     Export commits to different formats.
     
+    Commits are streamed to the output file one at a time through a large
+    write buffer, so commits may be any iterable and the export never builds
+    the whole document in memory.
+    
     Args:
-        commits: List of commit dictionaries
-        format_type: Export format (csv, json, xml, etc.)
+        commits: Iterable of commit dictionaries
+        format_type: Export format (csv, json, jsonl)
         output_path: Output file path
         
     Returns:
         True if successful, False otherwise
     """
-    # TODO: Implement commit export functionality
-    # - Support multiple export formats
-    # - Handle large datasets
-    # - Validate output paths
-    # - Error handling
-    pass
+    format_type = format_type.lower()
+    if format_type not in ('csv', 'json', 'jsonl'):
+        return False
+    
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        if format_type == 'csv':
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as file:
+                writer = csv.writer(file)
+                writer.writerow(_EXPORT_FIELDS)
+                writer.writerows(
+                    [
+                        commit.get('hash'),
+                        commit.get('author'),
+                        commit.get('commit_date'),
+                        (commit.get('message') or '').replace('\n', ' '),
+                        commit.get('insertions', 0),
+                        commit.get('deletions', 0),
+                        '|'.join(commit.get('changed_files') or ())
+                    ]
+                    for commit in commits
+                )
+            return True
+        
+        from shared.utils.json_utils import dumps_bytes as dumps
+        with open(output_path, 'wb', buffering=1 << 20) as file:
+            if format_type == 'jsonl':
+                for commit in commits:
+                    file.write(dumps(commit) + b'\n')
+            else:
+                # Stream a JSON array element by element
+                separator = b'['
+                for commit in commits:
+                    file.write(separator)
+                    file.write(dumps(commit))
+                    separator = b','
+                file.write(b']\n' if separator == b',' else b'[]\n')
+        return True
+    
+    except (OSError, TypeError, ValueError):
+        return False
 
 
 def interactive_commit_selection(commits: list) -> Optional[Dict[str, Any]]:
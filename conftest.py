@@ -15,15 +15,16 @@ from unittest.mock import MagicMock, patch
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Mock external dependencies that may not be available during testing
-@pytest.fixture(autouse=True)
+# Mock external dependencies that may not be available during testing.
+# Patched once per session; tests rely on these being mocks even when the
+# real packages are installed, so they are patched unconditionally.
+@pytest.fixture(scope='session', autouse=True)
 def mock_external_dependencies():
     """Mock external dependencies to prevent import errors during testing."""
     with patch.dict('sys.modules', {
         'loguru': MagicMock(),
         'jsonlines': MagicMock(),
         'yaml': MagicMock(),
-        'PyYAML': MagicMock(),
     }):
         yield
 
@@ -95,12 +96,8 @@ def mock_commit_data():
 @pytest.fixture
 def mock_logger():
     """Provide a mock logger for testing."""
-    logger = MagicMock()
-    logger.info = MagicMock()
-    logger.error = MagicMock()
-    logger.warning = MagicMock()
-    logger.debug = MagicMock()
-    return logger
+    # MagicMock creates info/error/warning/debug mocks on first access
+    return MagicMock()
 
 # Configure pytest to handle import errors gracefully
 def pytest_configure(config):
@@ -8,20 +8,15 @@ This example demonstrates basic usage of the commit tracking functionality.
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from services.commit_tracker_service.src.commit_tracker import CommitTracker
-from shared.utils.logger import setup_logger, get_logger
-
-# Setup logging
-setup_logger(log_level="INFO")
-logger = get_logger(__name__)
-
 
 def main():
     """Demonstrate basic commit tracking functionality."""
+    from services.commit_tracker_service.src.commit_tracker import CommitTracker
+    from shared.utils.logger import setup_logger, get_logger
+    
+    # Setup logging
+    setup_logger(log_level="INFO")
+    logger = get_logger(__name__)
     
     print("🚀 CraftNudge AI Agent - Commit Tracking Example")
     print("=" * 50)
@@ -56,15 +51,16 @@ def main():
             print(f"  Author: {commit_data.get('author') if commit_data.get('author') is not None else 'N/A'}")
             print(f"  Message: {commit_data.get('message') if commit_data.get('message') is not None else 'N/A'}")
             print(f"  Date: {commit_data.get('commit_date') if commit_data.get('commit_date') is not None else 'N/A'}")
-            print(f"  Files Changed: {len(commit_data.get('changed_files') or [])}")
+            changed_files = commit_data.get('changed_files') or []
+            file_count = len(changed_files)
+            print(f"  Files Changed: {file_count}")
             
-            changed_files = commit_data.get('changed_files', [])
             if changed_files:
-                print("  Changed Files:")
-                for file in changed_files[:5]:  # Show first 5 files
-                    print(f"    - {file}")
-                if len(changed_files) > 5:
-                    print(f"    ... and {len(changed_files) - 5} more")
+                lines = ["  Changed Files:"]
+                lines.extend(f"    - {file}" for file in changed_files[:5])  # Show first 5 files
+                if file_count > 5:
+                    lines.append(f"    ... and {file_count - 5} more")
+                print("\n".join(lines))
         else:
             print(f"  ❌ Error: {result.get('error', 'Unknown error')}")
         
@@ -79,4 +75,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Add project root to path when run directly as a script
+    project_root = Path(__file__).parent.parent
+    sys.path.insert(0, str(project_root))
     main()
@@ -9,22 +9,38 @@ by directly testing all source files without import conflicts.
 import os
 import sys
 import ast
+import dbm
+import functools
+import itertools
+import shelve
 import tempfile
 import yaml
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import DEFAULT, MagicMock, patch, mock_open
 import traceback
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Use the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader
+    HAS_LIBYAML = False
+
+# Print full tracebacks for failing tests only when VERBOSE=1 is set
+VERBOSE = os.environ.get('VERBOSE', '') not in ('', '0')
+
 # Test results tracking
 test_results = {
     "passed": 0,
     "failed": 0,
+    "skipped": 0,
     "total": 0,
     "coverage": {
         "files_tested": 0,
@@ -34,6 +50,193 @@ test_results = {
     }
 }
 
+# Raw source bytes and AST (None if not parsed yet) of every Python file in
+# the project, filled once on first use
+_FILE_CACHE = {}
+
+# PermissionError of every Python file the scan could not open
+_UNREADABLE = {}
+
+def _load_python_file(file_path, known_valid=frozenset()):
+    """
+    Read and parse one Python file, returning its SyntaxError instead of raising.
+    
+    The source is kept as bytes; ast.parse decodes it itself (honouring any
+    PEP 263 coding cookie), so there is no separate decode pass. Files whose
+    (path, mtime, size) key is in known_valid parsed cleanly on an earlier
+    run and are not parsed again; their tree is left as None and parsed on
+    demand by _parsed_tree().
+    
+    Returns:
+        (file_path, source, tree, key) where key is None for invalid files;
+        source is None and tree the PermissionError for unreadable files
+    """
+    # Unbuffered: FileIO.readall sizes its buffer from fstat and reads the
+    # file straight into the bytes object, with no BufferedReader copy
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            source = f.read()
+            stat = os.fstat(f.fileno())
+    except PermissionError as e:
+        return file_path, None, e, None
+    
+    key = f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    if key in known_valid:
+        return file_path, source, None, key
+    
+    try:
+        tree = ast.parse(source, filename=file_path)
+    except SyntaxError as e:
+        return file_path, source, e, None
+    return file_path, source, tree, key
+
+def _parse_cache_path():
+    """Location of the persistent cache of files known to parse cleanly."""
+    return str(project_root / '.coverage_parse_cache')
+
+def _load_parse_cache():
+    """Load the keys of files that parsed cleanly on previous runs."""
+    try:
+        with shelve.open(_parse_cache_path(), flag='r') as cache:
+            return frozenset(cache.keys())
+    except dbm.error:
+        return frozenset()
+
+def _store_parse_cache(valid_keys):
+    """Persist the keys of files that parse cleanly, dropping stale entries."""
+    try:
+        with shelve.open(_parse_cache_path(), flag='n') as cache:
+            for key in valid_keys:
+                cache[key] = True
+    except dbm.error:
+        pass  # The cache is only an optimization
+
+# Directories that never contain project sources
+_SKIP_DIRS = {'.git', '__pycache__', '.venv', 'venv', 'node_modules', '.pytest_cache'}
+
+def _iter_py_files(root):
+    """Yield paths of all .py files under root using os.scandir's cached entry types."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+@functools.cache
+def all_py_files():
+    """Get every project .py file path; the directory walk runs once per process."""
+    return tuple(_iter_py_files(str(project_root)))
+
+def _scan_python_files():
+    """Walk the project once, reading and parsing each Python file exactly once."""
+    if not _FILE_CACHE:
+        python_files = all_py_files()
+        known_valid = _load_parse_cache()
+        valid_keys = set()
+        
+        # Reads are independent, so overlap them across a thread pool
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+            results = executor.map(_load_python_file, python_files, itertools.repeat(known_valid))
+            for file_path, source, tree, key in results:
+                if source is None:
+                    _UNREADABLE[file_path] = tree
+                    continue
+                _FILE_CACHE[file_path] = (source, tree)
+                if key:
+                    valid_keys.add(key)
+        
+        if valid_keys != known_valid:
+            _store_parse_cache(valid_keys)
+    return _FILE_CACHE
+
+def _parsed_tree(file_path):
+    """Get the AST of a scanned file, parsing it now if the parse cache skipped it."""
+    source, tree = _FILE_CACHE[file_path]
+    if tree is None:
+        tree = ast.parse(source, filename=file_path)
+        _FILE_CACHE[file_path] = (source, tree)
+    return tree
+
+def _project_file(file_path):
+    """Get the _FILE_CACHE key for a project-relative path such as 'shared/utils/logger.py'."""
+    return os.path.join(str(project_root), *file_path.split('/'))
+
+def _defined_names(file_path):
+    """
+    Collect function, class and import names of a project file from its cached AST.
+    
+    Imports are recorded as 'module' for 'import module' and 'module.name'
+    for 'from module import name'.
+    """
+    _scan_python_files()
+    tree = _parsed_tree(_project_file(file_path))
+    functions, classes, imports = set(), set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.add(node.name)
+        elif isinstance(node, ast.ClassDef):
+            classes.add(node.name)
+        elif isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return functions, classes, imports
+
+# Byte strings that must appear in the main track_commit.py entry point,
+# listed in the order they occur in the source
+TRACK_COMMIT_MARKERS = (
+    b'"""',
+    b'import sys',
+    b'from pathlib import Path',
+    b'from cli.commands.track_commit import main',
+    b'if __name__ == "__main__":',
+)
+
+def _find_in_order(raw, markers):
+    """
+    Scan raw bytes for markers expected in source order.
+    
+    Each search starts where the previous marker ended, so the file is
+    walked roughly once instead of once per marker.
+    
+    Returns:
+        List of markers that were not found after the preceding one
+    """
+    missing = []
+    pos = 0
+    for marker in markers:
+        idx = raw.find(marker, pos)
+        if idx == -1:
+            missing.append(marker)
+        else:
+            pos = idx + len(marker)
+    return missing
+
+def _long_lines(raw, limit):
+    """
+    Find lines longer than limit characters in raw source bytes.
+    
+    Line byte lengths are measured with C-level split/len; a line can only
+    exceed limit characters if it exceeds limit bytes, so only those few
+    candidates are decoded to count characters.
+    """
+    lines = raw.split(b'\n')
+    if max(map(len, lines)) <= limit:
+        return []
+    
+    long_lines = []
+    for i, line in enumerate(lines, 1):
+        if len(line) > limit:
+            length = len(line.decode('utf-8', errors='replace'))
+            if length > limit:
+                long_lines.append((i, length))
+    return long_lines
+
 def run_test(test_name, test_func):
     """Run a single test and track results."""
     test_results["total"] += 1
@@ -46,7 +249,7 @@ def run_test(test_name, test_func):
         test_results["failed"] += 1
         print(f"❌ FAIL: {test_name}")
         print(f"   Error: {e}")
-        if hasattr(e, '__traceback__'):
+        if VERBOSE:
             traceback.print_exc()
         return False
 
@@ -65,242 +268,116 @@ def test_source_file_analysis():
         "__init__.py"
     ]
     
-    for file_path in expected_files:
-        full_path = project_root / file_path
-        assert full_path.exists(), f"File {file_path} does not exist"
-        assert full_path.suffix == ".py", f"File {file_path} is not a Python file"
-        test_results["coverage"]["files_tested"] += 1
-
-    # Test that all Python files have valid syntax
-    python_files = []
-    for root, dirs, files in os.walk(project_root):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = Path(root) / file
-                python_files.append(file_path)
+    # One pass over the scanned files checks existence and syntax together
+    expected = {_project_file(file_path): file_path for file_path in expected_files}
+    syntax_errors = []
+    for file_path, (raw, tree) in _scan_python_files().items():
+        expected.pop(file_path, None)
+        if isinstance(tree, SyntaxError):
+            syntax_errors.append(f"Syntax error in {file_path}: {tree}")
     
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            ast.parse(source)
-        except SyntaxError as e:
-            raise AssertionError(f"Syntax error in {file_path}: {e}")
-
-    # Test that files have docstrings
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-            tree = ast.parse(source)
-            
-            # Check for module docstring
-            if tree.body and isinstance(tree.body[0], ast.Expr):
-                if isinstance(tree.body[0].value, ast.Constant):
-                    docstring = tree.body[0].value.value
-                    if isinstance(docstring, str) and len(docstring.strip()) > 0:
-                        pass  # Has docstring
-        except Exception as e:
-            # Some files might not have docstrings, that's okay
-            pass
+    assert not expected, f"Missing files: {sorted(expected.values())}"
+    test_results["coverage"]["files_tested"] += len(expected_files)
+    
+    # Report every syntax error at once
+    if syntax_errors:
+        raise AssertionError("\n".join(syntax_errors))
 
 def test_track_commit_file():
     """Test the main track_commit.py file."""
-    file_path = project_root / "track_commit.py"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    raw, tree = _scan_python_files()[_project_file("track_commit.py")]
     
     # Check for shebang
-    assert content.startswith('#!/usr/bin/env python3')
-    
-    # Check for docstring
-    assert '"""' in content
+    assert raw.startswith(b'#!/usr/bin/env python3')
     
-    # Check for main function call
-    assert 'from cli.commands.track_commit import main' in content
-    
-    # Check for if __name__ == "__main__" block
-    assert 'if __name__ == "__main__":' in content
-    
-    # Check for required imports
-    assert 'import sys' in content
-    assert 'from pathlib import Path' in content
+    # Check for docstring, main import, __main__ block and required imports
+    missing = _find_in_order(raw, TRACK_COMMIT_MARKERS)
+    assert not missing, f"Missing or out of order in track_commit.py: {missing}"
 
 def test_config_manager():
     """Test the config manager functionality."""
-    file_path = project_root / "shared" / "config" / "config_manager.py"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    functions, classes, imports = _defined_names("shared/config/config_manager.py")
     
     # Check for required functions
     required_functions = [
-        'def get_config(',
-        'def get_config_value(',
-        'def reload_config(',
-        'def update_config(',
-        'def create_default_config(',
-        'def load_config_file(',
-        'def validate_config(',
-        'def deep_merge('
+        'get_config',
+        'get_config_value',
+        'reload_config',
+        'update_config',
+        'create_default_config',
+        'load_config_file',
+        'validate_config',
+        'deep_merge'
     ]
     
+    functions_tested = 0
     for func in required_functions:
-        assert func in content, f"Missing function: {func}"
-        test_results["coverage"]["functions_tested"] += 1
+        assert func in functions, f"Missing function: {func}"
+        functions_tested += 1
+    test_results["coverage"]["functions_tested"] += functions_tested
     
     # Check for required imports
-    assert 'import yaml' in content
-    assert 'import logging' in content
-    assert 'from pathlib import Path' in content
-    assert 'from typing import Dict, Any, Optional' in content
-    
-    # Test functions with mocks
-    with patch('shared.config.config_manager.yaml') as mock_yaml:
-        with patch('shared.config.config_manager.logging') as mock_logging:
-            with patch('shared.config.config_manager.Path') as mock_path:
-                # Mock the functions
-                mock_get_config = MagicMock()
-                mock_get_config_value = MagicMock()
-                mock_reload_config = MagicMock()
-                mock_update_config = MagicMock()
-                mock_create_default_config = MagicMock()
-                mock_load_config_file = MagicMock()
-                mock_validate_config = MagicMock()
-                mock_deep_merge = MagicMock()
-                
-                # Test function calls
-                mock_get_config.return_value = {"test": "config"}
-                mock_get_config_value.return_value = "test_value"
-                mock_reload_config.return_value = None
-                mock_update_config.return_value = {"updated": "config"}
-                mock_create_default_config.return_value = {"default": "config"}
-                mock_load_config_file.return_value = {"loaded": "config"}
-                mock_validate_config.return_value = None
-                mock_deep_merge.return_value = {"merged": "config"}
-                
-                # Verify function calls work
-                assert mock_get_config() == {"test": "config"}
-                assert mock_get_config_value() == "test_value"
-                assert mock_reload_config() is None
-                assert mock_update_config() == {"updated": "config"}
-                assert mock_create_default_config() == {"default": "config"}
-                assert mock_load_config_file() == {"loaded": "config"}
-                assert mock_validate_config() is None
-                assert mock_deep_merge() == {"merged": "config"}
+    assert 'yaml' in imports
+    assert 'logging' in imports
+    assert 'pathlib.Path' in imports
+    assert {'typing.Dict', 'typing.Any', 'typing.Optional'} <= imports
 
 def test_logger():
     """Test the logger functionality."""
-    file_path = project_root / "shared" / "utils" / "logger.py"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    functions, classes, imports = _defined_names("shared/utils/logger.py")
     
     # Check for required functions and classes
-    assert 'def setup_logger(' in content
-    assert 'def get_logger(' in content
-    assert 'class InterceptHandler(' in content
+    assert 'setup_logger' in functions
+    assert 'get_logger' in functions
+    assert 'InterceptHandler' in classes
     
     test_results["coverage"]["functions_tested"] += 2
     test_results["coverage"]["classes_tested"] += 1
     
     # Check for required imports
-    assert 'import logging' in content
-    assert 'from pathlib import Path' in content
-    assert 'from loguru import logger' in content
-    
-    # Test functions with mocks
-    with patch('shared.utils.logger.logger') as mock_logger:
-        with patch('shared.utils.logger.logging') as mock_logging:
-            # Mock the functions
-            mock_setup_logger = MagicMock()
-            mock_get_logger = MagicMock()
-            mock_intercept_handler = MagicMock()
-            
-            # Test function calls
-            mock_setup_logger.return_value = None
-            mock_get_logger.return_value = mock_logger
-            mock_intercept_handler.return_value = MagicMock()
-            
-            # Verify function calls work
-            assert mock_setup_logger() is None
-            assert mock_get_logger() == mock_logger
-            assert mock_intercept_handler() is not None
+    assert 'logging' in imports
+    assert 'pathlib.Path' in imports
+    assert 'loguru.logger' in imports
 
 def test_error_handler():
     """Test the error handler functionality."""
-    file_path = project_root / "shared" / "utils" / "error_handler.py"
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    functions, classes, imports = _defined_names("shared/utils/error_handler.py")
     
     # Check for required classes
     required_classes = [
-        'class CraftNudgeError(',
-        'class GitRepositoryError(',
-        'class DataStoreError(',
-        'class ValidationError(',
-        'class ConfigurationError('
+        'CraftNudgeError',
+        'GitRepositoryError',
+        'DataStoreError',
+        'ValidationError',
+        'ConfigurationError'
     ]
     
+    classes_tested = 0
     for cls in required_classes:
-        assert cls in content, f"Missing class: {cls}"
-        test_results["coverage"]["classes_tested"] += 1
+        assert cls in classes, f"Missing class: {cls}"
+        classes_tested += 1
+    test_results["coverage"]["classes_tested"] += classes_tested
     
     # Check for required functions
     required_functions = [
-        'def handle_error(',
-        'def validate_required_fields(',
-        'def validate_field_type(',
-        'def safe_execute(',
-        'def retry_on_error('
+        'handle_error',
+        'validate_required_fields',
+        'validate_field_type',
+        'safe_execute',
+        'retry_on_error'
     ]
     
+    functions_tested = 0
     for func in required_functions:
-        assert func in content, f"Missing function: {func}"
-        test_results["coverage"]["functions_tested"] += 1
+        assert func in functions, f"Missing function: {func}"
+        functions_tested += 1
+    test_results["coverage"]["functions_tested"] += functions_tested
     
     # Check for required imports
-    assert 'import logging' in content
-    assert 'import traceback' in content
-    assert 'from datetime import datetime' in content
-    assert 'from typing import Dict, Any, List, Callable, Optional' in content
-    
-    # Test classes and functions with mocks
-    with patch('shared.utils.error_handler.logging') as mock_logging:
-        # Test CraftNudgeError
-        mock_error = MagicMock()
-        mock_error.message = "Test error"
-        mock_error.error_code = "TEST_001"
-        mock_error.details = {"test": "details"}
-        mock_error.timestamp = datetime.now()
-        
-        assert mock_error.message == "Test error"
-        assert mock_error.error_code == "TEST_001"
-        assert mock_error.details == {"test": "details"}
-        assert isinstance(mock_error.timestamp, datetime)
-        
-        # Test functions
-        mock_handle_error = MagicMock()
-        mock_validate_required_fields = MagicMock()
-        mock_validate_field_type = MagicMock()
-        mock_safe_execute = MagicMock()
-        mock_retry_on_error = MagicMock()
-        
-        # Test function calls
-        mock_handle_error.return_value = "error_handled"
-        mock_validate_required_fields.return_value = None
-        mock_validate_field_type.return_value = None
-        mock_safe_execute.return_value = "success"
-        mock_retry_on_error.return_value = "retry_success"
-        
-        # Verify function calls work
-        assert mock_handle_error() == "error_handled"
-        assert mock_validate_required_fields() is None
-        assert mock_validate_field_type() is None
-        assert mock_safe_execute() == "success"
-        assert mock_retry_on_error() == "retry_success"
+    assert 'logging' in imports
+    assert 'traceback' in imports
+    assert 'datetime.datetime' in imports
+    assert {'typing.Dict', 'typing.Any', 'typing.List', 'typing.Callable', 'typing.Optional'} <= imports
 
 def test_init_files():
     """Test all __init__.py files."""
@@ -311,18 +388,22 @@ def test_init_files():
         "shared/utils/__init__.py"
     ]
     
+    present = _scan_python_files()
+    missing = [init_file for init_file in init_files if _project_file(init_file) not in present]
+    assert not missing, f"Missing __init__.py files: {missing}"
+    
+    files_tested = 0
     for init_file in init_files:
-        file_path = project_root / init_file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        raw, tree = present[_project_file(init_file)]
         
         # Check that file has content
-        assert len(content.strip()) > 0, f"Empty __init__.py file: {init_file}"
+        assert len(raw.strip()) > 0, f"Empty __init__.py file: {init_file}"
         
         # Check for proper Python syntax
-        ast.parse(content)
+        assert not isinstance(tree, SyntaxError), f"Syntax error in {init_file}: {tree}"
         
-        test_results["coverage"]["files_tested"] += 1
+        files_tested += 1
+    test_results["coverage"]["files_tested"] += files_tested
 
 def test_project_structure():
     """Test project structure and organization."""
@@ -337,10 +418,16 @@ def test_project_structure():
         "tests"
     ]
     
+    errors = []
     for dir_name in required_dirs:
         dir_path = project_root / dir_name
-        assert dir_path.exists(), f"Required directory {dir_name} does not exist"
-        assert dir_path.is_dir(), f"{dir_name} is not a directory"
+        if not dir_path.exists():
+            errors.append(f"Required directory {dir_name} does not exist")
+        elif not dir_path.is_dir():
+            errors.append(f"{dir_name} is not a directory")
+    
+    if errors:
+        raise AssertionError("\n".join(errors))
 
 def test_config_files():
     """Test configuration files."""
@@ -352,7 +439,7 @@ def test_config_files():
         
         # Test that it's valid YAML
         try:
-            yaml.safe_load(content)
+            yaml.load(content, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise AssertionError(f"Invalid YAML in app_config.yaml: {e}")
         
@@ -367,6 +454,7 @@ def test_documentation_files():
         "IMPLEMENTATION_GUIDE.md"
     ]
     
+    errors = []
     for doc_file in doc_files:
         file_path = project_root / doc_file
         if file_path.exists():
@@ -374,83 +462,67 @@ def test_documentation_files():
                 content = f.read()
             
             # Check that documentation has content
-            assert len(content.strip()) > 0, f"Empty documentation file: {doc_file}"
+            if len(content.strip()) == 0:
+                errors.append(f"Empty documentation file: {doc_file}")
             
             # Check for markdown formatting
-            assert '#' in content, f"No markdown headers in {doc_file}"
+            elif '#' not in content:
+                errors.append(f"No markdown headers in {doc_file}")
+    
+    if errors:
+        raise AssertionError("\n".join(errors))
 
 def test_integration():
     """Test integration between components."""
-    # Mock all major components
-    with patch('shared.config.config_manager.get_config') as mock_get_config:
-        with patch('shared.utils.logger.get_logger') as mock_get_logger:
-            # Set up mocks
-            mock_get_config.return_value = {"test": "config"}
-            mock_get_logger.return_value = MagicMock()
-            
-            # Test integration
-            config = mock_get_config()
-            logger = mock_get_logger()
-            
-            assert config == {"test": "config"}
-            assert logger is not None
+    # Mock all major components (different modules, so one combined with-statement)
+    with patch('shared.config.config_manager.get_config', return_value={"test": "config"}) as mock_get_config, \
+         patch('shared.utils.logger.get_logger', return_value=MagicMock()) as mock_get_logger:
+        # Test integration
+        config = mock_get_config()
+        logger = mock_get_logger()
+        
+        assert config == {"test": "config"}
+        assert logger is not None
 
 def test_error_handling_integration():
     """Test error handling integration."""
-    with patch('shared.utils.error_handler.handle_error') as mock_handle_error:
-        with patch('shared.utils.error_handler.safe_execute') as mock_safe_execute:
-            # Set up mocks
-            mock_handle_error.return_value = "error_handled"
-            mock_safe_execute.return_value = "safe_result"
-            
-            # Test integration
-            error_result = mock_handle_error()
-            safe_result = mock_safe_execute()
-            
-            assert error_result == "error_handled"
-            assert safe_result == "safe_result"
+    with patch.multiple('shared.utils.error_handler', handle_error=DEFAULT, safe_execute=DEFAULT) as mocks:
+        # Set up mocks
+        mocks['handle_error'].return_value = "error_handled"
+        mocks['safe_execute'].return_value = "safe_result"
+        
+        # Test integration
+        error_result = mocks['handle_error']()
+        safe_result = mocks['safe_execute']()
+        
+        assert error_result == "error_handled"
+        assert safe_result == "safe_result"
 
 def test_file_permissions():
     """Test file permissions and accessibility."""
-    # Test that all Python files are readable
-    python_files = []
-    for root, dirs, files in os.walk(project_root):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = Path(root) / file
-                python_files.append(file_path)
-    
-    for file_path in python_files:
-        # Test that file is readable
-        assert os.access(file_path, os.R_OK), f"File {file_path} is not readable"
-        
-        # Test that we can open and read the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert len(content) >= 0, f"Could not read content from {file_path}"
+    # Test that all Python files are readable; the scan already opened every
+    # file, so an os.access() probe would only repeat that check
+    _scan_python_files()
+    errors = [f"File {file_path} is not readable: {e}" for file_path, e in _UNREADABLE.items()]
+    
+    if errors:
+        raise AssertionError("\n".join(errors))
 
 def test_code_quality():
     """Test code quality standards."""
     # Test that all Python files follow basic quality standards
-    python_files = []
-    for root, dirs, files in os.walk(project_root):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = Path(root) / file
-                python_files.append(file_path)
-    
-    for file_path in python_files:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check for proper encoding
-        assert content.isprintable() or '\n' in content, f"File {file_path} has encoding issues"
+    errors = []
+    for file_path, (raw, tree) in _scan_python_files().items():
+        # Check for binary content (a single memchr over the raw bytes)
+        if b'\x00' in raw:
+            errors.append(f"File {file_path} appears binary")
         
         # Check for reasonable line length (basic check)
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if len(line) > 200:  # Very long lines might indicate issues
-                print(f"Warning: Long line ({len(line)} chars) in {file_path}:{i}")
+        for i, length in _long_lines(raw, 200):  # Very long lines might indicate issues
+            print(f"Warning: Long line ({length} chars) in {file_path}:{i}")
+    
+    if errors:
+        raise AssertionError("\n".join(errors))
 
 def test_coverage_validation():
     """Test that all functions and classes are covered."""
@@ -467,21 +539,30 @@ def test_coverage_validation():
         "__init__.py"
     ]
     
+    present = _scan_python_files()
+    missing = [file_path for file_path in source_files if _project_file(file_path) not in present]
+    assert not missing, f"Source files must exist for coverage: {missing}"
+    
     for file_path in source_files:
-        full_path = project_root / file_path
-        assert full_path.exists(), f"Source file {file_path} must exist for coverage"
-        
-        with open(full_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        raw, tree = present[_project_file(file_path)]
         
         # Check that file has content
-        assert len(content.strip()) > 0, f"Source file {file_path} must have content"
+        assert len(raw.strip()) > 0, f"Source file {file_path} must have content"
+
+# Tests whose failure means the project tree is unusable for file-based checks
+CRITICAL_TESTS = {test_source_file_analysis, test_project_structure}
+
+# Tests that do not read project files and still run after a critical failure
+INDEPENDENT_TESTS = {test_integration, test_error_handling_integration}
 
 def main():
     """Main test runner function."""
     print("🚀 Starting CraftNudge AI Agent Comprehensive Test Suite")
     print("=" * 70)
     
+    if not HAS_LIBYAML:
+        print("💡 Hint: install PyYAML with libyaml support for faster YAML parsing")
+    
     # Run all tests
     tests = [
         ("Source File Analysis", test_source_file_analysis),
@@ -500,8 +581,17 @@ def main():
         ("Coverage Validation", test_coverage_validation),
     ]
     
+    # Once a prerequisite fails, file-based tests would only re-walk a broken tree
+    critical_failed = False
     for test_name, test_func in tests:
-        run_test(test_name, test_func)
+        if critical_failed and test_func not in INDEPENDENT_TESTS:
+            test_results["skipped"] += 1
+            print(f"⏭️  SKIP: {test_name} (prerequisite failed)")
+            continue
+        
+        passed = run_test(test_name, test_func)
+        if not passed and test_func in CRITICAL_TESTS:
+            critical_failed = True
     
     # Print results
     print("\n" + "=" * 70)
@@ -510,6 +600,7 @@ def main():
     print(f"Total Tests: {test_results['total']}")
     print(f"Passed: {test_results['passed']}")
     print(f"Failed: {test_results['failed']}")
+    print(f"Skipped: {test_results['skipped']}")
     print(f"Success Rate: {(test_results['passed'] / test_results['total'] * 100):.1f}%")
     
     print("\n📈 DETAILED COVERAGE SUMMARY")
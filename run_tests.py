@@ -11,18 +11,80 @@ This script provides step-by-step testing with:
 """
 
 import os
+import re
 import sys
+import argparse
+import importlib
+import importlib.util
 import subprocess
+import threading
 import time
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from shared.utils.json_utils import dumps_bytes, loads as _json_loads
+
+# Short test summary lines ("PASSED <file>::<test>", "ERROR <file>" for a
+# file that fails to collect), printed in this form with or without xdist
+_TEST_RESULT_RE = re.compile(r'^(PASSED|FAILED|ERROR) ([^\s:]+)', re.MULTILINE)
+
+
+def _encode_event(event: Dict) -> bytes:
+    """Encode an event as one NDJSON line."""
+    return dumps_bytes(event) + b"\n"
+
+
+def _encode_report(results: Dict) -> bytes:
+    """Encode the detailed report as indented JSON."""
+    return dumps_bytes(results, indent=True)
+
+
+def _parse_total_coverage(line: str) -> float:
+    """Get the percentage from a coverage report's TOTAL row (0 if absent)."""
+    parts = line.split()
+    if len(parts) >= 4:
+        try:
+            return float(parts[-1].replace('%', ''))
+        except ValueError:
+            pass
+    return 0
+
+
 class TestRunner:
     """Comprehensive test runner with step-by-step execution."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, concurrency: str = "auto"):
         self.project_root = project_root
+        
+        # pytest-xdist worker count for Steps 2 and 3 ("auto", "1" = serial)
+        self.concurrency = str(concurrency)
+        
+        # Core modules are imported in this process, so they must resolve
+        # from the project root regardless of the working directory
+        if str(project_root) not in sys.path:
+            sys.path.insert(0, str(project_root))
+        importlib.invalidate_caches()
+        
+        self.service_tests = [
+            "tests/unit/test_commit_tracker.py",
+            "tests/unit/test_git_parser.py",
+            "tests/unit/test_data_writer.py"
+        ]
+        self.shared_tests = [
+            "tests/unit/test_config_manager.py",
+            "tests/unit/test_logger.py",
+            "tests/unit/test_error_handler.py"
+        ]
+        self.all_test_files = self.service_tests + self.shared_tests
+        
+        # Per-file outcome of the single pytest run shared by Steps 2 and 3
+        self._test_file_results = None
+        
+        # NDJSON event log, open while run_step_by_step is running
+        self._event_log = None
+        
         self.results = {
             "start_time": time.time(),
             "modules_tested": [],
@@ -36,23 +98,43 @@ class TestRunner:
         print("🔧 CraftNudge AI Agent - Step-by-Step Test Runner")
         print("=" * 60)
         
-        # Step 1: Test individual modules
-        self.test_core_modules()
-        
-        # Step 2: Test services
-        self.test_services()
-        
-        # Step 3: Test shared components
-        self.test_shared_components()
-        
-        # Step 4: Run coverage analysis
-        self.run_coverage_analysis()
-        
-        # Step 5: Run quality checks
-        self.run_quality_checks()
+        # Results are also streamed as they arrive, so a crashed run still
+        # leaves a partial report behind
+        self._event_log = open(self.project_root / "step_by_step_test_report.ndjson", 'wb')
+        try:
+            # Step 1: Test individual modules
+            self.test_core_modules()
+            
+            # Step 2: Test services
+            self.test_services()
+            
+            # Step 3: Test shared components
+            self.test_shared_components()
+            
+            # Step 4: Run coverage analysis
+            self.run_coverage_analysis()
+            
+            # Step 5: Run quality checks
+            self.run_quality_checks()
+            
+            # Step 6: Generate final report
+            self.generate_final_report()
+        finally:
+            self._event_log.close()
+            self._event_log = None
+    
+    def _log_event(self, event: str, data: Dict):
+        """Append one event to the NDJSON event log, if one is open."""
+        if self._event_log is None:
+            return
         
-        # Step 6: Generate final report
-        self.generate_final_report()
+        self._event_log.write(_encode_event({"event": event, "data": data}))
+        self._event_log.flush()
+    
+    def _add_module_result(self, entry: Dict):
+        """Record the result of a module or test file."""
+        self.results["modules_tested"].append(entry)
+        self._log_event("module", entry)
     
     def test_core_modules(self):
         """Test core modules individually."""
@@ -76,13 +158,7 @@ class TestRunner:
         print("\n🔧 STEP 2: Testing Services")
         print("-" * 40)
         
-        service_tests = [
-            "tests/unit/test_commit_tracker.py",
-            "tests/unit/test_git_parser.py", 
-            "tests/unit/test_data_writer.py"
-        ]
-        
-        for test_file in service_tests:
+        for test_file in self.service_tests:
             self.run_test_file(test_file)
     
     def test_shared_components(self):
@@ -90,65 +166,78 @@ class TestRunner:
         print("\n🔄 STEP 3: Testing Shared Components")
         print("-" * 40)
         
-        shared_tests = [
-            "tests/unit/test_config_manager.py",
-            "tests/unit/test_logger.py",
-            "tests/unit/test_error_handler.py"
-        ]
-        
-        for test_file in shared_tests:
+        for test_file in self.shared_tests:
             self.run_test_file(test_file)
     
     def test_module(self, module_name: str):
         """Test a specific module."""
         print(f"  Testing {module_name}...")
         try:
-            result = subprocess.run(
-                [sys.executable, "-c", f"import {module_name}; print('PASS: {module_name} imports successfully')"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # Import in-process rather than paying interpreter startup per module
+            importlib.import_module(module_name)
+            print(f"    PASS: {module_name} - PASSED")
+            self._add_module_result({"module": module_name, "status": "PASSED"})
             
-            if result.returncode == 0:
-                print(f"    PASS: {module_name} - PASSED")
-                self.results["modules_tested"].append({"module": module_name, "status": "PASSED"})
-            else:
-                print(f"    FAIL: {module_name} - FAILED")
-                print(f"      Error: {result.stderr.strip()}")
-                self.results["modules_tested"].append({"module": module_name, "status": "FAILED", "error": result.stderr.strip()})
-                
         except Exception as e:
-            print(f"    ERROR: {module_name} - ERROR: {e}")
-            self.results["modules_tested"].append({"module": module_name, "status": "ERROR", "error": str(e)})
+            # Any exception raised while importing means the module failed
+            error = f"{type(e).__name__}: {e}"
+            print(f"    FAIL: {module_name} - FAILED")
+            print(f"      Error: {error}")
+            self._add_module_result({"module": module_name, "status": "FAILED", "error": error})
+    
+    def run_all_test_files(self) -> Dict[str, Dict]:
+        """
+        Run every test file in one pytest invocation.
+        
+        Collection and plugin loading are paid once instead of once per
+        file. The outcome is cached, so Steps 2 and 3 share the same run.
+        
+        Returns:
+            Dict mapping each test file to its passed/failed counts
+        """
+        if self._test_file_results is not None:
+            return self._test_file_results
+        
+        cmd = [sys.executable, "-m", "pytest", *self.all_test_files, "-q", "-rpfE", "--tb=short",
+               "--continue-on-collection-errors"]
+        
+        # Spread the files across CPUs when pytest-xdist is available
+        if self.concurrency != "1" and importlib.util.find_spec("xdist") is not None:
+            cmd += ["-n", self.concurrency]
+        
+        result = subprocess.run(
+            cmd,
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            timeout=120 * len(self.all_test_files)
+        )
+        
+        # One regex sweep over the whole output instead of a per-line loop
+        counts = Counter(_TEST_RESULT_RE.findall(result.stdout))
+        
+        self._test_file_results = {
+            test_file: {
+                "passed": counts["PASSED", test_file],
+                # Setup and collection errors count against the file too
+                "failed": counts["FAILED", test_file] + counts["ERROR", test_file],
+                "error": result.stderr.strip()
+            }
+            for test_file in self.all_test_files
+        }
+        return self._test_file_results
     
     def run_test_file(self, test_file: str):
-        """Run a specific test file."""
+        """Report the results of a specific test file."""
         print(f"  Running {test_file}...")
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pytest", test_file, "-v", "--tb=short"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            outcome = self.run_all_test_files()[test_file]
+            passed = outcome["passed"]
+            failed = outcome["failed"]
             
-            # Parse test results
-            output_lines = result.stdout.split('\n')
-            passed = 0
-            failed = 0
-            
-            for line in output_lines:
-                if "PASSED" in line:
-                    passed += 1
-                elif "FAILED" in line:
-                    failed += 1
-            
-            if result.returncode == 0 or passed > 0:
+            if passed > 0:
                 print(f"    PASS: {test_file} - {passed} passed, {failed} failed")
-                self.results["modules_tested"].append({
+                self._add_module_result({
                     "file": test_file, 
                     "status": "PASSED", 
                     "passed": passed, 
@@ -156,15 +245,15 @@ class TestRunner:
                 })
             else:
                 print(f"    FAIL: {test_file} - FAILED")
-                self.results["modules_tested"].append({
+                self._add_module_result({
                     "file": test_file, 
                     "status": "FAILED", 
-                    "error": result.stderr.strip()
+                    "error": outcome["error"]
                 })
                 
         except Exception as e:
             print(f"    ERROR: {test_file} - ERROR: {e}")
-            self.results["modules_tested"].append({
+            self._add_module_result({
                 "file": test_file, 
                 "status": "ERROR", 
                 "error": str(e)
@@ -176,31 +265,11 @@ class TestRunner:
         print("-" * 40)
         
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pytest", "--cov=.", "--cov-report=term-missing", "-q"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            # Parse coverage output
-            coverage_lines = result.stdout.split('\n')
-            total_coverage = 0
-            
-            for line in coverage_lines:
-                if "TOTAL" in line:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        try:
-                            total_coverage = float(parts[-1].replace('%', ''))
-                        except ValueError:
-                            pass
-                    break
+            total_coverage, output = self._stream_coverage_report(timeout=300)
             
             self.results["coverage"] = {
                 "total_coverage": total_coverage,
-                "output": result.stdout,
+                "output": output,
                 "status": "COMPLETED"
             }
             
@@ -209,6 +278,65 @@ class TestRunner:
         except Exception as e:
             print(f"  ✗ Coverage analysis failed: {e}")
             self.results["coverage"] = {"status": "FAILED", "error": str(e)}
+        
+        self._log_event("coverage", self.results["coverage"])
+    
+    def _stream_coverage_report(self, timeout: float) -> Tuple[float, str]:
+        """
+        Run pytest with coverage and read its report up to the TOTAL row.
+        
+        The run is stopped as soon as the TOTAL row has been read, and killed
+        if it takes longer than the timeout.
+        
+        Args:
+            timeout: Seconds allowed for the whole run
+            
+        Returns:
+            Tuple of (total coverage percentage, report output up to TOTAL)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the run was killed by the timeout
+        """
+        # Only the TOTAL row is parsed, so leave out the missing-lines column
+        # and the rows of fully covered files
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "pytest", "--cov=.", "--cov-report=term:skip-covered", "-q"],
+            cwd=self.project_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+        
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        
+        output = []
+        total_coverage = 0
+        
+        try:
+            for line in proc.stdout:
+                output.append(line)
+                if line.startswith("TOTAL"):
+                    total_coverage = _parse_total_coverage(line)
+                    break
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        
+        return total_coverage, "".join(output)
     
     def run_quality_checks(self):
         """Run quality checks."""
@@ -221,33 +349,48 @@ class TestRunner:
             "mypy": ["python", "-m", "mypy", "--json-report", "."]
         }
         
-        for tool, cmd in quality_tools.items():
-            print(f"  Running {tool}...")
-            try:
-                result = subprocess.run(
+        # The tools are independent, so run them side by side and report
+        # each one as soon as it finishes
+        print(f"  Running {', '.join(quality_tools)}...")
+        with ThreadPoolExecutor(max_workers=len(quality_tools)) as executor:
+            futures = {
+                executor.submit(
+                    subprocess.run,
                     cmd,
                     cwd=self.project_root,
                     capture_output=True,
                     text=True,
                     timeout=60
-                )
-                
-                if result.returncode == 0:
-                    print(f"    PASS: {tool} - PASSED")
-                    self.results["quality"][tool] = {"status": "PASSED", "score": 10.0}
-                else:
-                    try:
-                        issues = json.loads(result.stdout)
-                        score = max(0, 10 - len(issues) * 0.1)
-                        print(f"    WARN: {tool} - {len(issues)} issues (score: {score:.1f}/10)")
-                        self.results["quality"][tool] = {"status": "ISSUES", "score": score, "issues": len(issues)}
-                    except:
-                        print(f"    FAIL: {tool} - FAILED")
-                        self.results["quality"][tool] = {"status": "FAILED", "score": 0}
-                        
-            except Exception as e:
-                print(f"    ERROR: {tool} - ERROR: {e}")
-                self.results["quality"][tool] = {"status": "ERROR", "score": 0, "error": str(e)}
+                ): tool
+                for tool, cmd in quality_tools.items()
+            }
+            
+            for future in as_completed(futures):
+                self._report_quality_tool(futures[future], future)
+    
+    def _report_quality_tool(self, tool: str, future):
+        """Record and print the result of a finished quality tool run."""
+        try:
+            result = future.result()
+            
+            if result.returncode == 0:
+                print(f"    PASS: {tool} - PASSED")
+                self.results["quality"][tool] = {"status": "PASSED", "score": 10.0}
+            else:
+                try:
+                    issue_count = len(_json_loads(result.stdout))
+                    score = max(0, 10 - issue_count * 0.1)
+                    print(f"    WARN: {tool} - {issue_count} issues (score: {score:.1f}/10)")
+                    self.results["quality"][tool] = {"status": "ISSUES", "score": score, "issues": issue_count}
+                except:
+                    print(f"    FAIL: {tool} - FAILED")
+                    self.results["quality"][tool] = {"status": "FAILED", "score": 0}
+                    
+        except Exception as e:
+            print(f"    ERROR: {tool} - ERROR: {e}")
+            self.results["quality"][tool] = {"status": "ERROR", "score": 0, "error": str(e)}
+        
+        self._log_event("quality", dict(self.results["quality"][tool], tool=tool))
     
     def generate_final_report(self):
         """Generate final test report."""
@@ -256,12 +399,12 @@ class TestRunner:
         
         # Calculate summary statistics
         total_modules = len(self.results["modules_tested"])
-        passed_modules = len([m for m in self.results["modules_tested"] if m.get("status") == "PASSED"])
+        passed_modules = Counter(m.get("status") for m in self.results["modules_tested"])["PASSED"]
         coverage = self.results["coverage"].get("total_coverage", 0)
         
         # Calculate quality score
-        quality_scores = [q.get("score", 0) for q in self.results["quality"].values()]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+        quality = self.results["quality"]
+        avg_quality = sum(q.get("score", 0) for q in quality.values()) / len(quality) if quality else 0
         
         # Determine overall grade
         if passed_modules == total_modules and coverage >= 90 and avg_quality >= 8:
@@ -290,10 +433,12 @@ class TestRunner:
         print(f"  Overall Grade: {grade}")
         print(f"  Duration: {self.results['summary']['duration']:.1f}s")
         
+        # The summary event marks the event log as complete
+        self._log_event("summary", self.results["summary"])
+        
         # Save detailed report
         report_file = self.project_root / "step_by_step_test_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        report_file.write_bytes(_encode_report(self.results))
         
         print(f"\n📁 Detailed report saved to: {report_file}")
         
@@ -315,8 +460,14 @@ class TestRunner:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="CraftNudge AI Agent Step-by-Step Test Runner")
+    parser.add_argument("--concurrency", default="auto",
+                        help="pytest-xdist workers for Steps 2 and 3 ('auto' = one per CPU, 1 = serial)")
+    
+    args = parser.parse_args()
+    
     project_root = Path(__file__).parent
-    runner = TestRunner(project_root)
+    runner = TestRunner(project_root, concurrency=args.concurrency)
     runner.run_step_by_step()
 
 if __name__ == "__main__":
@@ -4,22 +4,41 @@ Commit Tracker Service - User Story 2.1.1: Behavior Tracker – Git Commit Logge
 This package contains the commit tracking microservice.
 """
 
-# Import and expose the main modules
-try:
-    from .src import commit_tracker, data_writer, git_parser
-    from .src.commit_tracker import CommitTracker
-    from .src.data_writer import DataWriter
-    from .src.git_parser import GitParser, GitCommandError
-    
-    __all__ = [
-        'commit_tracker',
-        'data_writer', 
-        'git_parser',
-        'CommitTracker',
-        'DataWriter',
-        'GitParser',
-        'GitCommandError'
-    ]
-except ImportError:
-    # Handle case where modules might not be available
-    __all__ = []
+import importlib
+
+# Expose the main modules and classes, importing each on first access
+_SUBMODULES = ('commit_tracker', 'data_writer', 'git_parser')
+_EXPORTS = {
+    'CommitTracker': 'commit_tracker',
+    'DataWriter': 'data_writer',
+    'GitParser': 'git_parser',
+    'GitCommandError': 'git_parser'
+}
+
+__all__ = [
+    'commit_tracker',
+    'data_writer',
+    'git_parser',
+    'CommitTracker',
+    'DataWriter',
+    'GitParser',
+    'GitCommandError'
+]
+
+
+def __getattr__(name):
+    """Import the submodule behind a public name on first access."""
+    if name in _SUBMODULES:
+        value = importlib.import_module(f'.src.{name}', __name__)
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.src.{_EXPORTS[name]}', __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
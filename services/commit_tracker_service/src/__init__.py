@@ -2,18 +2,45 @@
 Commit Tracker Service - User Story 2.1.1: Behavior Tracker – Git Commit Logger
 
 This package contains the core commit tracking functionality.
+
+The public classes are resolved lazily (PEP 562): a submodule is only
+imported when one of its names is first accessed, so importing a single
+submodule does not pull in the others.
 """
 
-from .commit_tracker import CommitTracker, GitRepositoryError, CommitExtractionError
-from .git_parser import GitParser, GitCommandError
-from .data_writer import DataWriter
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'CommitTracker': '.commit_tracker',
+    'GitRepositoryError': '.commit_tracker',
+    'CommitExtractionError': '.commit_tracker',
+    'GitParser': '.git_parser',
+    'GitCommandError': '.git_parser',
+    'DataWriter': '.data_writer'
+}
 
 __version__ = "1.0.0"
 __all__ = [
     'CommitTracker',
-    'GitRepositoryError', 
+    'GitRepositoryError',
     'CommitExtractionError',
     'GitParser',
     'GitCommandError',
     'DataWriter'
 ]
+
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
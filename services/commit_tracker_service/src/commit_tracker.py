@@ -8,9 +8,8 @@ timestamp, and changed files for behavioral analysis.
 import os
 import sys
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from pathlib import Path
-import json
 import uuid
 
 from .git_parser import GitParser
@@ -18,9 +17,30 @@ from .data_writer import DataWriter
 from shared.utils.logger import get_logger
 from shared.utils.error_handler import handle_error
 
+# Messages use loguru's "{}" placeholders with arguments, so they are only
+# formatted when a handler accepts the level
 logger = get_logger(__name__)
 
 
+def _uuid_stream(chunk_size: int = 4096) -> Iterator[str]:
+    """
+    Yield random (version 4) UUID strings from pooled random bytes.
+    
+    Each os.urandom call is sliced into chunk_size // 16 UUIDs instead of
+    reading 16 bytes per UUID as uuid.uuid4() does.
+    
+    Args:
+        chunk_size: Number of random bytes read at a time (multiple of 16)
+        
+    Yields:
+        UUID strings
+    """
+    while True:
+        block = os.urandom(chunk_size)
+        for offset in range(0, chunk_size, 16):
+            yield str(uuid.UUID(bytes=block[offset:offset + 16], version=4))
+
+
 class CommitTracker:
     """
     Main commit tracking service that orchestrates Git commit logging.
@@ -43,6 +63,12 @@ class CommitTracker:
         self.git_parser = GitParser(self.repo_path)
         self.data_writer = DataWriter()
         
+        # Repository check result, resolved on first use
+        self._is_repo: Optional[bool] = None
+        
+        # Record IDs for batch logging, drawn from pooled random bytes
+        self._uuids = _uuid_stream()
+        
     def log_latest_commit(self) -> Dict[str, Any]:
         """
         Log the most recent Git commit with full metadata.
@@ -55,10 +81,10 @@ class CommitTracker:
             CommitExtractionError: If commit data cannot be extracted
         """
         try:
-            logger.info(f"Starting commit logging for repository: {self.repo_path}")
+            logger.info("Starting commit logging for repository: {}", self.repo_path)
             
             # Validate Git repository
-            if not self.git_parser.is_git_repository():
+            if not self._check_repo():
                 error_msg = f"No Git repository found at: {self.repo_path}"
                 logger.error(error_msg)
                 raise GitRepositoryError(error_msg)
@@ -76,7 +102,7 @@ class CommitTracker:
             # Write to data store
             self.data_writer.write_commit(commit_data)
             
-            logger.info(f"Successfully logged commit: {commit_data['hash'][:8]}")
+            logger.info("Successfully logged commit: {:.8}", commit_data['hash'])
             
             return {
                 'status': 'success',
@@ -86,7 +112,7 @@ class CommitTracker:
             
         except Exception as e:
             error_result = handle_error(e, "commit_tracker.log_latest_commit")
-            logger.error(f"Failed to log commit: {error_result['error']}")
+            logger.error("Failed to log commit: {}", error_result['error'])
             return error_result
     
     def log_commit_by_hash(self, commit_hash: str) -> Dict[str, Any]:
@@ -100,9 +126,9 @@ class CommitTracker:
             Dict containing commit data and status
         """
         try:
-            logger.info(f"Logging specific commit: {commit_hash}")
+            logger.info("Logging specific commit: {}", commit_hash)
             
-            if not self.git_parser.is_git_repository():
+            if not self._check_repo():
                 error_msg = f"No Git repository found at: {self.repo_path}"
                 logger.error(error_msg)
                 raise GitRepositoryError(error_msg)
@@ -120,7 +146,7 @@ class CommitTracker:
             # Write to data store
             self.data_writer.write_commit(commit_data)
             
-            logger.info(f"Successfully logged commit: {commit_data['hash'][:8]}")
+            logger.info("Successfully logged commit: {:.8}", commit_data['hash'])
             
             return {
                 'status': 'success',
@@ -130,9 +156,72 @@ class CommitTracker:
             
         except Exception as e:
             error_result = handle_error(e, "commit_tracker.log_commit_by_hash")
-            logger.error(f"Failed to log commit {commit_hash}: {error_result['error']}")
+            logger.error("Failed to log commit {}: {}", commit_hash, error_result['error'])
             return error_result
     
+    def log_commits_since(self, rev: str) -> Dict[str, Any]:
+        """
+        Log every commit after a revision, up to HEAD, in one batch.
+        
+        Args:
+            rev: Revision to start after (exclusive)
+            
+        Returns:
+            Dict containing the logged commits and status
+        """
+        try:
+            logger.info("Logging commits since {} for repository: {}", rev, self.repo_path)
+            
+            if not self._check_repo():
+                error_msg = f"No Git repository found at: {self.repo_path}"
+                logger.error(error_msg)
+                raise GitRepositoryError(error_msg)
+            
+            # Extract all commits with a single git invocation
+            commits = self.git_parser.get_commits_since(rev)
+            
+            # One logging timestamp for the whole batch
+            timestamp = datetime.now(timezone.utc).isoformat()
+            for commit_data in commits:
+                commit_data['id'] = next(self._uuids)
+                commit_data['timestamp'] = timestamp
+                self._validate_commit_data(commit_data)
+            
+            # Write to data store
+            if commits:
+                write_result = self.data_writer.write_commits(commits)
+                if write_result.get('status') != 'success':
+                    return write_result
+            
+            logger.info("Successfully logged {} commits since {}", len(commits), rev)
+            
+            return {
+                'status': 'success',
+                'commits': commits,
+                'count': len(commits),
+                'message': f"{len(commits)} commits since {rev} logged successfully"
+            }
+            
+        except Exception as e:
+            error_result = handle_error(e, "commit_tracker.log_commits_since")
+            logger.error("Failed to log commits since {}: {}", rev, error_result['error'])
+            return error_result
+    
+    def invalidate_repo_cache(self) -> None:
+        """Forget the cached repository check so the next call re-checks it."""
+        self._is_repo = None
+    
+    def _check_repo(self) -> bool:
+        """
+        Check whether repo_path is a Git repository, once per instance.
+        
+        Returns:
+            True if Git repository exists, False otherwise
+        """
+        if self._is_repo is None:
+            self._is_repo = self.git_parser.is_git_repository()
+        return self._is_repo
+    
     def _validate_commit_data(self, commit_data: Dict[str, Any]) -> None:
         """
         Validate that commit data contains all required fields.
@@ -167,7 +256,7 @@ class CommitTracker:
             Dict containing repository information
         """
         try:
-            if not self.git_parser.is_git_repository():
+            if not self._check_repo():
                 return {
                     'status': 'error',
                     'message': f"No Git repository found at: {self.repo_path}",
@@ -184,7 +273,7 @@ class CommitTracker:
             
         except Exception as e:
             error_result = handle_error(e, "commit_tracker.get_repository_info")
-            logger.error(f"Failed to get repository info: {error_result['error']}")
+            logger.error("Failed to get repository info: {}", error_result['error'])
             return error_result
 
 
@@ -202,4 +291,5 @@ if __name__ == "__main__":
     # CLI entry point for testing
     tracker = CommitTracker()
     result = tracker.log_latest_commit()
-    print(json.dumps(result, indent=2))
+    from shared.utils.json_utils import dumps_bytes
+    print(dumps_bytes(result, indent=True).decode('utf-8'))
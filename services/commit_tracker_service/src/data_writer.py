@@ -4,17 +4,176 @@ Data Writer Module - User Story 2.1.1: Behavior Tracker – Git Commit Logger
 This module handles writing commit data to the local data store in JSONL format.
 """
 
+import hashlib
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-import jsonlines
 
+from shared.utils.json_utils import dumps_bytes, loads
 from shared.utils.logger import get_logger
 from shared.utils.error_handler import handle_error
 from shared.config.config_manager import get_config
 
 logger = get_logger(__name__)
 
+# Block size used when reading the commits file backwards from EOF
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+# Block size used when counting newlines in the commits file
+_COUNT_CHUNK_SIZE = 1 << 20
+
+# Bytes of the first commits file line hashed into the count sidecar's file identity
+_IDENTITY_LINE_LIMIT = 64 * 1024
+
+# Block size used when scanning the commits file for search keywords
+_SCAN_CHUNK_SIZE = 1 << 20
+
+# A newline followed by ASCII whitespace: the only way a block of lines
+# can contain a blank (or whitespace-only) line after its first
+_LINE_START_WHITESPACE = re.compile(rb'\n[ \t\n\r\x0b\x0c]')
+
+# With parallel_search enabled, commits files at least this large are
+# searched by one worker process per CPU, each over its own byte range
+_PARALLEL_SCAN_MIN_SIZE = 64 << 20
+
+# The only non-ASCII characters whose lowercase form contains ASCII:
+# U+0130 ('i' + combining dot) and U+212A ('k'), as UTF-8 and as
+# lowercased JSON escapes. Keywords containing that ASCII letter cannot
+# be prefiltered on raw bytes in blocks holding one of them.
+_LOWERS_TO_ASCII = {
+    b'i': (b'\xc4\xb0', b'\\u0130'),
+    b'k': (b'\xe2\x84\xaa', b'\\u212a')
+}
+
+# Fields every stored commit record must carry, in reporting order
+_REQUIRED_FIELDS = ('id', 'hash', 'author', 'message', 'timestamp', 'changed_files')
+
+# Characters that make a search keyword a regular expression
+_REGEX_METACHARS = re.compile(r'[.*+?^$()\[\]{}|\\]')
+
+
+def _needs_regex(pattern: str) -> bool:
+    """Return True if the search pattern contains regex metacharacters."""
+    return bool(_REGEX_METACHARS.search(pattern))
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile a regular expression once and reuse it across lookups."""
+    return re.compile(pattern, flags)
+
+
+def _keyword_matcher(pattern: Union[str, re.Pattern]) -> Callable[[str], bool]:
+    """
+    Build a case-insensitive match predicate for a search keyword.
+
+    Plain keywords use a literal substring check; the regex engine is only
+    involved when the keyword actually needs it. Invalid expressions fall
+    back to a literal match. Precompiled patterns are used as-is.
+
+    Args:
+        pattern: Search keyword, regular expression or compiled pattern
+
+    Returns:
+        Callable taking the text to check and returning True on a match
+    """
+    if isinstance(pattern, re.Pattern):
+        return lambda text: pattern.search(text) is not None
+
+    if _needs_regex(pattern):
+        try:
+            search = _compile(pattern).search
+            return lambda text: search(text) is not None
+        except re.error:
+            pass
+
+    needle = pattern.lower()
+    return lambda text: needle in text.lower()
+
+
+def _literal_needles(criteria: Dict[str, Any]) -> List[bytes]:
+    """
+    Collect the search keywords usable as raw-line prefilters.
+
+    Only plain ASCII keywords qualify: they appear unescaped in the JSON
+    text of any matching record. Regular expressions, compiled patterns
+    and keywords with quotes, backslashes or non-printable characters are
+    left to the full per-commit check.
+
+    Args:
+        criteria: Search criteria
+
+    Returns:
+        Lowercased keywords encoded as bytes
+    """
+    needles = []
+    for key in ('author', 'message', 'files'):
+        value = criteria.get(key)
+        if not value or not isinstance(value, str):
+            continue
+
+        if key != 'author' and _needs_regex(value):
+            continue
+
+        if value.isascii() and value.isprintable() and '"' not in value and '\\' not in value:
+            needles.append(value.lower().encode('ascii'))
+
+    return needles
+
+
+def _count_records(block: bytes) -> int:
+    """Count the non-blank lines of a block of newline-terminated lines."""
+    # A blank line starts with whitespace; without one, every line is a record
+    if block[:1].isspace() or _LINE_START_WHITESPACE.search(block):
+        return sum(1 for line in block.split(b'\n') if line.strip())
+    return block.count(b'\n')
+
+
+def _needle_markers(needles: List[bytes]) -> Tuple[bytes, ...]:
+    """Return the byte sequences that force a full decode of a block for these needles."""
+    return tuple(
+        marker
+        for letter, letter_markers in _LOWERS_TO_ASCII.items()
+        if any(letter in needle for needle in needles)
+        for marker in letter_markers
+    )
+
+
+def _parse_iso_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 date ('Z' suffix allowed), or return None if it is not one."""
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _all_of(predicates: List[Callable[[Dict[str, Any]], bool]]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Combine commit predicates into a single short-circuiting check.
+
+    A single predicate is returned as-is, avoiding a wrapper call per
+    commit on the common one-criterion query.
+    """
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def matches(commit: Dict[str, Any]) -> bool:
+        for predicate in predicates:
+            if not predicate(commit):
+                return False
+        return True
+
+    return matches
+
 
 class DataWriter:
     """
@@ -27,20 +186,54 @@ class DataWriter:
     - Maintain data store structure
     """
 
-    def __init__(self, data_store_path: Optional[str] = None):
+    def __init__(self, data_store_path: Optional[str] = None, parallel_search: bool = False):
         """
         Initialize data writer.
 
         Args:
             data_store_path: Path to data store directory
+            parallel_search: Search large commits files with a pool of
+                worker processes. Off by default: the pool is started per
+                search, which long-lived processes such as a server should
+                not do.
         """
         config = get_config()
         self.data_store_path = Path(data_store_path) if data_store_path else Path(config['data_store']['base_path'])
         self.commits_file = self.data_store_path / 'behaviors' / 'commits.jsonl'
+        # Sidecar holding the commit count, the byte offset it was taken up to
+        # and the identity of the counted file
+        self.count_file = self.data_store_path / 'behaviors' / 'commits.count'
+        self.parallel_search = parallel_search
+
+        # O_APPEND descriptor kept open while the writer is used as a context manager
+        self._fd: Optional[int] = None
+
+        # Set once the commits file is known to exist; the store is append-only,
+        # so the existence check is not repeated on every read or write
+        self._commits_file_seen = False
 
         # Ensure data store directory exists
         self._ensure_data_store_exists()
 
+    def __enter__(self) -> 'DataWriter':
+        """
+        Keep the commits file open for appending until the block exits.
+
+        Every write_commit/write_commits call inside the block reuses one
+        append descriptor instead of opening and closing the file per commit.
+
+        Returns:
+            This data writer
+        """
+        self._fd = self._open_append()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the append descriptor opened by __enter__."""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+
     def write_commit(self, commit_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Write commit data to the JSONL file.
@@ -57,12 +250,8 @@ class DataWriter:
             # Validate commit data
             self._validate_commit_data(commit_data)
 
-            # Ensure file exists
-            self._ensure_commits_file_exists()
-
             # Write to JSONL file
-            with jsonlines.open(self.commits_file, mode='a') as writer:
-                writer.write(commit_data)
+            self._append(dumps_bytes(commit_data) + b'\n')
 
             logger.info(f"Successfully wrote commit to: {self.commits_file}")
 
@@ -77,6 +266,41 @@ class DataWriter:
             logger.error(f"Failed to write commit data: {error_result['error']}")
             return error_result
 
+    def write_commits(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Write a batch of commits to the JSONL file in one append.
+
+        Every commit is validated before anything is written, so a bad
+        record leaves the file untouched.
+
+        Args:
+            commits: Commit data to write, oldest first
+
+        Returns:
+            Dict containing write operation result
+        """
+        try:
+            logger.info(f"Writing {len(commits)} commits")
+
+            for commit_data in commits:
+                self._validate_commit_data(commit_data)
+
+            self._append(b''.join(dumps_bytes(commit_data) + b'\n' for commit_data in commits))
+
+            logger.info(f"Successfully wrote {len(commits)} commits to: {self.commits_file}")
+
+            return {
+                'status': 'success',
+                'file_path': str(self.commits_file),
+                'count': len(commits),
+                'message': f"{len(commits)} commits written successfully"
+            }
+
+        except Exception as e:
+            error_result = handle_error(e, "data_writer.write_commits")
+            logger.error(f"Failed to write commits: {error_result['error']}")
+            return error_result
+
     def read_commits(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Read commit data from the JSONL file.
@@ -88,22 +312,16 @@ class DataWriter:
             Dict containing commit data and status
         """
         try:
-            if not self.commits_file.exists():
-                return {
-                    'status': 'success',
-                    'commits': [],
-                    'message': 'No commits file found'
-                }
-
-            commits = []
-            with jsonlines.open(self.commits_file, mode='r') as reader:
-                for commit in reader:
-                    commits.append(commit)
-                    if limit and len(commits) >= limit:
-                        break
+            if not self._commits_file_exists():
+                return self._no_commits_file_result(commits=[])
 
-            # Reverse to get most recent first
-            commits.reverse()
+            if limit:
+                # Only the newest `limit` lines are read, starting from EOF
+                commits = self._read_tail(limit)
+            else:
+                commits = list(self._iter_records())
+                # Reverse to get most recent first
+                commits.reverse()
 
             return {
                 'status': 'success',
@@ -111,11 +329,49 @@ class DataWriter:
                 'message': f"Read {len(commits)} commits successfully"
             }
 
+        except FileNotFoundError:
+            # Removed or rotated since it was last seen
+            self._commits_file_seen = False
+            return self._no_commits_file_result(commits=[])
+
         except Exception as e:
             error_result = handle_error(e, "data_writer.read_commits")
             logger.error(f"Failed to read commits: {error_result['error']}")
             return error_result
 
+    def _read_tail(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Read the last commits in the JSONL file without scanning it all.
+
+        The file is read backwards in fixed-size blocks until `limit`
+        complete lines have been seen, so the cost depends on `limit`
+        rather than on the size of the history.
+
+        Args:
+            limit: Number of commits to return
+
+        Returns:
+            Up to `limit` commit data dictionaries, most recent first
+        """
+        lines: List[bytes] = []
+        with open(self.commits_file, 'rb') as fh:
+            position = fh.seek(0, os.SEEK_END)
+            # Bytes of a line whose start lies in a block not read yet
+            partial = b''
+
+            while position > 0 and len(lines) < limit:
+                size = min(_TAIL_CHUNK_SIZE, position)
+                position -= size
+                fh.seek(position)
+                block = fh.read(size) + partial
+
+                # The first piece may be cut mid-line unless the file start was reached
+                pieces = block.split(b'\n')
+                partial = pieces.pop(0) if position > 0 else b''
+                lines.extend(piece for piece in reversed(pieces) if piece.strip())
+
+        return [loads(line) for line in lines[:limit]]
+
     def get_commit_count(self) -> Dict[str, Any]:
         """
         Get the total number of commits in the data store.
@@ -124,17 +380,24 @@ class DataWriter:
             Dict containing commit count and status
         """
         try:
-            if not self.commits_file.exists():
-                return {
-                    'status': 'success',
-                    'count': 0,
-                    'message': 'No commits file found'
-                }
-
-            count = 0
-            with jsonlines.open(self.commits_file, mode='r') as reader:
-                for _ in reader:
-                    count += 1
+            if not self._commits_file_exists():
+                return self._no_commits_file_result(count=0)
+
+            # The commits file is append-only: lines before the offset recorded
+            # in the sidecar are already counted, only newer bytes are scanned
+            stat = self.commits_file.stat()
+            identity = self._file_identity(stat)
+            count, counted_size, counted_identity = self._load_count_index()
+
+            if counted_size > stat.st_size or counted_identity != identity:
+                # File was truncated, replaced or re-created: the sidecar no longer applies
+                count, counted_size = 0, 0
+
+            if counted_size < stat.st_size:
+                added, line_end = self._count_lines(counted_size)
+                if line_end > counted_size:
+                    count += added
+                    self._store_count_index(count, line_end, identity)
 
             return {
                 'status': 'success',
@@ -142,43 +405,181 @@ class DataWriter:
                 'message': f"Total commits: {count}"
             }
 
+        except FileNotFoundError:
+            # Removed or rotated since it was last seen
+            self._commits_file_seen = False
+            return self._no_commits_file_result(count=0)
+
         except Exception as e:
             error_result = handle_error(e, "data_writer.get_commit_count")
             logger.error(f"Failed to get commit count: {error_result['error']}")
             return error_result
 
-    def search_commits(self, search_criteria: Dict[str, Any]) -> Dict[str, Any]:
+    def _file_identity(self, stat: os.stat_result) -> str:
+        """
+        Identify the commits file the sidecar count was taken from.
+
+        Device and inode tell a re-created file apart from the original;
+        since a freed inode number can be reused, a digest of the first
+        line is included too.
+
+        Args:
+            stat: Result of stat() on the commits file
+
+        Returns:
+            Identity string stored alongside the count
+        """
+        with open(self.commits_file, 'rb') as fh:
+            first_line = fh.readline(_IDENTITY_LINE_LIMIT)
+
+        digest = hashlib.blake2b(first_line, digest_size=8).hexdigest()
+        return f"{stat.st_dev}:{stat.st_ino}:{digest}"
+
+    def _load_count_index(self) -> Tuple[int, int, Optional[str]]:
+        """
+        Load the persisted commit count from the sidecar file.
+
+        Returns:
+            Tuple of (commit count, byte offset of the commits file it was
+            taken up to, identity of that file); (0, 0, None) when the
+            sidecar is missing or unreadable
+        """
+        try:
+            count, size, identity = self.count_file.read_text().split()
+            return int(count), int(size), identity
+        except (OSError, ValueError):
+            return 0, 0, None
+
+    def _store_count_index(self, count: int, size: int, identity: str) -> None:
+        """
+        Persist the commit count, the byte offset it was taken up to and
+        the identity of the counted file.
+
+        Failing to write the sidecar only costs a rescan on the next count,
+        so errors are logged rather than raised.
+
+        Args:
+            count: Number of commits in the file
+            size: Byte offset just past the last counted line
+            identity: Commits file identity from _file_identity
+        """
+        try:
+            self.count_file.write_text(f"{count} {size} {identity}\n")
+        except OSError as e:
+            logger.warning(f"Failed to update commit count index: {e}")
+
+    def _count_lines(self, offset: int = 0) -> Tuple[int, int]:
+        """
+        Count complete records in the commits file from a line start.
+
+        Blank lines are skipped, as iter_commits and _read_tail skip them,
+        and an unterminated last line is left for a later count. Newline
+        bytes are counted in 1 MiB blocks with bytes.count, so no line
+        objects are built and no JSON is decoded.
+
+        Args:
+            offset: Byte position of a line start to begin counting from
+
+        Returns:
+            Tuple of (number of non-blank newline-terminated lines after
+            `offset`, byte position just past the last newline counted)
+        """
+        count = 0
+        end = offset
+        partial = b''
+        with open(self.commits_file, 'rb') as fh:
+            fh.seek(offset)
+            for block in iter(lambda: fh.read(_COUNT_CHUNK_SIZE), b''):
+                block = partial + block
+                cut = block.rfind(b'\n') + 1
+                block, partial = block[:cut], block[cut:]
+                count += _count_records(block)
+                end += cut
+
+        return count, end
+
+    def iter_commits(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream commit records from the JSONL file one at a time.
+
+        Records are yielded in file order (oldest first) without buffering
+        the whole history, so callers can stop early or keep only a bounded
+        window of results.
+
+        Yields:
+            Commit data dictionaries
+        """
+        if not self._commits_file_exists():
+            return
+
+        try:
+            yield from self._iter_records()
+        except FileNotFoundError:
+            # Removed or rotated since it was last seen
+            self._commits_file_seen = False
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Decode the commits file line by line, oldest first.
+
+        Raises:
+            FileNotFoundError: If the commits file does not exist
+        """
+        # Raw lines go straight to the decoder: no text layer, no per-line wrapper
+        with open(self.commits_file, 'rb') as fh:
+            for line in fh:
+                if line.strip():
+                    yield loads(line)
+
+    def search_commits(self, search_criteria: Dict[str, Any], limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Search commits based on criteria.
 
         Args:
             search_criteria: Dictionary of search criteria
                 - author: Author name or email
-                - message: Commit message keywords
+                - message: Commit message keywords (regex if it contains
+                  metacharacters, or a compiled pattern)
                 - date_from: Start date (ISO format)
                 - date_to: End date (ISO format)
-                - files: Changed files keywords
+                - files: Changed files keywords (regex if it contains
+                  metacharacters, or a compiled pattern)
+            limit: Maximum number of (most recent) matches to return (None for all)
 
         Returns:
             Dict containing matching commits and status
         """
         try:
-            if not self.commits_file.exists():
-                return {
-                    'status': 'success',
-                    'commits': [],
-                    'message': 'No commits file found'
-                }
-
-            matching_commits = []
-
-            with jsonlines.open(self.commits_file, mode='r') as reader:
-                for commit in reader:
-                    if self._matches_criteria(commit, search_criteria):
-                        matching_commits.append(commit)
+            if not self._commits_file_exists():
+                return self._no_commits_file_result(commits=[])
+
+            # Criteria are compiled into predicates once per query, not once per commit
+            matches = _all_of(self._compile_criteria(search_criteria))
+
+            # Only the newest `limit` matches are kept while streaming
+            matching = deque(maxlen=limit or None)
+
+            if any(value for value in search_criteria.values()):
+                ranges = self._scan_ranges()
+                if len(ranges) > 1:
+                    # Large files: each worker filters its own slice, in file order
+                    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                        for chunk in executor.map(self._search_range, ranges, repeat(search_criteria), repeat(limit)):
+                            matching.extend(chunk)
+                else:
+                    # Literal keywords let most records be rejected before decoding
+                    needles = _literal_needles(search_criteria)
+                    commits = self._iter_candidate_commits(needles) if needles else self._iter_records()
+
+                    for commit in commits:
+                        if matches(commit):
+                            matching.append(commit)
+            else:
+                # No active criteria: every commit matches, skip the filters
+                matching.extend(self._iter_records())
 
             # Reverse to get most recent first
-            matching_commits.reverse()
+            matching_commits = list(reversed(matching))
 
             return {
                 'status': 'success',
@@ -186,11 +587,160 @@ class DataWriter:
                 'message': f"Found {len(matching_commits)} matching commits"
             }
 
+        except FileNotFoundError:
+            # Removed or rotated since it was last seen
+            self._commits_file_seen = False
+            return self._no_commits_file_result(commits=[])
+
         except Exception as e:
             error_result = handle_error(e, "data_writer.search_commits")
             logger.error(f"Failed to search commits: {error_result['error']}")
             return error_result
 
+    def _iter_candidate_commits(self, needles: List[bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the commits whose raw JSONL line contains every needle.
+
+        The file is read in blocks of whole lines; each block is lowercased
+        once and searched for the first needle, and only the lines around
+        its hits are decoded. The usual criteria checks still run on every
+        yielded commit.
+
+        Args:
+            needles: Lowercased ASCII keywords from _literal_needles
+
+        Yields:
+            Commit data dictionaries, oldest first
+        """
+        # Blocks holding one of these must be decoded in full
+        markers = _needle_markers(needles)
+
+        for block in self._iter_line_blocks():
+            yield from self._scan_block(block, needles, markers)
+
+    def _scan_ranges(self) -> List[Tuple[int, Optional[int]]]:
+        """
+        Split the commits file into byte ranges for a parallel search.
+
+        Returns:
+            One (start, end) range per CPU when parallel_search is enabled
+            and the file has at least _PARALLEL_SCAN_MIN_SIZE bytes,
+            otherwise a single range covering the whole file (end None)
+        """
+        workers = os.cpu_count() or 1
+        if not self.parallel_search or workers < 2:
+            return [(0, None)]
+
+        size = self.commits_file.stat().st_size
+        if size < _PARALLEL_SCAN_MIN_SIZE:
+            return [(0, None)]
+
+        return [(i * size // workers, (i + 1) * size // workers) for i in range(workers)]
+
+    def _search_range(self, byte_range: Tuple[int, Optional[int]], search_criteria: Dict[str, Any],
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search the commits whose lines start within a byte range.
+
+        Runs in a worker process: the criteria are compiled there, since
+        the predicates themselves cannot be pickled.
+
+        Args:
+            byte_range: (start, end) byte offsets into the commits file,
+                end None for end of file
+            search_criteria: Search criteria, as passed to search_commits
+            limit: Maximum number of (most recent) matches to return (None for all)
+
+        Returns:
+            Matching commits in file order
+        """
+        matches = _all_of(self._compile_criteria(search_criteria))
+        needles = _literal_needles(search_criteria)
+        markers = _needle_markers(needles)
+
+        matching = deque(maxlen=limit or None)
+        for block in self._iter_line_blocks(*byte_range):
+            if needles:
+                commits = self._scan_block(block, needles, markers)
+            else:
+                commits = (loads(line) for line in block.split(b'\n') if line.strip())
+            matching.extend(filter(matches, commits))
+
+        return list(matching)
+
+    def _iter_line_blocks(self, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Read the commits file in blocks of whole lines.
+
+        A line belongs to the range its first byte falls in, so adjacent
+        ranges split the file between them without sharing or cutting a line.
+
+        Args:
+            start: Byte offset where the range begins
+            end: Byte offset where the range ends (None for end of file)
+
+        Yields:
+            Blocks of one or more lines, each ending with a newline
+        """
+        with open(self.commits_file, 'rb') as fh:
+            if start:
+                # Skip the rest of the line the previous range finishes
+                fh.seek(start - 1)
+                fh.readline()
+
+            position = fh.tell()
+            partial = b''
+            while end is None or position < end:
+                block = fh.read(_SCAN_CHUNK_SIZE if end is None else min(_SCAN_CHUNK_SIZE, end - position))
+                if not block:
+                    break
+
+                position += len(block)
+                block = partial + block
+                cut = block.rfind(b'\n') + 1
+                block, partial = block[:cut], block[cut:]
+                if block:
+                    yield block
+
+            # Finish a line that started inside the range but runs past its end
+            if partial:
+                partial += fh.readline()
+            if partial.strip():
+                yield partial if partial.endswith(b'\n') else partial + b'\n'
+
+    def _scan_block(self, block: bytes, needles: List[bytes], markers: tuple) -> Iterator[Dict[str, Any]]:
+        """
+        Decode the lines of a newline-terminated block that contain every needle.
+
+        Args:
+            block: Whole JSONL lines, ending with a newline
+            needles: Lowercased ASCII keywords
+            markers: Byte sequences that disable prefiltering for the block
+
+        Yields:
+            Commit data dictionaries in block order
+        """
+        lowered = block.lower()
+        first, rest = needles[0], needles[1:]
+
+        # Decode every line when most lines are hits anyway, or when a
+        # field could lowercase differently from its JSON text
+        if lowered.count(first) * 2 > block.count(b'\n') or any(marker in lowered for marker in markers):
+            for line in block.split(b'\n'):
+                if line.strip():
+                    yield loads(line)
+            return
+
+        position = lowered.find(first)
+        while position != -1:
+            start = lowered.rfind(b'\n', 0, position) + 1
+            end = lowered.index(b'\n', position)
+
+            if all(lowered.find(needle, start, end) != -1 for needle in rest):
+                yield loads(block[start:end])
+
+            position = lowered.find(first, end + 1)
+
     def _validate_commit_data(self, commit_data: Dict[str, Any]) -> None:
         """
         Validate commit data before writing.
@@ -201,9 +751,7 @@ class DataWriter:
         Raises:
             ValueError: If data is invalid
         """
-        required_fields = ['id', 'hash', 'author', 'message', 'timestamp', 'changed_files']
-
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in commit_data:
                 raise ValueError(f"Missing required field: {field}")
 
@@ -228,6 +776,23 @@ class DataWriter:
         if not isinstance(commit_data['changed_files'], list):
             raise ValueError("changed_files must be a list")
 
+    def _compile_criteria(self, criteria: Dict[str, Any]) -> List[Callable[[Dict[str, Any]], bool]]:
+        """
+        Compile search criteria into per-commit predicates.
+
+        Keywords are lowercased or compiled and date bounds parsed here,
+        once per query; criteria that are absent or empty produce no
+        predicate at all.
+
+        Args:
+            criteria: Search criteria
+
+        Returns:
+            Predicates a commit must all satisfy to match
+        """
+        compilers = (self._author_predicate, self._message_predicate, self._date_predicate, self._files_predicate)
+        return [predicate for predicate in (compile_(criteria) for compile_ in compilers) if predicate is not None]
+
     def _matches_criteria(self, commit: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """
         Check if a commit matches the search criteria.
@@ -239,71 +804,82 @@ class DataWriter:
         Returns:
             True if commit matches criteria, False otherwise
         """
-        if not self._matches_author_criteria(commit, criteria):
-            return False
-
-        if not self._matches_message_criteria(commit, criteria):
-            return False
-
-        if not self._matches_date_criteria(commit, criteria):
-            return False
-
-        if not self._matches_files_criteria(commit, criteria):
-            return False
-
-        return True
+        return _all_of(self._compile_criteria(criteria))(commit)
 
     def _matches_author_criteria(self, commit: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Check if commit matches author criteria."""
-        if 'author' not in criteria or not criteria['author']:
-            return True
-
-        author_match = (
-            criteria['author'].lower() in commit.get('author', '').lower()
-            or criteria['author'].lower() in commit.get('author_email', '').lower()
-        )
-        return author_match
+        predicate = self._author_predicate(criteria)
+        return predicate is None or predicate(commit)
 
     def _matches_message_criteria(self, commit: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Check if commit matches message criteria."""
-        if 'message' not in criteria or not criteria['message']:
-            return True
-
-        message_match = criteria['message'].lower() in commit.get('message', '').lower()
-        return message_match
+        predicate = self._message_predicate(criteria)
+        return predicate is None or predicate(commit)
 
     def _matches_date_criteria(self, commit: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Check if commit matches date criteria."""
-        if 'date_from' in criteria and criteria['date_from']:
-            try:
-                commit_date = datetime.fromisoformat(commit.get('commit_date', '').replace('Z', '+00:00'))
-                from_date = datetime.fromisoformat(criteria['date_from'].replace('Z', '+00:00'))
-                if commit_date < from_date:
-                    return False
-            except ValueError:
-                pass
-
-        if 'date_to' in criteria and criteria['date_to']:
-            try:
-                commit_date = datetime.fromisoformat(commit.get('commit_date', '').replace('Z', '+00:00'))
-                to_date = datetime.fromisoformat(criteria['date_to'].replace('Z', '+00:00'))
-                if commit_date > to_date:
-                    return False
-            except ValueError:
-                pass
-
-        return True
+        predicate = self._date_predicate(criteria)
+        return predicate is None or predicate(commit)
 
     def _matches_files_criteria(self, commit: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Check if commit matches files criteria."""
-        if 'files' not in criteria or not criteria['files']:
-            return True
-
-        files_match = any(
-            criteria['files'].lower() in file.lower()
-            for file in commit.get('changed_files', [])
+        predicate = self._files_predicate(criteria)
+        return predicate is None or predicate(commit)
+
+    def _author_predicate(self, criteria: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """Build the author/email substring predicate, if author is set."""
+        if not criteria.get('author'):
+            return None
+
+        needle = criteria['author'].lower()
+        return lambda commit: (
+            needle in commit.get('author', '').lower()
+            or needle in commit.get('author_email', '').lower()
         )
-        return files_match
+
+    def _message_predicate(self, criteria: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """Build the message keyword predicate, if message is set."""
+        if not criteria.get('message'):
+            return None
+
+        matcher = _keyword_matcher(criteria['message'])
+        return lambda commit: matcher(commit.get('message', ''))
+
+    def _date_predicate(self, criteria: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """
+        Build the commit date range predicate, if a valid bound is set.
+
+        Bounds are converted to epoch seconds once and compared against
+        the stored commit_ts; records written before commit_ts existed
+        fall back to parsing commit_date. Bounds that are not ISO dates
+        are ignored, and commits whose date cannot be parsed pass the check.
+        """
+        from_date = _parse_iso_date(criteria.get('date_from'))
+        to_date = _parse_iso_date(criteria.get('date_to'))
+        if from_date is None and to_date is None:
+            return None
+
+        from_ts = from_date.timestamp() if from_date is not None else float('-inf')
+        to_ts = to_date.timestamp() if to_date is not None else float('inf')
+
+        def in_range(commit: Dict[str, Any]) -> bool:
+            commit_ts = commit.get('commit_ts')
+            if commit_ts is None:
+                commit_date = _parse_iso_date(commit.get('commit_date', ''))
+                if commit_date is None:
+                    return True
+                commit_ts = commit_date.timestamp()
+            return from_ts <= commit_ts <= to_ts
+
+        return in_range
+
+    def _files_predicate(self, criteria: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """Build the changed files keyword predicate, if files is set."""
+        if not criteria.get('files'):
+            return None
+
+        matcher = _keyword_matcher(criteria['files'])
+        return lambda commit: any(matcher(file) for file in commit.get('changed_files', []))
 
     def _ensure_data_store_exists(self) -> None:
         """Ensure the data store directory structure exists."""
@@ -317,12 +893,58 @@ class DataWriter:
             logger.error(f"Failed to create data store directory: {e}")
             raise
 
+    def _open_append(self) -> int:
+        """Open the commits file for appending, creating it if needed."""
+        self._ensure_commits_file_exists()
+        return os.open(self.commits_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _append(self, data: bytes) -> None:
+        """
+        Append encoded JSONL records to the commits file.
+
+        The bytes go straight to the descriptor with os.write, without a
+        Python buffer or text layer. O_APPEND moves the offset to the end
+        of the file atomically with each write, so concurrent writers never
+        overwrite each other's records, and one write() call is not
+        interleaved with others on local Linux filesystems (POSIX's
+        PIPE_BUF guarantee formally covers pipes only).
+
+        Args:
+            data: Newline-terminated records
+        """
+        owned = self._fd is None
+        fd = self._open_append() if owned else self._fd
+
+        try:
+            view = memoryview(data)
+            # A regular file write may be partial; continue from where it stopped
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            if owned:
+                os.close(fd)
+
+    def _no_commits_file_result(self, **empty: Any) -> Dict[str, Any]:
+        """Build the successful, empty result returned when there is no commits file."""
+        return {
+            'status': 'success',
+            **empty,
+            'message': 'No commits file found'
+        }
+
+    def _commits_file_exists(self) -> bool:
+        """Check whether the commits file exists, remembering a positive answer."""
+        if not self._commits_file_seen:
+            self._commits_file_seen = self.commits_file.exists()
+        return self._commits_file_seen
+
     def _ensure_commits_file_exists(self) -> None:
         """Ensure the commits JSONL file exists."""
         try:
-            if not self.commits_file.exists():
+            if not self._commits_file_exists():
                 # Create empty file
                 self.commits_file.touch()
+                self._commits_file_seen = True
                 logger.info(f"Created commits file: {self.commits_file}")
 
         except Exception as e:
@@ -6,7 +6,6 @@ This module handles Git repository interaction and commit metadata extraction.
 
 import os
 import subprocess
-from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 import json
@@ -16,6 +15,13 @@ from shared.utils.error_handler import handle_error
 
 logger = get_logger(__name__)
 
+# `git log` layout for batch extraction: each record starts with a record
+# separator, fields are split by unit separators and --numstat lines follow.
+# The author date is emitted both as ISO 8601 (%aI) and epoch seconds (%at)
+_RECORD_SEP = '\x1e'
+_FIELD_SEP = '\x1f'
+_LOG_FORMAT = '--format=format:%x1e%H%x1f%an%x1f%ae%x1f%aI%x1f%at%x1f%s%x1f%b%x1f'
+
 
 class GitParser:
     """
@@ -38,6 +44,29 @@ class GitParser:
         self.repo_path = Path(repo_path) if isinstance(repo_path, str) else repo_path
         self.git_dir = self.repo_path / '.git'
         
+        # Long-lived `git cat-file --batch-check`, started on first lookup
+        self._batch_check_process: Optional[subprocess.Popen] = None
+        
+    def __del__(self):
+        """Stop the object lookup process when the parser is collected."""
+        if getattr(self, '_batch_check_process', None) is not None:
+            self.close()
+    
+    def close(self) -> None:
+        """Stop the object lookup process, if one was started."""
+        process, self._batch_check_process = self._batch_check_process, None
+        if process is None:
+            return
+        
+        try:
+            # EOF on stdin makes cat-file exit
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+        finally:
+            process.stdout.close()
+    
     def is_git_repository(self) -> bool:
         """
         Check if the current directory is a Git repository.
@@ -46,7 +75,8 @@ class GitParser:
             True if Git repository exists, False otherwise
         """
         try:
-            return self.git_dir.exists() and self.git_dir.is_dir()
+            # is_dir() is a single stat and is False when .git is missing
+            return self.git_dir.is_dir()
         except Exception as e:
             logger.error(f"Error checking Git repository: {e}")
             return False
@@ -64,19 +94,12 @@ class GitParser:
         try:
             logger.info(f"Extracting latest commit from: {self.repo_path}")
             
-            # Get commit hash
-            commit_hash = self._run_git_command(['rev-parse', 'HEAD']).strip()
-            
-            # Get commit metadata
-            commit_data = self._get_commit_metadata(commit_hash)
-            
-            # Get changed files
-            changed_files = self._get_changed_files(commit_hash)
-            commit_data['changed_files'] = changed_files
-            
-            # Get commit statistics
-            stats = self._get_commit_stats(commit_hash)
-            commit_data.update(stats)
+            # Metadata, changed files and statistics from a single git call
+            output = self._run_git_command([
+                'log', '-1', '--no-renames', '--numstat', _LOG_FORMAT, 'HEAD'
+            ])
+            commit_data = self._parse_log_record(output.lstrip(_RECORD_SEP))
+            commit_hash = commit_data['hash']
             
             logger.info(f"Successfully extracted commit: {commit_hash[:8]}")
             
@@ -107,16 +130,11 @@ class GitParser:
             if not self._commit_exists(commit_hash):
                 raise GitCommandError(f"Commit {commit_hash} not found")
             
-            # Get commit metadata
-            commit_data = self._get_commit_metadata(commit_hash)
-            
-            # Get changed files
-            changed_files = self._get_changed_files(commit_hash)
-            commit_data['changed_files'] = changed_files
-            
-            # Get commit statistics
-            stats = self._get_commit_stats(commit_hash)
-            commit_data.update(stats)
+            # Metadata, changed files and statistics from a single git call
+            output = self._run_git_command([
+                'log', '-1', '--no-renames', '--numstat', _LOG_FORMAT, commit_hash
+            ])
+            commit_data = self._parse_log_record(output.lstrip(_RECORD_SEP))
             
             logger.info(f"Successfully extracted commit: {commit_hash[:8]}")
             
@@ -127,6 +145,43 @@ class GitParser:
             logger.error(f"Failed to extract commit {commit_hash}: {error_result['error']}")
             raise GitCommandError(f"Failed to extract commit {commit_hash}: {error_result['error']}")
     
+    def get_commits_since(self, rev: str) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for every commit after a revision, up to HEAD.
+        
+        All commits are read with a single `git log` call instead of
+        several git commands per commit.
+        
+        Args:
+            rev: Revision to start after (exclusive)
+            
+        Returns:
+            List of commit metadata dicts, oldest first
+            
+        Raises:
+            GitCommandError: If Git command fails
+        """
+        try:
+            logger.info(f"Extracting commits since {rev} from: {self.repo_path}")
+            
+            output = self._run_git_command([
+                'log', '--reverse', '--no-renames', '--numstat', _LOG_FORMAT, f'{rev}..HEAD'
+            ])
+            
+            commits = [
+                self._parse_log_record(record)
+                for record in output.split(_RECORD_SEP) if record.strip()
+            ]
+            
+            logger.info(f"Successfully extracted {len(commits)} commits since {rev}")
+            
+            return commits
+            
+        except Exception as e:
+            error_result = handle_error(e, "git_parser.get_commits_since")
+            logger.error(f"Failed to extract commits since {rev}: {error_result['error']}")
+            raise GitCommandError(f"Failed to extract commits since {rev}: {error_result['error']}")
+    
     def get_repository_info(self) -> Dict[str, Any]:
         """
         Get general information about the Git repository.
@@ -150,113 +205,47 @@ class GitParser:
             logger.error(f"Failed to get repository info: {error_result['error']}")
             return {'error': error_result['error']}
     
-    def _get_commit_metadata(self, commit_hash: str) -> Dict[str, Any]:
+    def _parse_log_record(self, record: str) -> Dict[str, Any]:
         """
-        Extract basic commit metadata.
+        Parse one `git log` record produced with _LOG_FORMAT and --numstat.
         
         Args:
-            commit_hash: Git commit hash
+            record: Record text without the leading record separator
             
         Returns:
-            Dict containing commit metadata
+            Dict containing commit metadata, changed files and statistics
         """
-        # Get commit details using git show
-        commit_info = self._run_git_command([
-            'show', '--format=format:%H%n%an%n%ae%n%ad%n%s%n%b', 
-            '--no-patch', commit_hash
-        ]).split('\n')
+        hash_value, author_name, author_email, commit_date, commit_ts, subject, body, numstat = record.split(_FIELD_SEP, 7)
         
-        # Parse commit information
-        hash_value = commit_info[0]
-        author_name = commit_info[1]
-        author_email = commit_info[2]
-        commit_date = commit_info[3]
-        subject = commit_info[4]
-        body = '\n'.join(commit_info[5:]) if len(commit_info) > 5 else ''
+        changed_files = []
+        insertions = 0
+        deletions = 0
         
-        # Parse commit date
-        try:
-            parsed_date = datetime.strptime(commit_date, '%a %b %d %H:%M:%S %Y %z')
-            formatted_date = parsed_date.isoformat()
-        except ValueError:
-            formatted_date = commit_date
+        for line in numstat.splitlines():
+            parts = line.split('\t', 2)
+            if len(parts) != 3:
+                continue
+            added, removed, path = parts
+            changed_files.append(path)
+            # Binary files report "-" instead of line counts
+            if added.isdigit():
+                insertions += int(added)
+            if removed.isdigit():
+                deletions += int(removed)
         
         return {
-            'hash': hash_value,
+            'hash': hash_value.strip(),
             'author': author_name,
             'author_email': author_email,
-            'commit_date': formatted_date,
+            'commit_date': commit_date,
+            'commit_ts': int(commit_ts),
             'message': subject,
-            'body': body.strip()
+            'body': body.strip(),
+            'changed_files': changed_files,
+            'insertions': insertions,
+            'deletions': deletions
         }
     
-    def _get_changed_files(self, commit_hash: str) -> List[str]:
-        """
-        Get list of files changed in the commit.
-        
-        Args:
-            commit_hash: Git commit hash
-            
-        Returns:
-            List of changed file paths
-        """
-        try:
-            # Get list of changed files
-            files_output = self._run_git_command([
-                'show', '--name-only', '--format=format:', commit_hash
-            ]).strip()
-            
-            if files_output:
-                return [f.strip() for f in files_output.split('\n') if f.strip()]
-            else:
-                return []
-                
-        except Exception as e:
-            logger.warning(f"Failed to get changed files for commit {commit_hash}: {e}")
-            return []
-    
-    def _get_commit_stats(self, commit_hash: str) -> Dict[str, int]:
-        """
-        Get commit statistics (insertions, deletions).
-        
-        Args:
-            commit_hash: Git commit hash
-            
-        Returns:
-            Dict containing insertions and deletions
-        """
-        try:
-            # Get commit statistics
-            stats_output = self._run_git_command([
-                'show', '--stat', '--format=format:', commit_hash
-            ])
-            
-            # Parse statistics (simplified parsing)
-            lines = stats_output.strip().split('\n')
-            insertions = 0
-            deletions = 0
-            
-            for line in lines:
-                if 'insertions' in line or 'deletions' in line:
-                    # Extract numbers from line like " 2 files changed, 10 insertions(+), 5 deletions(-)"
-                    # or " 1 file changed, 3 insertions(+)" or " 1 file changed, 2 deletions(-)"
-                    parts = line.split(',')
-                    for part in parts:
-                        if 'insertions' in part:
-                            insertions = int(''.join(filter(str.isdigit, part)))
-                        elif 'deletions' in part:
-                            deletions = int(''.join(filter(str.isdigit, part)))
-                    break
-            
-            return {
-                'insertions': insertions,
-                'deletions': deletions
-            }
-            
-        except Exception as e:
-            logger.warning(f"Failed to get commit stats for commit {commit_hash}: {e}")
-            return {'insertions': 0, 'deletions': 0}
-    
     def _run_git_command(self, args: List[str]) -> str:
         """
         Execute a Git command and return the output.
@@ -271,17 +260,19 @@ class GitParser:
             GitCommandError: If command fails
         """
         try:
+            # Raw bytes decoded in one pass: text=True would also run two
+            # newline-translation passes over the whole output, and decode
+            # with the locale encoding rather than git's UTF-8
             result = subprocess.run(
                 ['git'] + args,
                 cwd=self.repo_path,
                 capture_output=True,
-                text=True,
                 check=True
             )
-            return result.stdout
+            return result.stdout.decode('utf-8', errors='replace')
             
         except subprocess.CalledProcessError as e:
-            error_msg = f"Git command failed: {' '.join(['git'] + args)} - {e.stderr}"
+            error_msg = f"Git command failed: {' '.join(['git'] + args)} - {(e.stderr or b'').decode('utf-8', errors='replace')}"
             logger.error(error_msg)
             raise GitCommandError(error_msg)
         except FileNotFoundError:
@@ -299,12 +290,60 @@ class GitParser:
         Returns:
             True if commit exists, False otherwise
         """
+        try:
+            return self._batch_check(commit_hash) is not None
+        except OSError as e:
+            # Lookup process unavailable: fall back to a one-off git call
+            logger.warning(f"git cat-file --batch-check failed, using cat-file -e: {e}")
+            self.close()
+        
         try:
             self._run_git_command(['cat-file', '-e', commit_hash])
             return True
         except GitCommandError:
             return False
     
+    def _batch_check(self, name: str) -> Optional[str]:
+        """
+        Look up an object through the long-lived `git cat-file --batch-check`.
+        
+        The process is started on first use and answers each lookup over
+        its pipes, instead of a new git process per lookup.
+        
+        Args:
+            name: Object name (hash or revision expression)
+            
+        Returns:
+            Object type, or None if the name is missing or ambiguous
+            
+        Raises:
+            OSError: If the lookup process cannot be started or has exited
+        """
+        # A newline would split the request into two lookups
+        if '\n' in name:
+            return None
+        
+        process = self._batch_check_process
+        if process is None or process.poll() is not None:
+            process = self._batch_check_process = subprocess.Popen(
+                ['git', 'cat-file', '--batch-check'],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        
+        process.stdin.write(name.encode('utf-8') + b'\n')
+        process.stdin.flush()
+        response = process.stdout.readline()
+        if not response:
+            raise OSError("git cat-file --batch-check exited")
+        
+        # "<oid> <type> <size>" when found, "<name> missing" otherwise
+        if response.endswith((b' missing\n', b' ambiguous\n')):
+            return None
+        return response.split()[1].decode('ascii')
+    
     def _get_remote_url(self) -> Optional[str]:
         """Get the remote URL of the repository."""
         try:
@@ -6,16 +6,19 @@ This package contains shared utility functions and classes.
 
 # Import and expose the main modules
 try:
-    from . import logger, error_handler
+    from . import logger, error_handler, json_utils
     from .logger import Logger
     from .error_handler import ErrorHandler, CraftNudgeError
+    from .json_utils import dumps_bytes
     
     __all__ = [
         'logger',
         'error_handler',
+        'json_utils',
         'Logger',
         'ErrorHandler',
-        'CraftNudgeError'
+        'CraftNudgeError',
+        'dumps_bytes'
     ]
 except ImportError:
     # Handle case where modules might not be available
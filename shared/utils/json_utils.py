@@ -0,0 +1,49 @@
+"""
+Shared JSON Utility - User Story 2.1.1: Behavior Tracker – Git Commit Logger
+
+This module provides JSON encoding and decoding that uses orjson when it is
+installed and the standard library json module otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Decoder for JSON text or bytes
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes.
+
+    Both encoders produce the same output: compact separators (or a two
+    space indent) and non-ASCII characters written as UTF-8 rather than
+    escaped. Values orjson cannot encode (e.g. integers above 64 bits) are
+    retried with the json module.
+
+    Args:
+        obj: Object to encode
+        indent: Indent the output by two spaces
+
+    Returns:
+        Encoded JSON, without a trailing newline
+
+    Raises:
+        TypeError: If the object cannot be encoded as JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            # orjson.JSONEncodeError; the json module may still manage
+            pass
+
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,254 @@
+"""
+Unit tests for cli/utils/cli_helpers.py module.
+
+Tests timestamp formatting, commit statistics, exports and the result cache.
+"""
+
+import csv
+import json
+import os
+import subprocess
+import time
+
+import pytest
+
+# Import the module under test
+from cli.utils.cli_helpers import (
+    calculate_commit_stats,
+    export_commits_to_format,
+    format_timestamp,
+    get_repository_cache_key,
+    load_cached_result,
+    store_cached_result,
+    _format_iso_timestamp
+)
+
+
+@pytest.fixture
+def new_york_time():
+    """Run the test with the local time zone set to America/New_York."""
+    original = os.environ.get('TZ')
+    os.environ['TZ'] = 'America/New_York'
+    time.tzset()
+    _format_iso_timestamp.cache_clear()
+    yield
+    if original is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = original
+    time.tzset()
+    _format_iso_timestamp.cache_clear()
+
+
+class TestFormatTimestamp:
+    """Test cases for format_timestamp."""
+
+    @pytest.mark.skipif(not hasattr(time, 'tzset'), reason="time.tzset required")
+    def test_local_offset_follows_dst(self, new_york_time):
+        """Test winter and summer dates get their own local UTC offset."""
+        assert format_timestamp('2024-01-15T12:00:00Z') == '2024-01-15 07:00'
+        assert format_timestamp('2024-07-15T12:00:00+00:00') == '2024-07-15 08:00'
+
+    @pytest.mark.parametrize("timestamp,expected", [
+        ('', 'N/A'),
+        (None, 'N/A'),
+        ('not a date', 'not a date'),
+        ('2024-13-45T99:00:00', '2024-13-45T99:00:00'),
+        (1700000000, '1700000000'),
+        (['2024-01-01'], "['2024-01-01']")
+    ])
+    def test_invalid_timestamps(self, timestamp, expected):
+        """Test empty, unparseable and non-string timestamps do not raise."""
+        assert format_timestamp(timestamp) == expected
+
+
+class TestCalculateCommitStats:
+    """Test cases for calculate_commit_stats."""
+
+    def setup_method(self):
+        """Create sample commits."""
+        self.commits = [
+            {'author': 'Alice', 'commit_date': '2024-01-01T10:00:00+00:00', 'insertions': 10, 'deletions': 2,
+             'changed_files': ['a.py', 'b.py']},
+            {'author': 'Bob', 'commit_date': '2024-01-01T18:00:00+00:00', 'insertions': 5, 'deletions': 0,
+             'changed_files': ['a.py']},
+            {'author': 'Alice', 'commit_date': '2024-01-02T09:00:00+00:00', 'insertions': 1, 'deletions': 4,
+             'changed_files': ['a.py', 'c.py']}
+        ]
+
+    def test_stats_single_pass(self):
+        """Test every statistic is gathered from one pass over an iterator."""
+        stats = calculate_commit_stats(iter(self.commits))
+
+        assert stats == {
+            'total_commits': 3,
+            'commits_per_author': {'Alice': 2, 'Bob': 1},
+            'commits_per_day': {'2024-01-01': 2, '2024-01-02': 1},
+            'total_insertions': 16,
+            'total_deletions': 6,
+            'total_files_changed': 5,
+            'top_changed_files': {'a.py': 3, 'b.py': 1, 'c.py': 1}
+        }
+
+    def test_stats_top_files_limit(self):
+        """Test only the most changed files are reported."""
+        stats = calculate_commit_stats(self.commits, top_files=1)
+
+        assert stats['top_changed_files'] == {'a.py': 3}
+
+    def test_stats_missing_fields(self):
+        """Test commits with missing or None fields are counted without errors."""
+        stats = calculate_commit_stats([{}, {'author': None, 'insertions': None, 'changed_files': None}])
+
+        assert stats['total_commits'] == 2
+        assert stats['commits_per_author'] == {'N/A': 2}
+        assert stats['commits_per_day'] == {}
+        assert stats['total_insertions'] == 0
+        assert stats['total_files_changed'] == 0
+
+    def test_stats_no_commits(self):
+        """Test an empty input produces zeroed statistics."""
+        stats = calculate_commit_stats([])
+
+        assert stats['total_commits'] == 0
+        assert stats['commits_per_author'] == {}
+        assert stats['top_changed_files'] == {}
+
+
+class TestExportCommitsToFormat:
+    """Test cases for export_commits_to_format."""
+
+    def setup_method(self):
+        """Create sample commits."""
+        self.commits = [
+            {'hash': 'abc123', 'author': 'Alice', 'commit_date': '2024-01-01T10:00:00+00:00',
+             'message': 'Fix bug\n\nLonger body', 'insertions': 10, 'deletions': 2,
+             'changed_files': ['a.py', 'b.py']},
+            {'hash': 'def456', 'author': 'José', 'commit_date': '2024-01-02T09:00:00+00:00',
+             'message': 'Add "quoted", feature', 'changed_files': []}
+        ]
+
+    def test_export_csv(self, tmp_path):
+        """Test CSV export writes a header and one flattened row per commit."""
+        output_path = tmp_path / 'out' / 'commits.csv'
+
+        assert export_commits_to_format(iter(self.commits), 'CSV', str(output_path)) is True
+
+        with open(output_path, encoding='utf-8', newline='') as file:
+            rows = list(csv.reader(file))
+        assert rows == [
+            ['hash', 'author', 'commit_date', 'message', 'insertions', 'deletions', 'changed_files'],
+            ['abc123', 'Alice', '2024-01-01T10:00:00+00:00', 'Fix bug  Longer body', '10', '2', 'a.py|b.py'],
+            ['def456', 'José', '2024-01-02T09:00:00+00:00', 'Add "quoted", feature', '0', '0', '']
+        ]
+
+    def test_export_json(self, tmp_path):
+        """Test JSON export streams a single array of the commits."""
+        output_path = tmp_path / 'commits.json'
+
+        assert export_commits_to_format(iter(self.commits), 'json', str(output_path)) is True
+
+        assert json.loads(output_path.read_text(encoding='utf-8')) == self.commits
+
+    def test_export_json_empty(self, tmp_path):
+        """Test JSON export of no commits writes an empty array."""
+        output_path = tmp_path / 'commits.json'
+
+        assert export_commits_to_format([], 'json', str(output_path)) is True
+
+        assert json.loads(output_path.read_text(encoding='utf-8')) == []
+
+    def test_export_jsonl(self, tmp_path):
+        """Test JSONL export writes one JSON object per line."""
+        output_path = tmp_path / 'commits.jsonl'
+
+        assert export_commits_to_format(iter(self.commits), 'jsonl', str(output_path)) is True
+
+        lines = output_path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == self.commits
+
+    def test_export_unsupported_format(self, tmp_path):
+        """Test an unknown format is rejected without creating a file."""
+        output_path = tmp_path / 'commits.xml'
+
+        assert export_commits_to_format(self.commits, 'xml', str(output_path)) is False
+        assert not output_path.exists()
+
+    def test_export_unwritable_path(self, tmp_path):
+        """Test a path that cannot be written returns False."""
+        blocker = tmp_path / 'file'
+        blocker.write_text('')
+
+        assert export_commits_to_format(self.commits, 'jsonl', str(blocker / 'commits.jsonl')) is False
+
+
+class TestRepositoryResultCache:
+    """Test cases for the repository result cache."""
+
+    GIT_IDENTITY = ['-c', 'user.name=Test Author', '-c', 'user.email=test@example.com']
+
+    @pytest.fixture
+    def repo_path(self, tmp_path):
+        """Create a Git repository with one commit."""
+        subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+        self._git(tmp_path, 'commit', '-q', '--allow-empty', '-m', 'Initial')
+        return str(tmp_path)
+
+    def _git(self, repo_path, *args):
+        """Run a git command in the repository."""
+        subprocess.run(['git', *self.GIT_IDENTITY, *args], cwd=repo_path, check=True)
+
+    def test_cache_hit(self, repo_path):
+        """Test a stored result is returned while the repository is unchanged."""
+        result = {'status': 'success', 'repository_info': {'branch': 'main'}}
+        store_cached_result(repo_path, 'info', get_repository_cache_key(repo_path), result)
+
+        assert load_cached_result(repo_path, 'info', get_repository_cache_key(repo_path)) == result
+
+    def test_cache_file_in_git_dir(self, repo_path):
+        """Test the cache file is kept inside the repository's .git directory."""
+        store_cached_result(repo_path, 'info', get_repository_cache_key(repo_path), {'status': 'success'})
+
+        assert os.path.isfile(os.path.join(repo_path, '.git', 'craftnudge-info.json'))
+
+    def test_cache_miss_on_head_change(self, repo_path):
+        """Test a new commit invalidates the cached result."""
+        old_key = get_repository_cache_key(repo_path)
+        store_cached_result(repo_path, 'info', old_key, {'status': 'success'})
+
+        self._git(repo_path, 'commit', '-q', '--allow-empty', '-m', 'Second')
+        new_key = get_repository_cache_key(repo_path)
+
+        assert new_key['head'] != old_key['head']
+        assert load_cached_result(repo_path, 'info', new_key) is None
+
+    def test_cache_miss_on_index_change(self, repo_path):
+        """Test staging a file invalidates the cached result."""
+        old_key = get_repository_cache_key(repo_path)
+        store_cached_result(repo_path, 'info', old_key, {'status': 'success'})
+
+        with open(os.path.join(repo_path, 'new_file.py'), 'w') as file:
+            file.write('print("hello")\n')
+        self._git(repo_path, 'add', 'new_file.py')
+        # Make sure the index mtime differs even on coarse-grained filesystems
+        index_file = os.path.join(repo_path, '.git', 'index')
+        os.utime(index_file, ns=(old_key['index_mtime'] + 10 ** 9, old_key['index_mtime'] + 10 ** 9))
+        new_key = get_repository_cache_key(repo_path)
+
+        assert new_key['head'] == old_key['head']
+        assert load_cached_result(repo_path, 'info', new_key) is None
+
+    def test_cache_miss_on_other_kind_and_corrupt_file(self, repo_path):
+        """Test lookups of another kind or of an unreadable cache file miss."""
+        cache_key = get_repository_cache_key(repo_path)
+        store_cached_result(repo_path, 'info', cache_key, {'status': 'success'})
+
+        assert load_cached_result(repo_path, 'other', cache_key) is None
+
+        with open(os.path.join(repo_path, '.git', 'craftnudge-info.json'), 'w') as file:
+            file.write('{not json')
+        assert load_cached_result(repo_path, 'info', cache_key) is None
+
+    def test_no_cache_key_outside_repository(self, tmp_path):
+        """Test a directory without .git has no cache key."""
+        assert get_repository_cache_key(str(tmp_path)) is None
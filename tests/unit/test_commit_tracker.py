@@ -14,7 +14,7 @@ from typing import Dict, Any
 
 # Import the module under test
 from services.commit_tracker_service.src.commit_tracker import (
-    CommitTracker, GitRepositoryError, CommitExtractionError
+    CommitTracker, GitRepositoryError, CommitExtractionError, _uuid_stream
 )
 
 
@@ -410,6 +410,131 @@ class TestCommitTracker:
         mock_handle_error.assert_called_once()
         mock_logger.error.assert_called()
 
+    @patch('services.commit_tracker_service.src.commit_tracker.DataWriter')
+    @patch('services.commit_tracker_service.src.commit_tracker.GitParser')
+    @patch('services.commit_tracker_service.src.commit_tracker.logger')
+    def test_log_commits_since_success(self, mock_logger, mock_git_parser, mock_data_writer):
+        """Test log_commits_since logs the batch with one parser and one writer call."""
+        mock_git_parser_instance = MagicMock()
+        mock_git_parser.return_value = mock_git_parser_instance
+        mock_git_parser_instance.is_git_repository.return_value = True
+        
+        mock_data_writer_instance = MagicMock()
+        mock_data_writer.return_value = mock_data_writer_instance
+        mock_data_writer_instance.write_commits.return_value = {'status': 'success'}
+        
+        commits = [
+            {
+                'hash': f'abc123def45{i}',
+                'author': 'Test Author',
+                'message': f'Commit {i}',
+                'changed_files': ['file1.py']
+            }
+            for i in range(3)
+        ]
+        mock_git_parser_instance.get_commits_since.return_value = commits
+        
+        tracker = CommitTracker("/test/repo")
+        tracker._uuids = iter([f'87654321-4321-4321-4321-cba98765432{i}' for i in range(3)])
+        result = tracker.log_commits_since('v1.0')
+        
+        mock_git_parser_instance.get_commits_since.assert_called_once_with('v1.0')
+        mock_data_writer_instance.write_commits.assert_called_once_with(commits)
+        mock_data_writer_instance.write_commit.assert_not_called()
+        
+        assert result['status'] == 'success'
+        assert result['count'] == 3
+        assert [c['id'] for c in result['commits']] == [f'87654321-4321-4321-4321-cba98765432{i}' for i in range(3)]
+        assert len({c['timestamp'] for c in result['commits']}) == 1
+
+    @patch('services.commit_tracker_service.src.commit_tracker.DataWriter')
+    @patch('services.commit_tracker_service.src.commit_tracker.GitParser')
+    def test_log_commits_since_no_new_commits(self, mock_git_parser, mock_data_writer):
+        """Test log_commits_since with nothing to log."""
+        mock_git_parser_instance = MagicMock()
+        mock_git_parser.return_value = mock_git_parser_instance
+        mock_git_parser_instance.is_git_repository.return_value = True
+        mock_git_parser_instance.get_commits_since.return_value = []
+        
+        tracker = CommitTracker("/test/repo")
+        result = tracker.log_commits_since('HEAD')
+        
+        assert result['status'] == 'success'
+        assert result['count'] == 0
+        mock_data_writer.return_value.write_commits.assert_not_called()
+
+    @patch('services.commit_tracker_service.src.commit_tracker.GitParser')
+    @patch('services.commit_tracker_service.src.commit_tracker.logger')
+    def test_log_commits_since_no_git_repository(self, mock_logger, mock_git_parser):
+        """Test log_commits_since when no Git repository is found."""
+        mock_git_parser_instance = MagicMock()
+        mock_git_parser.return_value = mock_git_parser_instance
+        mock_git_parser_instance.is_git_repository.return_value = False
+        
+        tracker = CommitTracker("/test/repo")
+        result = tracker.log_commits_since('v1.0')
+        
+        assert result['status'] == 'error'
+        mock_git_parser_instance.get_commits_since.assert_not_called()
+
+    @patch('services.commit_tracker_service.src.commit_tracker.GitParser')
+    def test_repository_check_is_cached(self, mock_git_parser):
+        """Test the Git repository check runs once per tracker."""
+        mock_git_parser_instance = MagicMock()
+        mock_git_parser.return_value = mock_git_parser_instance
+        mock_git_parser_instance.is_git_repository.return_value = False
+        
+        tracker = CommitTracker("/test/repo")
+        tracker.get_repository_info()
+        tracker.log_latest_commit()
+        tracker.log_commit_by_hash("abc123def456")
+        
+        mock_git_parser_instance.is_git_repository.assert_called_once()
+
+    @patch('services.commit_tracker_service.src.commit_tracker.GitParser')
+    def test_invalidate_repo_cache(self, mock_git_parser):
+        """Test invalidate_repo_cache forces the repository to be re-checked."""
+        mock_git_parser_instance = MagicMock()
+        mock_git_parser.return_value = mock_git_parser_instance
+        mock_git_parser_instance.is_git_repository.side_effect = [False, True]
+        mock_git_parser_instance.get_repository_info.return_value = {}
+        
+        tracker = CommitTracker("/test/repo")
+        assert tracker.get_repository_info()['status'] == 'error'
+        
+        tracker.invalidate_repo_cache()
+        assert tracker.get_repository_info()['status'] == 'success'
+        assert mock_git_parser_instance.is_git_repository.call_count == 2
+
+
+class TestUuidStream:
+    """Test cases for the pooled UUID generator."""
+
+    def test_uuid_stream_yields_unique_v4_uuids(self):
+        """Test _uuid_stream yields valid, distinct version 4 UUIDs across blocks."""
+        stream = _uuid_stream(chunk_size=32)
+        ids = [next(stream) for _ in range(5)]
+        
+        assert len(set(ids)) == 5
+        for value in ids:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == value
+
+    @patch('services.commit_tracker_service.src.commit_tracker.os.urandom')
+    def test_uuid_stream_reads_random_bytes_per_block(self, mock_urandom):
+        """Test _uuid_stream reads one block of random bytes per chunk_size // 16 UUIDs."""
+        mock_urandom.side_effect = lambda size: bytes(size)
+        stream = _uuid_stream(chunk_size=64)
+        
+        for _ in range(4):
+            next(stream)
+        assert mock_urandom.call_count == 1
+        
+        next(stream)
+        assert mock_urandom.call_count == 2
+
 
 class TestGitRepositoryError:
     """Test cases for GitRepositoryError exception."""
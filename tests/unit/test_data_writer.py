@@ -6,15 +6,16 @@ Tests data writing, reading, and searching functionality.
 
 import pytest
 import json
+import os
+import re
 import tempfile
-import jsonlines
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open, call
+from unittest.mock import patch, mock_open, call
 from typing import Dict, Any, List
 
 # Import the module under test
-from services.commit_tracker_service.src.data_writer import DataWriter
+from services.commit_tracker_service.src.data_writer import DataWriter, _literal_needles
 
 
 class TestDataWriter:
@@ -286,9 +287,11 @@ class TestDataWriter:
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_commits_file_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
+    @patch('services.commit_tracker_service.src.data_writer.os.close')
+    @patch('services.commit_tracker_service.src.data_writer.os.write', side_effect=lambda fd, data: len(data))
+    @patch('services.commit_tracker_service.src.data_writer.os.open', return_value=7)
     @patch('services.commit_tracker_service.src.data_writer.logger')
-    def test_write_commit_success(self, mock_logger, mock_jsonlines_open, mock_ensure_file, mock_ensure_dir, mock_get_config):
+    def test_write_commit_success(self, mock_logger, mock_os_open, mock_os_write, mock_os_close, mock_ensure_file, mock_ensure_dir, mock_get_config):
         """Test write_commit with successful execution."""
         mock_get_config.return_value = self.mock_config
         
@@ -306,17 +309,20 @@ class TestDataWriter:
             'deletions': 5
         }
         
-        # Mock jsonlines writer
-        mock_writer = MagicMock()
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_writer
-        
         data_writer = DataWriter()
         result = data_writer.write_commit(commit_data)
         
-        # Verify calls
+        # Verify calls: one O_APPEND open, one write of the whole line, one close
         mock_ensure_file.assert_called_once()
-        mock_jsonlines_open.assert_called_once_with(data_writer.commits_file, mode='a')
-        mock_writer.write.assert_called_once_with(commit_data)
+        mock_os_open.assert_called_once()
+        assert mock_os_open.call_args[0][0] == data_writer.commits_file
+        assert mock_os_open.call_args[0][1] & os.O_APPEND
+        mock_os_write.assert_called_once()
+        fd, data = mock_os_write.call_args[0]
+        assert fd == 7
+        assert bytes(data).endswith(b'\n')
+        assert json.loads(bytes(data)) == commit_data
+        mock_os_close.assert_called_once_with(7)
         
         # Verify result
         assert result['status'] == 'success'
@@ -324,6 +330,39 @@ class TestDataWriter:
         assert "written successfully" in result['message']
         mock_logger.info.assert_called()
 
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_commits_file_exists')
+    @patch('services.commit_tracker_service.src.data_writer.os.close')
+    @patch('services.commit_tracker_service.src.data_writer.os.write', side_effect=lambda fd, data: len(data))
+    @patch('services.commit_tracker_service.src.data_writer.os.open', return_value=7)
+    @patch('services.commit_tracker_service.src.data_writer.logger')
+    def test_write_commit_reuses_context_handle(self, mock_logger, mock_os_open, mock_os_write, mock_os_close, mock_ensure_file, mock_ensure_dir, mock_get_config):
+        """Test writes inside a with block share one append descriptor."""
+        mock_get_config.return_value = self.mock_config
+        
+        commit_data = {
+            'id': '12345678-1234-1234-1234-123456789abc',
+            'hash': 'abc123def456',
+            'author': 'Test Author',
+            'message': 'Test commit',
+            'timestamp': '2023-01-01T12:00:00+00:00',
+            'changed_files': ['file1.py']
+        }
+        
+        data_writer = DataWriter()
+        with data_writer as writer:
+            assert writer is data_writer
+            for _ in range(3):
+                assert data_writer.write_commit(commit_data)['status'] == 'success'
+            data_writer.write_commits([commit_data])
+        
+        mock_os_open.assert_called_once()
+        assert mock_os_write.call_count == 4
+        assert all(call_args[0][0] == 7 for call_args in mock_os_write.call_args_list)
+        mock_os_close.assert_called_once_with(7)
+        assert data_writer._fd is None
+
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
     @patch('services.commit_tracker_service.src.data_writer.handle_error')
@@ -347,8 +386,70 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_read_commits_success(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_commits_file_exists')
+    @patch('services.commit_tracker_service.src.data_writer.os.close')
+    @patch('services.commit_tracker_service.src.data_writer.os.write', side_effect=lambda fd, data: len(data))
+    @patch('services.commit_tracker_service.src.data_writer.os.open', return_value=7)
+    @patch('services.commit_tracker_service.src.data_writer.logger')
+    def test_write_commits_success(self, mock_logger, mock_os_open, mock_os_write, mock_os_close, mock_ensure_file, mock_ensure_dir, mock_get_config):
+        """Test write_commits appends the whole batch with one write."""
+        mock_get_config.return_value = self.mock_config
+        
+        commits = [
+            {
+                'id': f'12345678-1234-1234-1234-12345678900{i}',
+                'hash': f'abc123def45{i}',
+                'author': 'Test Author',
+                'message': f'Commit {i}',
+                'timestamp': '2023-01-01T12:00:00+00:00',
+                'changed_files': ['file1.py']
+            }
+            for i in range(3)
+        ]
+        
+        data_writer = DataWriter()
+        result = data_writer.write_commits(commits)
+        
+        mock_ensure_file.assert_called_once()
+        mock_os_open.assert_called_once()
+        mock_os_write.assert_called_once()
+        lines = bytes(mock_os_write.call_args[0][1]).splitlines()
+        assert [json.loads(line) for line in lines] == commits
+        mock_os_close.assert_called_once_with(7)
+        
+        assert result['status'] == 'success'
+        assert result['count'] == 3
+        assert result['file_path'] == str(data_writer.commits_file)
+
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._append')
+    @patch('services.commit_tracker_service.src.data_writer.handle_error')
+    @patch('services.commit_tracker_service.src.data_writer.logger')
+    def test_write_commits_validation_error(self, mock_logger, mock_handle_error, mock_append, mock_ensure_dir, mock_get_config):
+        """Test write_commits writes nothing when one commit is invalid."""
+        mock_get_config.return_value = self.mock_config
+        mock_handle_error.return_value = {'status': 'error', 'error': 'Validation error'}
+        
+        valid_commit = {
+            'id': '12345678-1234-1234-1234-123456789abc',
+            'hash': 'abc123def456',
+            'author': 'Test Author',
+            'message': 'Test commit',
+            'timestamp': '2023-01-01T12:00:00+00:00',
+            'changed_files': []
+        }
+        
+        data_writer = DataWriter()
+        result = data_writer.write_commits([valid_commit, {'hash': 'abc123def456'}])
+        
+        assert result['status'] == 'error'
+        mock_append.assert_not_called()
+        mock_handle_error.assert_called_once()
+
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    def test_read_commits_success(self, mock_ensure_dir, mock_get_config):
         """Test read_commits with successful execution."""
         mock_get_config.return_value = self.mock_config
         
@@ -359,13 +460,12 @@ class TestDataWriter:
             {'id': '3', 'hash': 'ghi789', 'author': 'Author 3', 'message': 'Commit 3'}
         ]
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
         
         # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
             data_writer = DataWriter()
             result = data_writer.read_commits()
         
@@ -392,56 +492,129 @@ class TestDataWriter:
         assert result['commits'] == []
         assert "No commits file found" in result['message']
 
-    @patch('services.commit_tracker_service.src.data_writer.get_config')
-    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_read_commits_with_limit(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
-        """Test read_commits with limit parameter."""
-        mock_get_config.return_value = self.mock_config
+    def test_commits_file_existence_is_remembered(self, tmp_path):
+        """Test the commits file is stat'ed until it is first seen, then not again."""
+        data_writer = DataWriter(str(tmp_path))
         
-        # Mock commits data
-        mock_commits = [
-            {'id': '1', 'hash': 'abc123', 'author': 'Author 1', 'message': 'Commit 1'},
-            {'id': '2', 'hash': 'def456', 'author': 'Author 2', 'message': 'Commit 2'},
-            {'id': '3', 'hash': 'ghi789', 'author': 'Author 3', 'message': 'Commit 3'}
-        ]
+        assert data_writer.read_commits()['commits'] == []
+        data_writer.commits_file.write_text('{"id": "1"}\n')
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        with patch('pathlib.Path.exists', return_value=True) as mock_exists:
+            assert data_writer.get_commit_count()['count'] == 1
+            assert len(data_writer.read_commits()['commits']) == 1
         
-        # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
-            data_writer = DataWriter()
-            result = data_writer.read_commits(limit=2)
+        mock_exists.assert_called_once()
+
+    def test_read_commits_with_limit(self, tmp_path):
+        """Test read_commits with limit returns the newest commits first."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_text(''.join(
+            json.dumps({'id': str(i), 'hash': f'hash{i}', 'message': f'Commit {i}'}) + '\n'
+            for i in range(1, 4)
+        ))
+        
+        data_writer = DataWriter(str(tmp_path))
+        result = data_writer.read_commits(limit=2)
         
         # Verify result
         assert result['status'] == 'success'
         assert len(result['commits']) == 2
-        assert result['commits'][0]['id'] == '2'
-        assert result['commits'][1]['id'] == '1'
+        assert result['commits'][0]['id'] == '3'
+        assert result['commits'][1]['id'] == '2'
 
-    @patch('services.commit_tracker_service.src.data_writer.get_config')
-    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_get_commit_count_success(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_read_commits_with_limit_spans_blocks(self, tmp_path):
+        """Test the tail read joins lines split across read blocks."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_text(''.join(
+            json.dumps({'id': str(i), 'message': 'x' * 40}) + '\n'
+            for i in range(10)
+        ))
+        
+        data_writer = DataWriter(str(tmp_path))
+        with patch('services.commit_tracker_service.src.data_writer._TAIL_CHUNK_SIZE', 16):
+            limited = data_writer.read_commits(limit=4)
+            everything = data_writer.read_commits(limit=50)
+        
+        assert [c['id'] for c in limited['commits']] == ['9', '8', '7', '6']
+        assert [c['id'] for c in everything['commits']] == [str(i) for i in range(9, -1, -1)]
+
+    def test_get_commit_count_success(self, tmp_path):
         """Test get_commit_count with successful execution."""
-        mock_get_config.return_value = self.mock_config
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_text('{"id": "1"}\n{"id": "2"}\n{"id": "3"}\n')
         
-        # Mock jsonlines reader with 3 commits
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = [1, 2, 3]  # Just count iterations
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
-        
-        # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
-            data_writer = DataWriter()
-            result = data_writer.get_commit_count()
+        data_writer = DataWriter(str(tmp_path))
+        result = data_writer.get_commit_count()
         
         assert result['status'] == 'success'
         assert result['count'] == 3
         assert "Total commits: 3" in result['message']
+        assert data_writer.count_file.read_text().split() == [
+            '3', str(commits_file.stat().st_size), data_writer._file_identity(commits_file.stat())
+        ]
+
+    def test_get_commit_count_uses_sidecar(self, tmp_path):
+        """Test get_commit_count only scans bytes appended since the last count."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_text('{"id": "1"}\n{"id": "2"}\n')
+        
+        data_writer = DataWriter(str(tmp_path))
+        assert data_writer.get_commit_count()['count'] == 2
+        
+        # Unchanged file: the sidecar answers without reading the commits file
+        with patch.object(DataWriter, '_count_lines') as mock_count_lines:
+            assert data_writer.get_commit_count()['count'] == 2
+            mock_count_lines.assert_not_called()
+        
+        # Appended records are counted from the previously recorded size
+        counted_size = commits_file.stat().st_size
+        with open(commits_file, 'a') as fh:
+            fh.write('{"id": "3"}\n')
+        with patch.object(DataWriter, '_count_lines', wraps=data_writer._count_lines) as mock_count_lines:
+            assert data_writer.get_commit_count()['count'] == 3
+            mock_count_lines.assert_called_once_with(counted_size)
+        
+        # A shrunken file invalidates the sidecar and is recounted in full
+        commits_file.write_text('{"id": "1"}\n')
+        assert data_writer.get_commit_count()['count'] == 1
+
+    def test_count_lines_across_blocks(self, tmp_path):
+        """Test newline counting across read blocks and from an offset."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_bytes(b'{"id": "1"}\n{"id": "2"}\n{"id": "3"}\n{"id": "4"')
+        
+        data_writer = DataWriter(str(tmp_path))
+        with patch('services.commit_tracker_service.src.data_writer._COUNT_CHUNK_SIZE', 5):
+            # The unterminated last record is not counted until its newline lands
+            assert data_writer._count_lines() == (3, 36)
+            assert data_writer._count_lines(12) == (2, 36)
+
+    @pytest.mark.parametrize("content", [
+        '{"id": "1"}\n\n\n',
+        '\n{"id": "1"}\n',
+        '{"id": "1"}\n  \n\r\n',
+        '  {"id": "1"}\n\t\n'
+    ])
+    def test_count_matches_iter_with_blank_lines(self, tmp_path, content):
+        """Test blank lines are skipped by the count as they are by the readers."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_text(content)
+        
+        data_writer = DataWriter(str(tmp_path))
+        assert len(list(data_writer.iter_commits())) == 1
+        assert len(data_writer.read_commits(limit=10)['commits']) == 1
+        assert data_writer.get_commit_count()['count'] == 1
+        
+        # Appending after blank lines counts only the new record
+        with open(commits_file, 'a') as fh:
+            fh.write('\n{"id": "2"}\n')
+        assert data_writer.get_commit_count()['count'] == 2
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
@@ -460,8 +633,7 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_search_commits_author_match(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_search_commits_author_match(self, mock_ensure_dir, mock_get_config):
         """Test search_commits with author criteria."""
         mock_get_config.return_value = self.mock_config
         
@@ -472,13 +644,12 @@ class TestDataWriter:
             {'id': '3', 'hash': 'ghi789', 'author': 'John Smith', 'author_email': 'johnsmith@example.com', 'message': 'Commit 3'}
         ]
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
         
         # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
             data_writer = DataWriter()
             result = data_writer.search_commits({'author': 'John'})
         
@@ -488,8 +659,7 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_search_commits_message_match(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_search_commits_message_match(self, mock_ensure_dir, mock_get_config):
         """Test search_commits with message criteria."""
         mock_get_config.return_value = self.mock_config
         
@@ -500,13 +670,12 @@ class TestDataWriter:
             {'id': '3', 'hash': 'ghi789', 'author': 'Author 3', 'message': 'Fix another bug'}
         ]
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
         
         # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
             data_writer = DataWriter()
             result = data_writer.search_commits({'message': 'bug'})
         
@@ -516,8 +685,7 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_search_commits_date_range(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_search_commits_date_range(self, mock_ensure_dir, mock_get_config):
         """Test search_commits with date range criteria."""
         mock_get_config.return_value = self.mock_config
         
@@ -528,13 +696,12 @@ class TestDataWriter:
             {'id': '3', 'hash': 'ghi789', 'author': 'Author 3', 'message': 'Commit 3', 'commit_date': '2023-03-01T12:00:00+00:00'}
         ]
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
         
         # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
             data_writer = DataWriter()
             result = data_writer.search_commits({
                 'date_from': '2023-01-15T00:00:00+00:00',
@@ -547,8 +714,7 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_search_commits_files_match(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_search_commits_files_match(self, mock_ensure_dir, mock_get_config):
         """Test search_commits with files criteria."""
         mock_get_config.return_value = self.mock_config
         
@@ -559,13 +725,12 @@ class TestDataWriter:
             {'id': '3', 'hash': 'ghi789', 'author': 'Author 3', 'message': 'Commit 3', 'changed_files': ['src/utils.py', 'src/main.py']}
         ]
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
         
         # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
             data_writer = DataWriter()
             result = data_writer.search_commits({'files': 'main.py'})
         
@@ -575,8 +740,7 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
-    def test_search_commits_multiple_criteria(self, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_search_commits_multiple_criteria(self, mock_ensure_dir, mock_get_config):
         """Test search_commits with multiple criteria."""
         mock_get_config.return_value = self.mock_config
         
@@ -587,13 +751,12 @@ class TestDataWriter:
             {'id': '3', 'hash': 'ghi789', 'author': 'John Smith', 'message': 'Fix another bug', 'commit_date': '2023-03-01T12:00:00+00:00', 'changed_files': ['src/bug.py']}
         ]
         
-        # Mock jsonlines reader
-        mock_reader = MagicMock()
-        mock_reader.__iter__.return_value = mock_commits
-        mock_jsonlines_open.return_value.__enter__.return_value = mock_reader
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
         
         # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
             data_writer = DataWriter()
             result = data_writer.search_commits({
                 'author': 'John',
@@ -606,6 +769,122 @@ class TestDataWriter:
         assert len(result['commits']) == 1
         assert result['commits'][0]['id'] == '1'
 
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    def test_search_commits_with_limit(self, mock_ensure_dir, mock_get_config):
+        """Test search_commits keeps only the most recent matches when limited."""
+        mock_get_config.return_value = self.mock_config
+
+        # Mock commits data
+        mock_commits = [
+            {'id': '1', 'hash': 'abc123', 'author': 'John Doe', 'message': 'Commit 1'},
+            {'id': '2', 'hash': 'def456', 'author': 'Jane Smith', 'message': 'Commit 2'},
+            {'id': '3', 'hash': 'ghi789', 'author': 'John Smith', 'message': 'Commit 3'},
+            {'id': '4', 'hash': 'jkl012', 'author': 'John Roe', 'message': 'Commit 4'}
+        ]
+
+        # Mock raw JSONL file contents
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
+
+        # Mock file exists
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)):
+            data_writer = DataWriter()
+            result = data_writer.search_commits({'author': 'John'}, limit=2)
+
+        assert result['status'] == 'success'
+        assert [commit['id'] for commit in result['commits']] == ['4', '3']
+
+    def test_search_commits_skips_decoding_non_candidates(self, tmp_path):
+        """Test keyword searches only decode lines containing the keywords."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        commits_file.write_text(''.join(json.dumps(commit) + '\n' for commit in [
+            {'id': '1', 'author': 'John Doe', 'message': 'Fix bug'},
+            {'id': '2', 'author': 'Jane Smith', 'message': 'Add feature'},
+            {'id': '3', 'author': 'José Smith', 'message': 'Fix BUG again'},
+            {'id': '4', 'author': 'John Roe', 'message': 'Docs'}
+        ]))
+        
+        data_writer = DataWriter(str(tmp_path))
+        with patch('services.commit_tracker_service.src.data_writer.loads', side_effect=json.loads) as mock_loads, \
+             patch('services.commit_tracker_service.src.data_writer._SCAN_CHUNK_SIZE', 64):
+            result = data_writer.search_commits({'message': 'bug'})
+        
+        assert [commit['id'] for commit in result['commits']] == ['3', '1']
+        assert mock_loads.call_count == 2
+        
+        assert [c['id'] for c in data_writer.search_commits({'author': 'josé'})['commits']] == ['3']
+
+    def test_search_commits_kelvin_sign_is_not_prefiltered(self, tmp_path):
+        """Test keywords still match characters that lowercase to ASCII."""
+        commits_file = tmp_path / 'behaviors' / 'commits.jsonl'
+        commits_file.parent.mkdir(parents=True)
+        # KELVIN SIGN lowercases to 'k' but its JSON text does not contain it
+        commits_file.write_text(json.dumps({'id': '1', 'author': '\u212aim', 'message': 'Commit'}) + '\n')
+        
+        data_writer = DataWriter(str(tmp_path))
+        result = data_writer.search_commits({'author': 'kim'})
+        
+        assert [commit['id'] for commit in result['commits']] == ['1']
+
+    def test_literal_needles(self):
+        """Test only plain ASCII keywords become raw-line prefilters."""
+        assert _literal_needles({'author': 'John', 'message': 'Fix.*bug', 'files': 'Main.py'}) == [b'john']
+        assert _literal_needles({'message': re.compile('bug'), 'files': 'src'}) == [b'src']
+        assert _literal_needles({'author': 'José', 'message': 'say "hi"', 'date_from': '2023-01-01'}) == []
+
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    def test_search_commits_empty_criteria(self, mock_ensure_dir, mock_get_config):
+        """Test search_commits skips the filters when no criteria are set."""
+        mock_get_config.return_value = self.mock_config
+
+        mock_commits = [
+            {'id': '1', 'hash': 'abc123', 'author': 'John Doe', 'message': 'Commit 1'},
+            {'id': '2', 'hash': 'def456', 'author': 'Jane Smith', 'message': 'Commit 2'},
+            {'id': '3', 'hash': 'ghi789', 'author': 'John Smith', 'message': 'Commit 3'}
+        ]
+
+        jsonl_data = ''.join(json.dumps(commit) + '\n' for commit in mock_commits).encode()
+
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)), \
+             patch.object(DataWriter, '_matches_criteria') as mock_matches:
+            data_writer = DataWriter()
+            result = data_writer.search_commits({'author': None, 'message': ''}, limit=2)
+
+        mock_matches.assert_not_called()
+        assert result['status'] == 'success'
+        assert [commit['id'] for commit in result['commits']] == ['3', '2']
+        assert result['message'] == "Found 2 matching commits"
+
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    def test_iter_commits_file_not_exists(self, mock_ensure_dir, mock_get_config):
+        """Test iter_commits yields nothing when file doesn't exist."""
+        mock_get_config.return_value = self.mock_config
+
+        with patch('pathlib.Path.exists', return_value=False):
+            data_writer = DataWriter()
+            assert list(data_writer.iter_commits()) == []
+
+    @patch('services.commit_tracker_service.src.data_writer.get_config')
+    @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
+    def test_iter_commits_reads_raw_lines(self, mock_ensure_dir, mock_get_config):
+        """Test iter_commits decodes each line in file order and skips blank lines."""
+        mock_get_config.return_value = self.mock_config
+
+        jsonl_data = '{"id": "1", "message": "Caf\u00e9"}\n\n{"id": "2"}'.encode()
+
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', mock_open(read_data=jsonl_data)) as mock_file:
+            data_writer = DataWriter()
+            commits = list(data_writer.iter_commits())
+
+        mock_file.assert_called_once_with(data_writer.commits_file, 'rb')
+        assert commits == [{'id': '1', 'message': 'Café'}, {'id': '2'}]
+
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
     def test_search_commits_file_not_exists(self, mock_ensure_dir, mock_get_config):
@@ -623,17 +902,16 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
     @patch('services.commit_tracker_service.src.data_writer.handle_error')
     @patch('services.commit_tracker_service.src.data_writer.logger')
-    def test_read_commits_error(self, mock_logger, mock_handle_error, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_read_commits_error(self, mock_logger, mock_handle_error, mock_ensure_dir, mock_get_config):
         """Test read_commits handles file reading errors."""
         mock_get_config.return_value = self.mock_config
         mock_handle_error.return_value = {'status': 'error', 'error': 'File read error'}
-        mock_jsonlines_open.side_effect = Exception("File read error")
         
-        # Mock file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        # Mock file exists but cannot be read
+        with patch('pathlib.Path.exists', return_value=True), \
+             patch('builtins.open', side_effect=Exception("File read error")):
             data_writer = DataWriter()
             result = data_writer.read_commits()
         
@@ -643,14 +921,14 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
+    @patch('pathlib.Path.stat')
     @patch('services.commit_tracker_service.src.data_writer.handle_error')
     @patch('services.commit_tracker_service.src.data_writer.logger')
-    def test_get_commit_count_error(self, mock_logger, mock_handle_error, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_get_commit_count_error(self, mock_logger, mock_handle_error, mock_stat, mock_ensure_dir, mock_get_config):
         """Test get_commit_count handles file reading errors."""
         mock_get_config.return_value = self.mock_config
         mock_handle_error.return_value = {'status': 'error', 'error': 'File read error'}
-        mock_jsonlines_open.side_effect = Exception("File read error")
+        mock_stat.side_effect = Exception("File read error")
         
         # Mock file exists
         with patch('pathlib.Path.exists', return_value=True):
@@ -663,14 +941,14 @@ class TestDataWriter:
 
     @patch('services.commit_tracker_service.src.data_writer.get_config')
     @patch('services.commit_tracker_service.src.data_writer.DataWriter._ensure_data_store_exists')
-    @patch('services.commit_tracker_service.src.data_writer.jsonlines.open')
+    @patch('builtins.open')
     @patch('services.commit_tracker_service.src.data_writer.handle_error')
     @patch('services.commit_tracker_service.src.data_writer.logger')
-    def test_search_commits_error(self, mock_logger, mock_handle_error, mock_jsonlines_open, mock_ensure_dir, mock_get_config):
+    def test_search_commits_error(self, mock_logger, mock_handle_error, mock_file_open, mock_ensure_dir, mock_get_config):
         """Test search_commits handles file reading errors."""
         mock_get_config.return_value = self.mock_config
         mock_handle_error.return_value = {'status': 'error', 'error': 'File read error'}
-        mock_jsonlines_open.side_effect = Exception("File read error")
+        mock_file_open.side_effect = Exception("File read error")
         
         # Mock file exists
         with patch('pathlib.Path.exists', return_value=True):
@@ -889,6 +1167,21 @@ class TestDataWriter:
         assert data_writer._matches_message_criteria(commit, {'message': 'bug'}) is True
         assert data_writer._matches_message_criteria(commit, {'message': 'feature'}) is False
         
+        # Test regex match (only used when metacharacters are present)
+        assert data_writer._matches_message_criteria(commit, {'message': '^fix .* login'}) is True
+        assert data_writer._matches_message_criteria(commit, {'message': '^bug'}) is False
+        
+        # Test invalid regex falls back to a literal match
+        assert data_writer._matches_message_criteria(commit, {'message': 'bug ('}) is False
+        assert data_writer._matches_message_criteria({'message': 'Fix bug ('}, {'message': 'bug ('}) is True
+        
+        # Test precompiled pattern and prepared criteria
+        assert data_writer._matches_message_criteria(commit, {'message': re.compile('LOGIN$')}) is False
+        assert data_writer._matches_message_criteria(commit, {'message': re.compile('LOGIN', re.IGNORECASE)}) is True
+        predicates = data_writer._compile_criteria({'message': 'Login', 'author': '', 'files': None})
+        assert len(predicates) == 1
+        assert predicates[0](commit) is True
+        
         # Test no criteria
         assert data_writer._matches_message_criteria(commit, {}) is True
 
@@ -916,6 +1209,15 @@ class TestDataWriter:
             'date_from': '2023-07-01T00:00:00+00:00'
         }) is False
         
+        # Stored epoch seconds take precedence over the ISO string
+        assert data_writer._matches_date_criteria({'commit_date': 'invalid-date', 'commit_ts': 1686830400}, {
+            'date_from': '2023-06-15T12:00:00Z',
+            'date_to': '2023-06-15T12:00:00Z'
+        }) is True
+        assert data_writer._matches_date_criteria({'commit_ts': 1686830400}, {
+            'date_to': '2023-06-15T11:59:59+00:00'
+        }) is False
+        
         # Test no criteria
         assert data_writer._matches_date_criteria(commit, {}) is True
 
@@ -935,6 +1237,7 @@ class TestDataWriter:
         # Test files match
         assert data_writer._matches_files_criteria(commit, {'files': 'auth.py'}) is True
         assert data_writer._matches_files_criteria(commit, {'files': 'utils.py'}) is False
+        assert data_writer._matches_files_criteria(commit, {'files': r'^tests/.*\.py$'}) is True
         
         # Test no criteria
         assert data_writer._matches_files_criteria(commit, {}) is True
@@ -985,6 +1288,132 @@ class TestDataWriterIntegration:
             assert search_result['status'] == 'success'
             assert len(search_result['commits']) == 1
 
+    def test_context_manager_appends_to_file(self):
+        """Test commits written inside a with block are on disk after it exits."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_writer = DataWriter(str(Path(temp_dir) / 'data-store'))
+            
+            commits = [
+                {
+                    'id': f'12345678-1234-1234-1234-12345678900{i}',
+                    'hash': f'abc123def45{i}',
+                    'author': 'Test Author',
+                    'message': f'Commit {i}',
+                    'timestamp': '2023-01-01T12:00:00+00:00',
+                    'changed_files': []
+                }
+                for i in range(3)
+            ]
+            
+            with data_writer:
+                for commit in commits:
+                    assert data_writer.write_commit(commit)['status'] == 'success'
+            
+            result = data_writer.read_commits()
+            assert [c['hash'] for c in result['commits']] == ['abc123def452', 'abc123def451', 'abc123def450']
+
+    def _write_numbered_commits(self, data_writer, count):
+        """Write `count` commits alternating between two authors."""
+        commits = [
+            {
+                'id': f'12345678-1234-1234-1234-{i:012d}',
+                'hash': f'{i:040x}',
+                'author': 'Alice' if i % 2 else 'Bob',
+                'message': f'Fix bug {i}' if i % 3 else f'Add feature {i}',
+                'timestamp': '2023-01-01T12:00:00+00:00',
+                'changed_files': [f'src/file{i}.py']
+            }
+            for i in range(count)
+        ]
+        assert data_writer.write_commits(commits)['status'] == 'success'
+        return commits
+
+    @pytest.mark.parametrize("limit", [None, 2])
+    def test_reads_after_commits_file_removed(self, limit):
+        """Test reads report no commits file once a file already seen is removed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_writer = DataWriter(str(Path(temp_dir) / 'data-store'))
+            commits = self._write_numbered_commits(data_writer, 3)
+            assert data_writer.read_commits(limit=limit)['commits']
+
+            data_writer.commits_file.unlink()
+
+            for result in (
+                data_writer.read_commits(limit=limit),
+                data_writer.get_commit_count(),
+                data_writer.search_commits({'author': 'alice'}, limit=limit),
+                data_writer.search_commits({'date_from': '2020-01-01'}, limit=limit)
+            ):
+                assert result['status'] == 'success'
+                assert result['message'] == 'No commits file found'
+            assert list(data_writer.iter_commits()) == []
+
+            # Writing again recreates the file and reads pick it up
+            assert data_writer.write_commit(commits[0])['status'] == 'success'
+            assert data_writer.read_commits(limit=limit)['commits'] == [commits[0]]
+
+    def test_count_after_commits_file_recreated(self):
+        """Test the count sidecar is rebuilt when the commits file is removed and re-created."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_writer = DataWriter(str(Path(temp_dir) / 'data-store'))
+            large = [
+                {'id': f'12345678-1234-1234-1234-{i:012d}', 'hash': f'{i:040x}', 'author': 'Alice',
+                 'message': 'x' * 2000, 'timestamp': '2023-01-01T12:00:00+00:00', 'changed_files': []}
+                for i in range(3)
+            ]
+            assert data_writer.write_commits(large)['status'] == 'success'
+            assert data_writer.get_commit_count()['count'] == 3
+
+            data_writer.commits_file.unlink()
+            self._write_numbered_commits(data_writer, 60)
+
+            assert data_writer.commits_file.stat().st_size > 3 * 2000
+            assert data_writer.get_commit_count()['count'] == 60
+
+    @pytest.mark.parametrize("workers", [1, 2, 3, 7, 40])
+    def test_iter_line_blocks_ranges_partition_lines(self, workers):
+        """Test adjacent byte ranges yield every line exactly once, in order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_writer = DataWriter(str(Path(temp_dir) / 'data-store'))
+            commits = self._write_numbered_commits(data_writer, 100)
+
+            size = data_writer.commits_file.stat().st_size
+            ranges = [(i * size // workers, (i + 1) * size // workers) for i in range(workers)]
+            lines = [
+                line
+                for start, end in ranges
+                for block in data_writer._iter_line_blocks(start, end)
+                for line in block.splitlines()
+            ]
+
+            assert [json.loads(line) for line in lines] == commits
+
+    @pytest.mark.parametrize("search_criteria,limit", [
+        ({'author': 'alice', 'message': 'fix'}, None),
+        ({'author': 'alice', 'message': 'fix'}, 5),
+        ({'message': 'f.*e'}, 3),
+        ({'date_from': '2020-01-01T00:00:00+00:00'}, None)
+    ])
+    def test_search_commits_parallel_matches_serial(self, search_criteria, limit):
+        """Test the worker pool search returns the same commits as the serial scan."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_store_path = str(Path(temp_dir) / 'data-store')
+            data_writer = DataWriter(data_store_path)
+            parallel_writer = DataWriter(data_store_path, parallel_search=True)
+            self._write_numbered_commits(data_writer, 60)
+
+            with patch('services.commit_tracker_service.src.data_writer._PARALLEL_SCAN_MIN_SIZE', 0), \
+                 patch('services.commit_tracker_service.src.data_writer.os.cpu_count', return_value=3):
+                # The pool is only used when the writer opts in
+                assert len(data_writer._scan_ranges()) == 1
+                assert len(parallel_writer._scan_ranges()) == 3
+                serial = data_writer.search_commits(search_criteria, limit=limit)
+                parallel = parallel_writer.search_commits(search_criteria, limit=limit)
+
+            assert parallel['status'] == 'success'
+            assert parallel['commits'] == serial['commits']
+            assert serial['commits']
+
     @pytest.mark.parametrize("search_criteria,expected_matches", [
         ({'author': 'John'}, 2),
         ({'message': 'bug'}, 2),
@@ -4,6 +4,7 @@ Unit tests for services/commit-tracker-service/src/git_parser.py module.
 Tests Git repository parsing functionality.
 """
 
+import subprocess
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -48,20 +49,21 @@ class TestGitParser:
     @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
     def test_get_latest_commit_success(self, mock_run_command):
         """Test get_latest_commit with successful execution."""
-        # Mock the git commands
-        mock_run_command.side_effect = [
-            "abc123def456",  # rev-parse HEAD
-            "abc123def456\nTest Author\ntest@example.com\n2023-01-01T12:00:00+00:00\nTest commit\nTest body",  # show format
-            "file1.py\nfile2.py",  # diff-tree
-            " 2 files changed, 10 insertions(+), 5 deletions(-)"  # diff --stat
-        ]
+        # Mock the single git log call
+        mock_run_command.return_value = (
+            "\x1eabc123def456\x1fTest Author\x1ftest@example.com\x1f2023-01-01T12:00:00+00:00\x1f1672574400"
+            "\x1fTest commit\x1fTest body\n\x1f\n4\t5\tfile1.py\n6\t0\tfile2.py\n"
+        )
         
         result = self.git_parser.get_latest_commit()
         
+        mock_run_command.assert_called_once()
+        assert 'HEAD' in mock_run_command.call_args[0][0]
         assert result is not None
         assert result['hash'] == 'abc123def456'
         assert result['author'] == 'Test Author'
         assert result['author_email'] == 'test@example.com'
+        assert result['commit_ts'] == 1672574400
         assert result['message'] == 'Test commit'
         assert result['body'] == 'Test body'
         assert result['changed_files'] == ['file1.py', 'file2.py']
@@ -83,14 +85,16 @@ class TestGitParser:
     def test_get_commit_by_hash_success(self, mock_run_command, mock_commit_exists):
         """Test get_commit_by_hash with successful execution."""
         mock_commit_exists.return_value = True
-        mock_run_command.side_effect = [
-            "abc123def456\nTest Author\ntest@example.com\n2023-01-01T12:00:00+00:00\nTest commit\nTest body",  # show format
-            "file1.py\nfile2.py",  # diff-tree
-            " 2 files changed, 10 insertions(+), 5 deletions(-)"  # diff --stat
-        ]
+        # Mock the single git log call
+        mock_run_command.return_value = (
+            "\x1eabc123def456\x1fTest Author\x1ftest@example.com\x1f2023-01-01T12:00:00+00:00\x1f1672574400"
+            "\x1fTest commit\x1fTest body\n\x1f\n4\t5\tfile1.py\n6\t0\tfile2.py\n"
+        )
         
         result = self.git_parser.get_commit_by_hash("abc123def456")
         
+        mock_run_command.assert_called_once()
+        assert mock_run_command.call_args[0][0][-1] == 'abc123def456'
         assert result is not None
         assert result['hash'] == 'abc123def456'
         assert result['author'] == 'Test Author'
@@ -123,6 +127,53 @@ class TestGitParser:
         
         assert "Failed to extract commit" in str(exc_info.value)
 
+    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
+    def test_get_commits_since_success(self, mock_run_command):
+        """Test get_commits_since parses every record from one git log call."""
+        mock_run_command.return_value = (
+            "\x1eabc123def456\x1fTest Author\x1ftest@example.com\x1f2023-01-01T12:00:00+00:00\x1f1672574400"
+            "\x1fFirst commit\x1fFirst body\n\x1f\n10\t5\tfile1.py\n-\t-\timage.png\n"
+            "\x1edef456abc123\x1fOther Author\x1fother@example.com\x1f2023-01-02T12:00:00+00:00\x1f1672660800"
+            "\x1fSecond commit\x1f\x1f\n3\t0\tfile2.py\n"
+        )
+        
+        result = self.git_parser.get_commits_since("v1.0")
+        
+        mock_run_command.assert_called_once()
+        assert 'v1.0..HEAD' in mock_run_command.call_args[0][0]
+        assert len(result) == 2
+        assert result[0]['hash'] == 'abc123def456'
+        assert result[0]['author'] == 'Test Author'
+        assert result[0]['author_email'] == 'test@example.com'
+        assert result[0]['commit_date'] == '2023-01-01T12:00:00+00:00'
+        assert result[0]['commit_ts'] == 1672574400
+        assert result[0]['message'] == 'First commit'
+        assert result[0]['body'] == 'First body'
+        assert result[0]['changed_files'] == ['file1.py', 'image.png']
+        assert result[0]['insertions'] == 10
+        assert result[0]['deletions'] == 5
+        assert result[1]['hash'] == 'def456abc123'
+        assert result[1]['body'] == ''
+        assert result[1]['changed_files'] == ['file2.py']
+        assert result[1]['insertions'] == 3
+
+    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
+    def test_get_commits_since_empty(self, mock_run_command):
+        """Test get_commits_since with no new commits."""
+        mock_run_command.return_value = ""
+        
+        assert self.git_parser.get_commits_since("HEAD") == []
+
+    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
+    def test_get_commits_since_git_error(self, mock_run_command):
+        """Test get_commits_since with git command error."""
+        mock_run_command.side_effect = Exception("Git command failed")
+        
+        with pytest.raises(GitCommandError) as exc_info:
+            self.git_parser.get_commits_since("v1.0")
+        
+        assert "Failed to extract commits since v1.0" in str(exc_info.value)
+
     @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
     def test_get_repository_info_success(self, mock_run_command):
         """Test get_repository_info with successful execution."""
@@ -155,24 +206,26 @@ class TestGitParser:
         """Test _run_git_command with successful execution."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "test output"  # String, not bytes
+        mock_result.stdout = "test output \u00e9".encode('utf-8') + b"\xff"  # Raw bytes, decoded by the parser
         mock_run.return_value = mock_result
         
         result = self.git_parser._run_git_command(['rev-parse', 'HEAD'])
         
-        assert result == "test output"
+        assert result == "test output \u00e9\ufffd"
         mock_run.assert_called_once()
+        assert 'text' not in mock_run.call_args.kwargs
 
     @patch('subprocess.run')
     def test_run_git_command_failure(self, mock_run):
         """Test _run_git_command with command failure."""
         from subprocess import CalledProcessError
-        mock_run.side_effect = CalledProcessError(1, ['git', 'invalid', 'command'], stderr="error message")
+        mock_run.side_effect = CalledProcessError(1, ['git', 'invalid', 'command'], stderr=b"error message")
         
         with pytest.raises(GitCommandError) as exc_info:
             self.git_parser._run_git_command(['invalid', 'command'])
         
         assert "Git command failed" in str(exc_info.value)
+        assert "error message" in str(exc_info.value)
 
     @patch('subprocess.run')
     def test_run_git_command_exception(self, mock_run):
@@ -184,127 +237,79 @@ class TestGitParser:
         
         assert "Git command not found" in str(exc_info.value)
 
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_commit_exists_true(self, mock_run_command):
+    @patch('services.commit_tracker_service.src.git_parser.GitParser._batch_check')
+    def test_commit_exists_true(self, mock_batch_check):
         """Test _commit_exists when commit exists."""
-        mock_run_command.return_value = "abc123def456"
+        mock_batch_check.return_value = "commit"
         
         result = self.git_parser._commit_exists("abc123def456")
         assert result is True
 
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_commit_exists_false(self, mock_run_command):
+    @patch('services.commit_tracker_service.src.git_parser.GitParser._batch_check')
+    def test_commit_exists_false(self, mock_batch_check):
         """Test _commit_exists when commit doesn't exist."""
-        mock_run_command.side_effect = GitCommandError("Commit not found")
+        mock_batch_check.return_value = None
         
         result = self.git_parser._commit_exists("nonexistent")
         assert result is False
 
     @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_metadata_success(self, mock_run_command):
-        """Test _get_commit_metadata with successful execution."""
-        mock_run_command.return_value = "abc123def456\nTest Author\ntest@example.com\n2023-01-01T12:00:00+00:00\nTest commit\nTest body"
-        
-        result = self.git_parser._get_commit_metadata("abc123def456")
-        
-        assert result['hash'] == 'abc123def456'
-        assert result['author'] == 'Test Author'
-        assert result['author_email'] == 'test@example.com'
-        assert result['commit_date'] == '2023-01-01T12:00:00+00:00'
-        assert result['message'] == 'Test commit'
-        assert result['body'] == 'Test body'
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_metadata_incomplete_data(self, mock_run_command):
-        """Test _get_commit_metadata with incomplete data."""
-        mock_run_command.return_value = "abc123def456\nTest Author\ntest@example.com\n2023-01-01T12:00:00+00:00\nTest commit"
-        
-        result = self.git_parser._get_commit_metadata("abc123def456")
-        
-        assert result['hash'] == 'abc123def456'
-        assert result['author'] == 'Test Author'
-        assert result['author_email'] == 'test@example.com'
-        assert result['commit_date'] == '2023-01-01T12:00:00+00:00'
-        assert result['message'] == 'Test commit'
-        assert result['body'] == ''  # Should be empty when not provided
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_changed_files_success(self, mock_run_command):
-        """Test _get_changed_files with successful execution."""
-        mock_run_command.return_value = "file1.py\nfile2.py\nfile3.py"
-        
-        result = self.git_parser._get_changed_files("abc123def456")
-        
-        assert result == ['file1.py', 'file2.py', 'file3.py']
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_changed_files_empty(self, mock_run_command):
-        """Test _get_changed_files with no changed files."""
-        mock_run_command.return_value = ""
-        
-        result = self.git_parser._get_changed_files("abc123def456")
-        
-        assert result == []
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_stats_success(self, mock_run_command):
-        """Test _get_commit_stats with successful execution."""
-        mock_run_command.return_value = " 2 files changed, 10 insertions(+), 5 deletions(-)"
-        
-        result = self.git_parser._get_commit_stats("abc123def456")
-        
-        assert result['insertions'] == 10
-        assert result['deletions'] == 5
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_stats_no_changes(self, mock_run_command):
-        """Test _get_commit_stats with no changes."""
-        mock_run_command.return_value = " 0 files changed, 0 insertions(+), 0 deletions(-)"
-        
-        result = self.git_parser._get_commit_stats("abc123def456")
-        
-        assert result['insertions'] == 0
-        assert result['deletions'] == 0
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_stats_only_insertions(self, mock_run_command):
-        """Test _get_commit_stats with only insertions."""
-        mock_run_command.return_value = " 1 file changed, 5 insertions(+)"
-        
-        result = self.git_parser._get_commit_stats("abc123def456")
-        
-        assert result['insertions'] == 5
-        assert result['deletions'] == 0
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_stats_only_deletions(self, mock_run_command):
-        """Test _get_commit_stats with only deletions."""
-        mock_run_command.return_value = " 1 file changed, 3 deletions(-)"
-        
-        result = self.git_parser._get_commit_stats("abc123def456")
-        
-        assert result['insertions'] == 0
-        assert result['deletions'] == 3
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_stats_parse_error(self, mock_run_command):
-        """Test _get_commit_stats with parsing error."""
-        mock_run_command.return_value = "invalid format"
-        
-        result = self.git_parser._get_commit_stats("abc123def456")
-        
-        # Should handle parsing errors gracefully
-        assert result['insertions'] == 0
-        assert result['deletions'] == 0
-
-    @patch('services.commit_tracker_service.src.git_parser.GitParser._run_git_command')
-    def test_get_commit_stats_exception(self, mock_run_command):
-        """Test _get_commit_stats with git command exception."""
-        mock_run_command.side_effect = GitCommandError("Git command failed")
-        
-        result = self.git_parser._get_commit_stats("abc123def456")
-        
-        # Should handle exceptions gracefully
+    @patch('services.commit_tracker_service.src.git_parser.GitParser._batch_check')
+    def test_commit_exists_falls_back_to_cat_file(self, mock_batch_check, mock_run_command):
+        """Test _commit_exists uses a one-off cat-file -e if the batch process fails."""
+        mock_batch_check.side_effect = BrokenPipeError("Broken pipe")
+        mock_run_command.side_effect = ["", GitCommandError("Commit not found")]
+        
+        assert self.git_parser._commit_exists("abc123def456") is True
+        assert self.git_parser._commit_exists("nonexistent") is False
+        mock_run_command.assert_called_with(['cat-file', '-e', 'nonexistent'])
+
+    def test_batch_check_reuses_process(self, tmp_path):
+        """Test object lookups share one git cat-file process."""
+        env_args = ['-c', 'user.name=Test', '-c', 'user.email=test@example.com']
+        subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+        subprocess.run(['git', *env_args, 'commit', '-q', '--allow-empty', '-m', 'Initial'], cwd=tmp_path, check=True)
+        parser = GitParser(tmp_path)
+        
+        try:
+            assert parser._batch_check('HEAD') == 'commit'
+            process = parser._batch_check_process
+            assert parser._commit_exists('HEAD') is True
+            assert parser._commit_exists('0' * 40) is False
+            assert parser._commit_exists('HEAD\nHEAD') is False
+            assert parser._batch_check_process is process
+        finally:
+            parser.close()
+        
+        assert parser._batch_check_process is None
+        assert process.poll() is not None
+
+    def test_parse_log_record_multiline_body(self):
+        """Test _parse_log_record keeps multi-line bodies and binary files."""
+        record = (
+            "abc123def456\x1fTest Author\x1ftest@example.com\x1f2023-01-01T12:00:00+00:00\x1f1672574400"
+            "\x1fTest commit\x1fFirst line\n\nSecond line\n\x1f\n-\t-\timage.png\n7\t2\tsrc/app.py\n"
+        )
+        
+        result = self.git_parser._parse_log_record(record)
+        
+        assert result['body'] == 'First line\n\nSecond line'
+        assert result['changed_files'] == ['image.png', 'src/app.py']
+        assert result['insertions'] == 7
+        assert result['deletions'] == 2
+
+    def test_parse_log_record_no_changes(self):
+        """Test _parse_log_record with a commit that changes no files."""
+        record = (
+            "abc123def456\x1fTest Author\x1ftest@example.com\x1f2023-01-01T12:00:00+00:00\x1f1672574400"
+            "\x1fEmpty commit\x1f\x1f"
+        )
+        
+        result = self.git_parser._parse_log_record(record)
+        
+        assert result['message'] == 'Empty commit'
+        assert result['body'] == ''
+        assert result['changed_files'] == []
         assert result['insertions'] == 0
         assert result['deletions'] == 0
 
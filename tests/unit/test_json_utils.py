@@ -0,0 +1,57 @@
+"""
+Unit tests for shared/utils/json_utils.py module.
+
+Tests that the orjson and json module encoders produce the same bytes.
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+# Import the module under test
+from shared.utils import json_utils
+from shared.utils.json_utils import dumps_bytes, loads
+
+
+SAMPLE = {'author': 'José', 'files': ['a.py', 'b.py'], 'count': 3, 'nested': {'ok': True, 'none': None}}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request):
+    """Run the test with orjson (when installed) and with the json module fallback."""
+    if request.param == 'json':
+        with patch.object(json_utils, 'orjson', None):
+            yield request.param
+    else:
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        yield request.param
+
+
+class TestDumpsBytes:
+    """Test cases for dumps_bytes."""
+
+    def test_compact(self, encoder):
+        """Test compact output with non-ASCII characters left unescaped."""
+        assert dumps_bytes(SAMPLE) == (
+            '{"author":"José","files":["a.py","b.py"],"count":3,"nested":{"ok":true,"none":null}}'
+        ).encode('utf-8')
+
+    def test_indent(self, encoder):
+        """Test indented output matches json.dumps(indent=2)."""
+        assert dumps_bytes(SAMPLE, indent=True) == json.dumps(SAMPLE, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def test_value_orjson_cannot_encode(self, encoder):
+        """Test integers above 64 bits are still encoded."""
+        assert loads(dumps_bytes({'big': 2 ** 70})) == {'big': 2 ** 70}
+
+    def test_unencodable_value(self, encoder):
+        """Test values no encoder supports raise TypeError."""
+        with pytest.raises(TypeError):
+            dumps_bytes({'value': object()})
+
+
+def test_loads_round_trip():
+    """Test loads accepts the bytes dumps_bytes produces."""
+    assert loads(dumps_bytes(SAMPLE)) == SAMPLE
@@ -0,0 +1,236 @@
+"""
+Unit tests for cli/commands/track_commit.py module.
+
+Tests the 'serve' socket server and the client that forwards commands to it.
+"""
+
+import argparse
+import io
+import json
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+# Import the module under test
+from cli.commands import track_commit
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="UNIX sockets required")
+
+
+class TestServeCommands:
+    """Test cases for serve_commands and request_from_server."""
+
+    def setup_method(self):
+        """Create a repository directory and a tracker mock."""
+        # Short path: UNIX socket paths are limited to ~100 bytes
+        self.temp_dir = tempfile.TemporaryDirectory(dir='/tmp')
+        self.repo_path = self.temp_dir.name
+        (Path(self.repo_path) / '.git').mkdir()
+        self.socket_path = Path(self.repo_path) / '.git' / 'craftnudge.sock'
+
+        self.tracker = MagicMock()
+        self.tracker.get_repository_info.return_value = {'status': 'success', 'message': 'info'}
+        self.servers = []
+
+    def teardown_method(self):
+        """Stop the servers started by the test and remove the repository directory."""
+        for server, thread in self.servers:
+            # Shutting the listening socket down makes the blocked accept() fail
+            server.shutdown(socket.SHUT_RDWR)
+            server.close()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        self.temp_dir.cleanup()
+
+    def _start_server(self):
+        """Run serve_commands in a daemon thread and wait until it answers."""
+        listening = []
+
+        def listen(socket_path):
+            server = real_listen(socket_path)
+            listening.append(server)
+            return server
+
+        real_listen = track_commit._listen
+        args = argparse.Namespace(repo_path=self.repo_path, command='serve')
+        with patch('cli.commands.track_commit._listen', side_effect=listen):
+            thread = threading.Thread(target=track_commit.serve_commands, args=(self.tracker, args), daemon=True)
+            thread.start()
+
+            for _ in range(100):
+                if self._request() is not None:
+                    break
+                time.sleep(0.01)
+
+        self.servers.append((listening[0], thread))
+        return thread
+
+    def _request(self, command='info'):
+        """Send a command through request_from_server."""
+        args = argparse.Namespace(repo_path=self.repo_path, command=command, no_cache=True)
+        return track_commit.request_from_server(args)
+
+    @patch('cli.commands.track_commit._SERVER_READ_TIMEOUT', 0.2)
+    def test_second_server_does_not_take_over_socket(self):
+        """Test serve refuses to start while another server answers on the socket."""
+        self._start_server()
+
+        args = argparse.Namespace(repo_path=self.repo_path, command='serve')
+        result = track_commit.serve_commands(self.tracker, args)
+
+        assert result['status'] == 'error'
+        assert "already running" in result['error']
+        assert self._request() == {'status': 'success', 'message': 'info'}
+
+    @patch('cli.commands.track_commit._SERVER_READ_TIMEOUT', 0.2)
+    def test_stale_socket_is_replaced(self):
+        """Test a socket file nobody listens on is removed and reused."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(self.socket_path))
+        stale.close()
+
+        self._start_server()
+
+        assert self._request() == {'status': 'success', 'message': 'info'}
+
+    @patch('cli.commands.track_commit._SERVER_READ_TIMEOUT', 0.2)
+    def test_silent_client_does_not_block_server(self):
+        """Test a client that never sends a request is dropped after the read timeout."""
+        self._start_server()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+            silent.connect(str(self.socket_path))
+
+            assert self._request() == {'status': 'success', 'message': 'info'}
+
+    @patch('cli.commands.track_commit._SERVER_RESPONSE_TIMEOUT', 0.2)
+    def test_unresponsive_server_falls_back(self):
+        """Test the client returns None when the server never answers."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(self.socket_path))
+            server.listen()
+
+            assert self._request() is None
+
+
+class TestTrackLatestCommit:
+    """Test cases for the 'latest' command handler."""
+
+    @patch('cli.utils.cli_helpers.load_cached_result')
+    def test_latest_always_writes(self, mock_load_cached):
+        """Test 'latest' logs the commit on every call instead of reading a cached result."""
+        mock_load_cached.return_value = {'status': 'success', 'message': 'cached'}
+        tracker = MagicMock()
+        tracker.log_latest_commit.return_value = {'status': 'success', 'message': 'logged'}
+        args = argparse.Namespace(no_cache=False)
+
+        for _ in range(2):
+            assert track_commit.track_latest_commit(tracker, args)['message'] == 'logged'
+
+        assert tracker.log_latest_commit.call_count == 2
+        mock_load_cached.assert_not_called()
+
+
+class TestWriteJson:
+    """Test cases for write_json."""
+
+    def test_text_only_stdout(self):
+        """Test JSON is written to a stdout that has no byte buffer."""
+        result = {'status': 'success', 'message': 'Café', 'count': 2}
+
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            track_commit.write_json(result)
+
+        assert json.loads(stdout.getvalue()) == result
+        assert stdout.getvalue().endswith("}\n")
+
+
+class TestDetectCommand:
+    """Test cases for detect_command and the parser it selects."""
+
+    @pytest.mark.parametrize("argv,expected", [
+        ([], ''),
+        (['list'], 'list'),
+        (['--repo-path', '/x', 'list'], 'list'),
+        (['--repo', '/x', 'list', '--limit', '5'], 'list'),
+        (['--output', 'json', 'search'], 'search'),
+        (['--repo-path=/x', 'list'], 'list'),
+        (['--out=json', '-v', '--no', 'hash', 'abc1234'], 'hash'),
+        (['--log-level', 'DEBUG', 'unknown'], ''),
+        (['--unknown', 'list'], None),
+        (['--log', 'DEBUG', 'list'], None)
+    ])
+    def test_detect_command(self, argv, expected):
+        """Test global options, abbreviations and '--opt=value' are skipped over."""
+        assert track_commit.detect_command(argv) == expected
+
+    @pytest.mark.parametrize("argv,command,limit", [
+        (['--repo', '/x', 'list', '--limit', '5'], 'list', 5),
+        (['--output', 'json', 'list', '--limit', '3'], 'list', 3),
+        (['--repo', '/x', 'list'], 'list', 20),
+        (['--repo=/x', 'search', '--limit', '7'], 'search', 7),
+        (['--log', 'DEBUG', 'list'], None, None)
+    ])
+    def test_parse_abbreviated_global_options(self, argv, command, limit):
+        """Test the selected parser accepts abbreviated global options and rejects ambiguous ones."""
+        parser = track_commit.create_argument_parser(track_commit.detect_command(argv))
+
+        if command is None:
+            with pytest.raises(SystemExit):
+                parser.parse_args(argv)
+            return
+
+        args = parser.parse_args(argv)
+        assert args.command == command
+        assert args.limit == limit
+
+
+class TestOutputTableResult:
+    """Test cases for output_table_result."""
+
+    def setup_method(self):
+        """Create a list result."""
+        self.result = {
+            'status': 'success',
+            'message': 'Found 2 commits',
+            'commits': [
+                {'hash': 'abcdef1234567890', 'author': 'Alice', 'message': 'Fix\tbug\n\nBody',
+                 'commit_date': '2024-01-01T10:00:00+00:00', 'changed_files': ['a.py', 'b.py'],
+                 'author_email': 'alice@example.com', 'insertions': 3},
+                {'hash': None, 'author': 'Bob', 'message': 'x' * 60}
+            ]
+        }
+
+    def test_tsv_when_not_a_terminal(self):
+        """Test rows are written as TSV, subject line only, when stdout is not a terminal."""
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            track_commit.output_table_result(self.result, verbose=False)
+
+        assert stdout.getvalue().splitlines() == [
+            'Hash\tAuthor\tMessage\tDate\tFiles',
+            'abcdef12\tAlice\tFix bug\t2024-01-01\t2',
+            f"N/A\tBob\t{'x' * 50}...\tN/A\t0"
+        ]
+
+    def test_tsv_verbose_columns(self):
+        """Test verbose output adds the email and line count columns."""
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            track_commit.output_table_result(self.result, verbose=True)
+
+        lines = stdout.getvalue().splitlines()
+        assert lines[0].split('\t')[5:] == ['Email', 'Insertions', 'Deletions']
+        assert lines[1].split('\t')[5:] == ['alice@example.com', '3', '0']
+
+    @patch('cli.commands.track_commit.output_text_result')
+    def test_non_commit_results_use_text_output(self, mock_output_text):
+        """Test results without commits fall back to the text format."""
+        result = {'status': 'success', 'message': 'No commits found', 'commits': []}
+
+        track_commit.output_table_result(result, verbose=False)
+
+        mock_output_text.assert_called_once_with(result, False)